@@ -0,0 +1,131 @@
+import threading
+import time
+from collections import deque
+
+from telemetry import WAIT_SECONDS, WAIT_TIMEOUTS
+
+
+# 단계별 기본 타임아웃 (초) - 측정값이 충분히 쌓이기 전까지 사용
+DEFAULT_TIMEOUTS = {
+    'page_load': 10.0,      # 제품 페이지 DOM 준비
+    'review_tab': 10.0,     # 리뷰 탭 클릭 후 리뷰 목록 표시
+    'review_list': 8.0,     # 현재 페이지 리뷰 목록 표시
+    'pagination': 5.0,      # 페이지 버튼 표시
+    'page_change': 10.0,    # 페이지 클릭 후 리뷰 목록 변경
+}
+
+# 현재 페이지 첫 번째 리뷰의 텍스트 (한 번의 왕복으로 조회)
+FIRST_REVIEW_SIGNATURE_JS = """
+var item = document.querySelector('#REVIEW ul li');
+return item ? item.innerText.substring(0, 100) : null;
+"""
+
+REVIEW_COUNT_JS = "return document.querySelectorAll('#REVIEW ul li').length;"
+
+
+class AdaptiveWaiter:
+    """고정 sleep 대신 DOM 변화를 감지해 바로 반환하는 대기 엔진
+
+    단계(step)별로 실제 대기 시간을 기록하고, 충분한 표본이 모이면
+    관측된 p95 지연의 배수로 타임아웃을 자동 조정합니다.
+    """
+
+    def __init__(self, timeouts=None, poll_interval=0.1, min_timeout=2.0,
+                 max_timeout=20.0, safety_factor=3.0, window=200, min_samples=5):
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.poll_interval = poll_interval
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.safety_factor = safety_factor
+        self.min_samples = min_samples
+        self._window = window
+        self._latencies = {}
+        self._timeouts_hit = {}
+        self._lock = threading.Lock()
+
+    def _samples(self, step):
+        return self._latencies.setdefault(step, deque(maxlen=self._window))
+
+    def record(self, step, seconds, timed_out=False):
+        """단계별 대기 시간 기록
+
+        타임아웃도 표본에 포함해, 타임아웃이 너무 짧게 조정되면 다시 늘어나도록 합니다.
+        """
+        with self._lock:
+            if timed_out:
+                self._timeouts_hit[step] = self._timeouts_hit.get(step, 0) + 1
+            self._samples(step).append(seconds)
+        WAIT_SECONDS.observe(seconds, step=step)
+        if timed_out:
+            WAIT_TIMEOUTS.inc(step=step)
+
+    def _percentile(self, samples, pct):
+        ordered = sorted(samples)
+        idx = min(len(ordered) - 1, int(len(ordered) * pct))
+        return ordered[idx]
+
+    def timeout_for(self, step):
+        """관측값 기반 타임아웃 (표본이 부족하면 기본값)"""
+        with self._lock:
+            samples = list(self._samples(step))
+        default = self.timeouts.get(step, self.max_timeout)
+        if len(samples) < self.min_samples:
+            return default
+        tuned = self._percentile(samples, 0.95) * self.safety_factor
+        return min(self.max_timeout, max(self.min_timeout, tuned))
+
+    def wait_for(self, driver, step, condition, timeout=None):
+        """condition(driver)이 참이 될 때까지 대기
+
+        반환값: condition의 결과 (타임아웃이면 None)
+        """
+        # selenium은 첫 대기에서 불러옴 (API 서버 시작 시간 단축)
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        if timeout is None:
+            timeout = self.timeout_for(step)
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        except TimeoutException:
+            self.record(step, time.perf_counter() - start, timed_out=True)
+            return None
+        self.record(step, time.perf_counter() - start)
+        return result
+
+    def wait_for_review_change(self, driver, old_signature, step='page_change'):
+        """첫 번째 리뷰가 old_signature와 달라질 때까지 대기 (바뀐 시그니처 반환)"""
+        def changed(d):
+            signature = d.execute_script(FIRST_REVIEW_SIGNATURE_JS)
+            if signature and signature != old_signature:
+                return signature
+            return False
+        return self.wait_for(driver, step, changed)
+
+    def wait_for_reviews(self, driver, step='review_list'):
+        """리뷰 목록에 항목이 표시될 때까지 대기 (항목 수 반환)"""
+        return self.wait_for(driver, step, lambda d: d.execute_script(REVIEW_COUNT_JS) or False)
+
+    def stats(self):
+        """단계별 대기 시간 통계"""
+        result = {}
+        with self._lock:
+            steps = set(self._latencies) | set(self._timeouts_hit)
+            snapshot = {step: list(self._latencies.get(step, ())) for step in steps}
+            timeouts_hit = dict(self._timeouts_hit)
+        for step, samples in snapshot.items():
+            result[step] = {
+                'count': len(samples),
+                'timeouts': timeouts_hit.get(step, 0),
+                'avg': round(sum(samples) / len(samples), 3) if samples else None,
+                'p95': round(self._percentile(samples, 0.95), 3) if samples else None,
+                'timeout': round(self.timeout_for(step), 3),
+            }
+        return result
+
+
+# 프로세스 전체에서 공유하는 기본 대기 엔진 (작업 간 측정값 누적)
+default_waiter = AdaptiveWaiter()
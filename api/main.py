@@ -1,9 +1,25 @@
+import time
+
+# 모듈 로드 시작 시각 (시작 시간 예산 확인용이므로 다른 임포트보다 먼저 측정)
+_BOOT_START = time.perf_counter()
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+import asyncio
 import os
+import sys
 
 from routers import crawler
+from services.crawler_service import crawler_service
+from bs_crwal import resolve_chromedriver_path
+from telemetry import registry
+
+# 임포트부터 startup 이벤트까지 허용 시간 (밀리초), 넘거나 무거운 모듈이 미리 로드되면 경고
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "2000"))
+# 첫 크롤링까지 불러오지 않아야 하는 모듈
+DEFERRED_MODULES = ("selenium", "webdriver_manager", "pandas", "pyarrow", "openpyxl")
+STARTUP_SECONDS = registry.gauge("api_startup_seconds", "모듈 로드부터 startup 이벤트까지 걸린 시간 (초)")
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -47,6 +63,24 @@ async def root():
         "docs": "/docs"
     }
 
+# Prometheus 지표 (단계별 소요 시간, 페이지 처리 시간, 대기열 대기 시간, 실행 중인 브라우저 수 등)
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+def check_startup_budget():
+    """시작 시간과 미리 로드된 무거운 모듈 확인 (scale-from-zero 인스턴스가 바로 /api/health에 응답하도록)"""
+    startup_ms = (time.perf_counter() - _BOOT_START) * 1000
+    app.state.startup_ms = round(startup_ms, 1)
+    STARTUP_SECONDS.set(startup_ms / 1000)
+    loaded = [name for name in DEFERRED_MODULES if name in sys.modules]
+    if loaded:
+        print(f"⚠️  시작 시 무거운 모듈이 로드됨: {', '.join(loaded)} (첫 크롤링까지 미뤄야 함)")
+    if startup_ms > STARTUP_BUDGET_MS:
+        print(f"⚠️  시작 시간 {startup_ms:.0f}ms > 예산 {STARTUP_BUDGET_MS:.0f}ms")
+    else:
+        print(f"⏱️  시작 시간 {startup_ms:.0f}ms (예산 {STARTUP_BUDGET_MS:.0f}ms)")
+
 # 시작 이벤트
 @app.on_event("startup")
 async def startup_event():
@@ -54,10 +88,22 @@ async def startup_event():
     os.makedirs("downloads", exist_ok=True)
     print("🚀 API 서버가 시작되었습니다")
     print("📂 다운로드 디렉토리: downloads/")
+    check_startup_budget()
+    if crawler_service.queue_mode:
+        # 크롤링은 작업자 프로세스(worker.py)가 실행하므로 이 프로세스에서는 Chrome을 준비하지 않음
+        print("📮 작업자 모드: 크롤링 요청을 작업 저장소의 대기열에 넣습니다")
+        return
+    loop = asyncio.get_event_loop()
+    # chromedriver 경로를 미리 찾아 캐시 (첫 작업에서 찾지 않도록, 시작을 막지 않도록 백그라운드에서)
+    loop.run_in_executor(None, resolve_chromedriver_path)
+    # 드라이버 풀 예열 (시작을 막지 않도록 백그라운드에서, 탭 엔진은 첫 작업에서 브라우저 실행)
+    if not crawler_service.tab_engines:
+        loop.run_in_executor(None, crawler_service.driver_pool.warm)
 
 # 종료 이벤트
 @app.on_event("shutdown")
 async def shutdown_event():
+    crawler_service.shutdown()
     print("👋 API 서버를 종료합니다")
 
 
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, HttpUrl, Field, validator
 from typing import Optional, List
+from datetime import datetime
 from enum import Enum
 
 
@@ -9,6 +10,7 @@ class TaskStatusEnum(str, Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class CrawlRequest(BaseModel):
@@ -30,6 +32,21 @@ class CrawlRequest(BaseModel):
         description="수집할 최대 리뷰 개수 (1-1000)",
         example=100
     )
+    use_cache: bool = Field(
+        default=True,
+        description="최근 같은 제품의 수집 결과가 있으면 다시 크롤링하지 않고 사용"
+    )
+    incremental: bool = Field(
+        default=False,
+        description="증분 수집: 최신순으로 이전에 수집한 리뷰가 나올 때까지만 수집하고 기존 데이터와 합침"
+    )
+    deadline_seconds: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=86400,
+        description="요청 시점부터 이 시간(초)이 지나면 수집을 멈추고 그때까지 수집한 리뷰로 끝냄 (기본값: TASK_DEADLINE_SECONDS)",
+        example=300
+    )
 
     @validator('product_url')
     def validate_naver_url(cls, v):
@@ -65,6 +82,52 @@ class TaskStatusResponse(BaseModel):
     message: str
     error: Optional[str] = None
     download_url: Optional[str] = None
+    queue_position: Optional[int] = Field(default=None, description="대기열 순번 (대기 중일 때만)")
+    estimated_start_time: Optional[datetime] = Field(default=None, description="예상 시작 시각 (대기 중일 때만)")
+    estimated_wait_seconds: Optional[int] = Field(default=None, description="예상 대기 시간 (초)")
+    from_cache: bool = Field(default=False, description="최근 수집 결과로 완료된 작업인지")
+
+
+class BatchCrawlRequest(BaseModel):
+    """일괄 크롤링 요청 스키마 (항목마다 크롤링 요청과 같은 필터 사용)"""
+    items: List[CrawlRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="수집할 제품 목록 (1-500개)"
+    )
+    concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="동시에 수집할 제품 수 (기본값: BATCH_CONCURRENCY, 스케줄러의 최대 동시 실행 수를 넘지 않음)"
+    )
+
+
+class BatchCrawlResponse(BaseModel):
+    """일괄 크롤링 응답 스키마"""
+    batch_id: str = Field(..., description="일괄 수집 ID")
+    task_ids: List[str] = Field(..., description="항목 순서대로의 작업 ID")
+    status: TaskStatusEnum = Field(..., description="전체 상태")
+    message: str = Field(..., description="상태 메시지")
+
+
+class BatchStatusResponse(BaseModel):
+    """일괄 수집 상태 조회 응답"""
+    batch_id: str
+    status: TaskStatusEnum
+    total: int = Field(..., description="전체 제품 수")
+    pending: int = Field(..., description="대기 중인 제품 수")
+    processing: int = Field(..., description="수집 중인 제품 수")
+    completed: int = Field(..., description="완료된 제품 수")
+    failed: int = Field(..., description="실패한 제품 수")
+    cancelled: int = Field(default=0, description="취소되었거나 제한 시간을 넘긴 제품 수")
+    progress: int = Field(default=0, ge=0, le=100, description="전체 진행률 (0-100)")
+    collected_count: int = Field(default=0, description="전체 수집된 리뷰 개수")
+    concurrency: int = Field(..., description="동시에 수집하는 제품 수")
+    created_at: Optional[datetime] = None
+    message: str
+    download_url: Optional[str] = Field(default=None, description="통합 결과 파일 주소 (모두 끝났을 때)")
+    items: List[TaskStatusResponse] = Field(..., description="제품별 상태 (download_url은 제품별 결과 파일)")
 
 
 class ReviewData(BaseModel):
@@ -85,3 +148,64 @@ class CrawlResult(BaseModel):
     reviews: List[ReviewData]
     excel_file: Optional[str] = None
     csv_file: Optional[str] = None
+
+
+class DriverPoolStatsResponse(BaseModel):
+    """드라이버 풀 통계 응답"""
+    size: int = Field(..., description="풀 크기 (유지할 유휴 드라이버 수)")
+    max_size: int = Field(default=0, description="동시에 실행할 수 있는 최대 드라이버 수")
+    idle: int = Field(..., description="대기 중인 드라이버 수")
+    in_use: int = Field(..., description="사용 중인 드라이버 수")
+    max_uses: int = Field(..., description="드라이버 교체 전 최대 사용 횟수")
+    hits: int = Field(..., description="풀에서 바로 대여한 횟수")
+    misses: int = Field(..., description="새 드라이버를 실행한 횟수")
+    waits: int = Field(default=0, description="드라이버가 최대 개수여서 반납을 기다린 횟수")
+    hit_rate: float
+    launches: int = Field(..., description="총 드라이버 실행 횟수")
+    recycled: int = Field(..., description="사용 횟수 초과로 교체된 드라이버 수")
+    discarded: int = Field(..., description="오류/헬스체크 실패로 폐기된 드라이버 수")
+    avg_launch_seconds: float = Field(..., description="평균 드라이버 실행 시간 (초)")
+    last_launch_seconds: float = Field(..., description="최근 드라이버 실행 시간 (초)")
+
+
+class TabEngineStatsResponse(BaseModel):
+    """탭 엔진(브라우저 하나) 통계 응답"""
+    max_tabs: int = Field(..., description="브라우저 하나에서 동시에 여는 최대 탭 수")
+    open_tabs: int = Field(..., description="열려 있는 탭 수")
+    pending: int = Field(..., description="실행 중이거나 대기 중인 작업 수")
+    opened: int = Field(..., description="지금까지 연 탭 수")
+    completed: int = Field(..., description="완료된 작업 수")
+    failed: int = Field(..., description="실패한 작업 수")
+    switches: int = Field(..., description="탭 전환 횟수")
+    launches: int = Field(..., description="브라우저 실행 횟수")
+
+
+class SchedulerStatsResponse(BaseModel):
+    """크롤링 스케줄러 통계 응답"""
+    max_concurrent: int = Field(..., description="최대 동시 실행 브라우저 수")
+    running: int = Field(..., description="실행 중인 작업 수")
+    reserved: int = Field(default=0, description="실행 중인 작업이 샤드 수집용으로 예약한 추가 브라우저 슬롯 수")
+    queued: int = Field(..., description="대기 중인 작업 수")
+    completed: int = Field(..., description="완료된 작업 수")
+    available_memory_mb: Optional[float] = Field(None, description="사용 가능한 메모리 (MB)")
+    min_free_memory_mb: int = Field(..., description="새 작업 시작에 필요한 최소 여유 메모리 (MB)")
+    seconds_per_review: float = Field(..., description="리뷰 1개당 예상 소요 시간 (초)")
+
+
+class TaskStoreStatsResponse(BaseModel):
+    """작업 저장소 통계 응답"""
+    path: str = Field(..., description="SQLite 파일 경로")
+    tasks: int = Field(..., description="저장된 작업 수")
+    reviews: int = Field(..., description="저장된 리뷰 수")
+    products: int = Field(..., description="증분 수집 기준 데이터가 있는 제품 수")
+    batches: int = Field(..., description="저장된 일괄 수집 수")
+    queued_jobs: int = Field(..., description="작업자 대기열에서 기다리는 작업 수 (CRAWL_QUEUE=1)")
+    running_jobs: int = Field(..., description="작업자가 실행 중인 작업 수")
+    workers: int = Field(..., description="등록된 작업자 프로세스 수")
+    hot: int = Field(..., description="메모리에 유지 중인 작업 수")
+    hot_size: int = Field(..., description="메모리에 유지할 최대 작업 수")
+    active: int = Field(..., description="이 프로세스에서 실행 중인 작업 수")
+    ttl_seconds: float = Field(..., description="작업 보관 기간 (초)")
+    hits: int = Field(..., description="메모리에서 바로 조회한 횟수")
+    misses: int = Field(..., description="저장소에서 읽어 온 횟수")
+    evicted: int = Field(..., description="보관 기간이 지나 삭제한 작업 수")
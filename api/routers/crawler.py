@@ -1,35 +1,57 @@
 from fastapi import APIRouter, BackgroundTasks, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 import os
+from typing import List
 
 from models.schemas import (
+    BatchCrawlRequest,
+    BatchCrawlResponse,
+    BatchStatusResponse,
     CrawlRequest, 
     CrawlResponse, 
     TaskStatusResponse,
-    TaskStatusEnum
+    TaskStatusEnum,
+    DriverPoolStatsResponse,
+    SchedulerStatsResponse,
+    TabEngineStatsResponse,
+    TaskStoreStatsResponse
 )
-from services.crawler_service import crawler_service
+from services.crawler_service import crawler_service, EXPORT_FORMATS
+from services.task_store import FINISHED_STATUSES
 
 router = APIRouter(prefix="/api", tags=["crawler"])
 
+# 작업 저장소(SQLite)를 조회하는 라우트는 async 없이 정의해 FastAPI 스레드풀에서 실행 (이벤트 루프를 막지 않음)
+
 
 @router.post("/crawl", response_model=CrawlResponse)
-async def start_crawl(request: CrawlRequest, background_tasks: BackgroundTasks):
+def start_crawl(request: CrawlRequest, background_tasks: BackgroundTasks):
     """
     크롤링 작업 시작
     
     - **product_url**: 네이버 브랜드스토어 제품 URL
     - **rating_filter**: 평점 필터 (예: [4, 5]는 4점과 5점만)
     - **max_reviews**: 수집할 최대 리뷰 개수 (1-1000)
+    - **use_cache**: 최근 같은 제품의 수집 결과 사용 여부 (기본값: true)
+    - **incremental**: 증분 수집 여부 (기본값: false)
+    - **deadline_seconds**: 제한 시간 (초), 지나면 그때까지 수집한 리뷰로 끝냄 (기본값: 서버 설정)
     """
     try:
         # 작업 생성
         task_id = crawler_service.create_task(
             product_url=request.product_url,
             rating_filter=request.rating_filter,
-            max_reviews=request.max_reviews
+            max_reviews=request.max_reviews,
+            use_cache=request.use_cache,
+            incremental=request.incremental,
+            deadline_seconds=request.deadline_seconds
         )
         
+        task = crawler_service.get_task(task_id)
+        if task.status != TaskStatusEnum.PENDING:
+            # 최근 수집 결과로 바로 완료됨
+            return CrawlResponse(task_id=task_id, status=task.status, message=task.message)
+        
         # 백그라운드에서 크롤링 실행
         background_tasks.add_task(crawler_service.run_crawler, task_id)
         
@@ -48,7 +70,7 @@ async def start_crawl(request: CrawlRequest, background_tasks: BackgroundTasks):
 
 
 @router.get("/status/{task_id}", response_model=TaskStatusResponse)
-async def get_status(task_id: str):
+def get_status(task_id: str):
     """
     작업 진행 상태 조회
     
@@ -58,33 +80,82 @@ async def get_status(task_id: str):
     return TaskStatusResponse(**status)
 
 
+@router.delete("/tasks/{task_id}", response_model=TaskStatusResponse)
+def cancel_task(task_id: str):
+    """
+    작업 취소
+    
+    - **task_id**: 작업 ID
+    
+    대기 중인 작업은 바로 취소되고, 수집 중인 작업은 현재 페이지까지 수집한 뒤 멈춥니다.
+    멈추기 전에 수집한 리뷰는 상태가 `cancelled`가 된 뒤 download_url로 받을 수 있습니다.
+    """
+    task = crawler_service.get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    if task.status in FINISHED_STATUSES:
+        raise HTTPException(status_code=409, detail="이미 끝난 작업입니다")
+    
+    return TaskStatusResponse(**crawler_service.cancel_task(task_id))
+
+
+@router.get("/tasks/{task_id}/events")
+def stream_task_events(task_id: str, reviews: bool = False):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+    
+    - **task_id**: 작업 ID
+    - **reviews**: true면 새로 수집한 리뷰도 `reviews` 이벤트로 전송
+    
+    크롤러가 단계를 바꾸거나 페이지를 처리할 때마다 `status` 이벤트를 보내고,
+    작업이 완료/실패/취소되면 마지막 상태를 보낸 뒤 연결을 닫습니다.
+    """
+    if not crawler_service.get_task(task_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    return StreamingResponse(
+        crawler_service.stream_events(task_id, include_reviews=reviews),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/download/{task_id}")
-async def download_file(task_id: str, format: str = "excel"):
+def download_file(task_id: str, format: str = "excel"):
     """
     결과 파일 다운로드
     
     - **task_id**: 작업 ID
-    - **format**: 파일 형식 (excel 또는 csv)
+    - **format**: 파일 형식 (excel, csv, jsonl, parquet)
+    
+    각 형식은 처음 요청될 때 생성되고 이후 요청에는 만들어 둔 파일을 반환합니다.
+    취소되었거나 제한 시간이 지난 작업은 멈추기 전에 수집한 리뷰를 받습니다.
     """
     task = crawler_service.get_task(task_id)
     
     if not task:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
     
-    if task.status != TaskStatusEnum.COMPLETED:
+    if not crawler_service.has_results(task):
         raise HTTPException(status_code=400, detail="작업이 완료되지 않았습니다")
     
-    # 파일 선택
-    if format.lower() == "csv":
-        file_path = task.csv_file
-        media_type = "text/csv"
-    else:
-        file_path = task.excel_file
-        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    format = format.lower()
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 형식입니다 (가능한 형식: {', '.join(EXPORT_FORMATS)})"
+        )
+    
+    try:
+        export = crawler_service.get_export(task_id, format)
+    except ImportError:
+        raise HTTPException(status_code=501, detail=f"{format} 형식에 필요한 패키지가 설치되어 있지 않습니다")
     
-    if not file_path or not os.path.exists(file_path):
+    if not export or not export[0] or not os.path.exists(export[0]):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
     
+    file_path, media_type = export
     filename = os.path.basename(file_path)
     
     return FileResponse(
@@ -94,6 +165,106 @@ async def download_file(task_id: str, format: str = "excel"):
     )
 
 
+@router.post("/batch", response_model=BatchCrawlResponse)
+def start_batch(request: BatchCrawlRequest, background_tasks: BackgroundTasks):
+    """
+    여러 제품 일괄 크롤링 시작
+    
+    - **items**: 크롤링 요청 목록 (항목마다 product_url, rating_filter, max_reviews, use_cache, incremental,
+      deadline_seconds)
+    - **concurrency**: 동시에 수집할 제품 수 (기본값: 서버 설정)
+    
+    작업은 드라이버 풀과 대기열을 다른 요청과 공유하며, 최근 수집 결과가 있는 제품은 바로 완료됩니다.
+    """
+    batch_id = crawler_service.create_batch(
+        [item.dict() for item in request.items], concurrency=request.concurrency
+    )
+    status = crawler_service.get_batch_status(batch_id)
+    if status["status"] not in FINISHED_STATUSES:
+        background_tasks.add_task(crawler_service.run_batch, batch_id)
+    
+    return BatchCrawlResponse(
+        batch_id=batch_id,
+        task_ids=[item["task_id"] for item in status["items"]],
+        status=status["status"],
+        message=f"{status['total']}개 제품의 일괄 크롤링이 시작되었습니다"
+        if status["status"] == TaskStatusEnum.PENDING else status["message"]
+    )
+
+
+@router.get("/batch/{batch_id}", response_model=BatchStatusResponse)
+def get_batch_status(batch_id: str):
+    """
+    일괄 수집 진행 상태 조회 (전체 진행률과 제품별 상태)
+    
+    - **batch_id**: 일괄 수집 ID
+    """
+    status = crawler_service.get_batch_status(batch_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="일괄 수집을 찾을 수 없습니다")
+    return BatchStatusResponse(**status)
+
+
+@router.get("/batch/{batch_id}/download")
+def download_batch_file(batch_id: str, format: str = "excel"):
+    """
+    일괄 수집 통합 결과 파일 다운로드 (완료된 제품의 리뷰를 제품 URL 열과 함께 한 파일로)
+    
+    - **batch_id**: 일괄 수집 ID
+    - **format**: 파일 형식 (excel, csv, jsonl, parquet)
+    
+    제품별 파일은 상태 조회 응답의 items[].download_url로 받을 수 있습니다.
+    """
+    status = crawler_service.get_batch_status(batch_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="일괄 수집을 찾을 수 없습니다")
+    
+    if status["status"] != TaskStatusEnum.COMPLETED:
+        raise HTTPException(status_code=400, detail="일괄 수집이 완료되지 않았습니다")
+    
+    format = format.lower()
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 형식입니다 (가능한 형식: {', '.join(EXPORT_FORMATS)})"
+        )
+    
+    try:
+        export = crawler_service.get_batch_export(batch_id, format)
+    except ImportError:
+        raise HTTPException(status_code=501, detail=f"{format} 형식에 필요한 패키지가 설치되어 있지 않습니다")
+    
+    if not export or not export[0] or not os.path.exists(export[0]):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+    
+    file_path, media_type = export
+    return FileResponse(path=file_path, media_type=media_type, filename=os.path.basename(file_path))
+
+
+@router.get("/pool", response_model=DriverPoolStatsResponse)
+async def get_pool_stats():
+    """Chrome 드라이버 풀 상태 조회"""
+    return DriverPoolStatsResponse(**crawler_service.get_pool_stats())
+
+
+@router.get("/tabs", response_model=List[TabEngineStatsResponse])
+async def get_tab_stats():
+    """탭 엔진 상태 조회 (CRAWL_ENGINE=tabs일 때 브라우저별, 아니면 빈 목록)"""
+    return [TabEngineStatsResponse(**stats) for stats in crawler_service.get_tab_stats()]
+
+
+@router.get("/scheduler", response_model=SchedulerStatsResponse)
+async def get_scheduler_stats():
+    """크롤링 스케줄러(동시 실행 제한/대기열) 상태 조회"""
+    return SchedulerStatsResponse(**crawler_service.get_scheduler_stats())
+
+
+@router.get("/store", response_model=TaskStoreStatsResponse)
+def get_store_stats():
+    """작업 저장소(SQLite) 상태 조회"""
+    return TaskStoreStatsResponse(**crawler_service.get_store_stats())
+
+
 @router.get("/health")
 async def health_check():
     """헬스 체크"""
@@ -1,157 +1,678 @@
 import asyncio
 import uuid
 import os
-from typing import Dict, Optional, List
+from typing import Optional, List
 from datetime import datetime
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 # 상위 디렉토리의 크롤러 임포트
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from bs_crwal import NaverSmartStoreReviewCrawler
+from bs_crwal import NaverSmartStoreReviewCrawler, build_chrome_options, create_chrome_driver
+from network_policy import NetworkPolicy
+from review_dedup import BloomFilter, HashSet, ReviewDeduper
+from review_sink import BATCH_COLUMNS, write_csv, write_excel, write_jsonl, write_parquet
+from tab_engine import TabEngine
+from telemetry import BROWSERS, SCHEDULED_TASKS, TASK_REVIEWS_PER_SECOND, TASK_SECONDS, TASKS, span
 
 from models.schemas import TaskStatusEnum
+from services.driver_pool import DriverPool
+from services.scheduler import CrawlScheduler
+from services.task_events import TaskEventBus, format_sse
+from services.task_store import CrawlerTask, TaskStore, FINISHED_STATUSES
 
 
-class CrawlerTask:
-    """크롤링 작업 정보"""
-    def __init__(self, task_id: str, product_url: str, rating_filter: Optional[List[int]], max_reviews: int):
-        self.task_id = task_id
-        self.product_url = product_url
-        self.rating_filter = rating_filter
-        self.max_reviews = max_reviews
-        self.status = TaskStatusEnum.PENDING
-        self.progress = 0
-        self.collected_count = 0
-        self.message = "작업 대기 중"
-        self.error: Optional[str] = None
-        self.excel_file: Optional[str] = None
-        self.csv_file: Optional[str] = None
-        self.reviews = []
+# 크롤러 단계 이벤트별 진행률과 메시지
+PHASE_PROGRESS = {
+    "driver": (5, "Chrome 드라이버 초기화 중..."),
+    "product": (10, "제품 페이지 로딩 중..."),
+    "review_tab": (15, "리뷰 탭으로 이동 중..."),
+    "collecting": (20, "리뷰 수집 중..."),
+}
+
+# 페이지 그룹(10페이지)당 리뷰 수 (페이지당 20개)
+REVIEWS_PER_PAGE_GROUP = 200
+
+# 다운로드 형식별 (확장자, MIME 타입, 저장 함수)
+EXPORT_FORMATS = {
+    "excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", write_excel),
+    "csv": ("csv", "text/csv", write_csv),
+    "jsonl": ("jsonl", "application/x-ndjson", write_jsonl),
+    "parquet": ("parquet", "application/vnd.apache.parquet", write_parquet),
+}
 
 
 class CrawlerService:
     """크롤러 서비스 - 비동기 작업 관리"""
     
     def __init__(self):
-        self.tasks: Dict[str, CrawlerTask] = {}
         self.output_dir = "downloads"
         os.makedirs(self.output_dir, exist_ok=True)
+        # 작업 정보와 리뷰 저장소 (여러 워커가 같은 파일을 공유)
+        self.store = TaskStore(
+            os.getenv("TASK_DB_PATH", f"{self.output_dir}/tasks.db"),
+            ttl_seconds=float(os.getenv("TASK_TTL_HOURS", "24")) * 3600,
+            hot_size=int(os.getenv("TASK_CACHE_SIZE", "256")),
+            product_ttl_seconds=float(os.getenv("PRODUCT_HISTORY_DAYS", "30")) * 86400
+        )
+        # 같은 제품을 이 시간 안에 수집한 결과가 있으면 다시 크롤링하지 않음 (0이면 사용 안 함)
+        self.result_cache_seconds = float(os.getenv("RESULT_CACHE_TTL_MINUTES", "30")) * 60
+        # 제품별 Bloom 필터 디렉토리 (지정하면 증분 수집 시 DB의 리뷰 키 대신 사용)
+        self.bloom_dir = os.getenv("DEDUP_BLOOM_DIR", "")
+        self.bloom_capacity = int(os.getenv("DEDUP_BLOOM_CAPACITY", "100000"))
+        self.bloom_error_rate = float(os.getenv("DEDUP_BLOOM_ERROR_RATE", "0.001"))
+        # 작업 진행 이벤트 (SSE 구독자에게 전달)
+        self.events = TaskEventBus()
+        # 내보내기 잠금 (같은 작업의 같은 형식을 동시에 두 번 생성하지 않도록, 작업 ID 해시로 분산)
+        self._export_locks = [threading.Lock() for _ in range(16)]
+        # 수집 엔진 ('dom', 'api', 'tabs'), 'api'면 요청 캡처를 위해 네트워크 로그를 켠 드라이버 사용
+        self.engine = os.getenv("CRAWL_ENGINE", "dom")
+        # 리뷰에 필요 없는 요청 차단 (CDP), NETWORK_STATS=1이면 페이지별 요청 수/전송량 집계 (성능 로그 사용)
+        self.network_policy = NetworkPolicy.from_env()
+        self.network_stats = os.getenv("NETWORK_STATS", "0") == "1"
+        # Chrome 옵션은 드라이버를 실행할 때 만듦 (selenium을 첫 실행까지 불러오지 않도록)
+        network_log = self.engine == "api" or self.network_stats
+        max_browsers = int(os.getenv("MAX_CONCURRENT_BROWSERS", "2"))
+        # 풀의 드라이버(유휴 + 사용 중)는 MAX_CONCURRENT_BROWSERS개까지만 실행 (샤드 드라이버 포함)
+        self.driver_pool = DriverPool(
+            size=int(os.getenv("DRIVER_POOL_SIZE", "1")),
+            max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", "20")),
+            factory=lambda: create_chrome_driver(build_chrome_options(network_log=network_log)),
+            max_size=max_browsers,
+            checkout_timeout=float(os.getenv("DRIVER_POOL_TIMEOUT", "300")) or None
+        )
+        max_concurrent = max_browsers
+        # 'tabs' 엔진은 Chrome 하나에서 여러 작업을 탭으로 실행 (브라우저 수 x 탭 수만큼 동시 실행)
+        self.tab_engines = []
+        if self.engine == "tabs":
+            tabs_per_browser = int(os.getenv("TABS_PER_BROWSER", "4"))
+            tab_network_log = self.network_stats
+            self.tab_engines = [
+                TabEngine(
+                    driver_factory=lambda: create_chrome_driver(
+                        build_chrome_options(network_log=tab_network_log, background_tabs=True)),
+                    max_tabs=tabs_per_browser
+                )
+                for _ in range(max_browsers)
+            ]
+            max_concurrent = max_browsers * tabs_per_browser
+        self.scheduler = CrawlScheduler(
+            max_concurrent=max_concurrent,
+            min_free_memory_mb=int(os.getenv("MIN_FREE_MEMORY_MB", "400"))
+        )
+        # 일괄 수집 하나에서 동시에 실행할 작업 수 기본값 (스케줄러의 동시 실행 수를 넘지 않음)
+        self.batch_concurrency = int(os.getenv("BATCH_CONCURRENCY") or max_concurrent)
+        # 한 작업의 페이지 그룹을 나눠 수집할 최대 드라이버 수 ('dom' 엔진, 1이면 순차 수집)
+        self.crawl_shards = int(os.getenv("CRAWL_SHARDS", "1"))
+        # 평점 필터를 리뷰 위젯의 평점 필터/평점순 정렬로 먼저 적용 (0이면 모든 페이지를 읽고 거름)
+        self.rating_pushdown = os.getenv("RATING_PUSHDOWN", "1") != "0"
+        # 작업자 모드: API 서버는 작업을 저장소의 대기열에 넣기만 하고 별도 작업자 프로세스(worker.py)가 실행
+        self.queue_mode = os.getenv("CRAWL_QUEUE", "0") == "1"
+        # 이 시간 동안 heartbeat가 없는 작업자의 작업은 다른 작업자가 다시 실행
+        self.worker_timeout = float(os.getenv("WORKER_HEARTBEAT_TIMEOUT", "60"))
+        # 요청에 deadline_seconds가 없을 때 쓰는 작업 제한 시간 (0이면 제한 없음)
+        self.default_deadline_seconds = float(os.getenv("TASK_DEADLINE_SECONDS", "0"))
+        # 취소/제한 시간 초과 후 이 시간 안에 페이지 사이에 도달하지 못하면 드라이버를 강제 종료 (0이면 기다림)
+        self.cancel_grace_seconds = float(os.getenv("CANCEL_GRACE_SECONDS", "10"))
+        # 이 프로세스에서 실행 중인 크롤러와 취소 후 드라이버 강제 종료 타이머 (작업 ID → 값)
+        self._crawlers = {}
+        self._abort_timers = {}
+        self._crawlers_lock = threading.Lock()
+        self._register_gauges()
+        # 리뷰 추출 방식 ('script' 또는 'html'), 'html'이면 파싱을 별도 프로세스에서 실행
+        self.extract_mode = os.getenv("EXTRACT_MODE", "script")
+        self.parse_executor = None
+        if self.extract_mode == "html":
+            self.parse_executor = ProcessPoolExecutor(
+                max_workers=int(os.getenv("PARSER_PROCESSES", "1"))
+            )
+    
+    def _register_gauges(self):
+        """실행 중인 브라우저/작업 수를 /metrics 조회 시점에 계산"""
+        BROWSERS.set_function(lambda: self.driver_pool.stats()["idle"], state="idle")
+        BROWSERS.set_function(lambda: self.driver_pool.stats()["in_use"], state="in_use")
+        BROWSERS.set_function(lambda: sum(1 for e in self.tab_engines if e.driver is not None), state="tabs")
+        SCHEDULED_TASKS.set_function(lambda: self.scheduler.stats()["running"], state="running")
+        SCHEDULED_TASKS.set_function(lambda: self.scheduler.stats()["queued"], state="queued")
     
-    def create_task(self, product_url: str, rating_filter: Optional[List[int]], max_reviews: int) -> str:
-        """새 크롤링 작업 생성"""
+    def create_task(self, product_url: str, rating_filter: Optional[List[int]], max_reviews: int,
+                    use_cache: bool = True, incremental: bool = False,
+                    deadline_seconds: Optional[float] = None) -> str:
+        """새 크롤링 작업 생성
+        
+        최근에 같은 제품을 수집한 결과로 요청을 채울 수 있으면 (더 넓은 평점 필터, 더 많은 max_reviews)
+        크롤링 없이 그 리뷰를 걸러서 바로 완료합니다. 증분 수집 요청은 항상 새로 수집합니다.
+        deadline_seconds는 지금부터 잰 제한 시간이며 (대기열에서 기다린 시간 포함), 지나면 그때까지 수집한
+        리뷰로 작업을 끝냅니다.
+        """
+        # 보관 기간이 지난 작업 정리 (일정 간격마다 한 번만 실행)
+        self.store.evict_expired()
         task_id = str(uuid.uuid4())
-        task = CrawlerTask(task_id, product_url, rating_filter, max_reviews)
-        self.tasks[task_id] = task
+        task = CrawlerTask(task_id, product_url, rating_filter, max_reviews, incremental=incremental,
+                           deadline_seconds=deadline_seconds or self.default_deadline_seconds or None)
+        self.store.add(task)
+        
+        if use_cache and not incremental and self.result_cache_seconds > 0:
+            source_task_id = self.store.find_cached_result(
+                task.product_key, rating_filter, max_reviews, self.result_cache_seconds
+            )
+            if source_task_id:
+                self._complete_from_cache(task, source_task_id)
         return task_id
     
+    def _complete_from_cache(self, task: CrawlerTask, source_task_id: str):
+        """캐시된 작업의 리뷰를 복사해 작업 완료 처리"""
+        count = self.store.copy_reviews(source_task_id, task.task_id, task.rating_filter, task.max_reviews)
+        source = self.store.get(source_task_id)
+        task.source_task_id = source_task_id
+        task.collected_count = count
+        # 원본이 전체 결과이고 목표보다 적게 복사했으면 이 작업도 전체 결과
+        task.exhaustive = bool(source and source.exhaustive) and count < task.max_reviews
+        task.finished_at = datetime.now()
+        task.progress = 100
+        if count:
+            task.status = TaskStatusEnum.COMPLETED
+            task.message = f"크롤링 완료! {count}개 리뷰 수집 (최근 수집 결과 사용)"
+        else:
+            task.status = TaskStatusEnum.FAILED
+            task.message = "조건에 맞는 리뷰를 찾지 못했습니다"
+        self.store.save(task)
+    
     def get_task(self, task_id: str) -> Optional[CrawlerTask]:
         """작업 정보 조회"""
-        return self.tasks.get(task_id)
+        return self.store.get(task_id)
+    
+    @staticmethod
+    def has_results(task: CrawlerTask) -> bool:
+        """결과 파일을 받을 수 있는 작업인지 (완료, 또는 취소/제한 시간 초과 전에 수집한 리뷰가 있음)"""
+        return task.status == TaskStatusEnum.COMPLETED or (
+            task.status == TaskStatusEnum.CANCELLED and task.collected_count > 0
+        )
+    
+    def cancel_task(self, task_id: str) -> Optional[dict]:
+        """작업 취소 후 상태 반환 (작업이 없으면 None, 이미 끝난 작업은 그대로)
+        
+        대기 중인 작업은 대기열에서 빼고 바로 취소 처리합니다. 실행 중인 작업은 취소 요청을 기록하며,
+        크롤러가 페이지 사이에서 멈추고 그때까지 수집한 리뷰를 결과로 남깁니다.
+        취소 요청은 저장소에도 기록하므로 다른 워커나 작업자 프로세스가 실행 중인 작업도
+        다음 진행 상태 저장(또는 작업자 heartbeat) 때 멈춥니다.
+        """
+        task = self.store.get(task_id)
+        if not task:
+            return None
+        if task.status in FINISHED_STATUSES:
+            return self.get_task_status(task_id)
+        
+        self.store.request_cancel(task_id)
+        task.cancel_requested = True
+        dequeued = False
+        if task.status == TaskStatusEnum.PENDING:
+            # 대기열에 있거나 아직 넣기 전이면 바로 취소 (이미 시작했으면 실행 중인 쪽에서 멈춤)
+            if self.queue_mode:
+                dequeued = self.store.cancel_queued_job(task_id) or self.store.job_status(task_id) is None
+            else:
+                dequeued = self.scheduler.cancel(task_id) or not self.scheduler.is_running(task_id)
+        if dequeued:
+            self._mark_stopped(task, "cancelled", 0)
+            self._publish_status(task)
+            TASKS.inc(status=task.status.value)
+        else:
+            self.stop_running(task_id, "cancelled")
+        return self.get_task_status(task_id)
+    
+    def stop_running(self, task_id: str, reason: str):
+        """이 프로세스에서 실행 중인 작업에 중단 요청 (실행 중이 아니면 무시)
+        
+        크롤러는 페이지 사이에서 멈추며, cancel_grace_seconds 안에 끝나지 않으면 드라이버를 강제 종료합니다.
+        """
+        with self._crawlers_lock:
+            crawler = self._crawlers.get(task_id)
+            if crawler is None or task_id in self._abort_timers:
+                return
+            crawler.request_stop(reason)
+            self._abort_timers[task_id] = self._schedule_abort(task_id, crawler, reason, self.cancel_grace_seconds)
+    
+    def _schedule_abort(self, task_id: str, crawler: NaverSmartStoreReviewCrawler, reason: str,
+                        delay: float) -> Optional[threading.Timer]:
+        """delay초 뒤에도 크롤러가 실행 중이면 드라이버 강제 종료 (페이지 로딩이 멈춘 경우 등)
+        
+        탭 엔진의 브라우저는 다른 작업과 공유하므로 강제 종료하지 않습니다.
+        """
+        if self.tab_engines or self.cancel_grace_seconds <= 0:
+            return None
+        timer = threading.Timer(max(delay, 0), self._abort_crawler, args=(task_id, crawler, reason))
+        timer.daemon = True
+        timer.start()
+        return timer
+    
+    def _abort_crawler(self, task_id: str, crawler: NaverSmartStoreReviewCrawler, reason: str):
+        with self._crawlers_lock:
+            if self._crawlers.get(task_id) is not crawler:
+                # 이미 끝난 작업
+                return
+        crawler.request_stop(reason)
+        print(f"⚠️  {task_id}: {self.cancel_grace_seconds:.0f}초 안에 멈추지 않아 드라이버를 종료합니다")
+        crawler.abort()
+    
+    def _stop_reason(self, task: CrawlerTask) -> Optional[str]:
+        """작업을 멈춰야 하는 이유 ('cancelled', 'deadline', 없으면 None)
+        
+        크롤러가 페이지 사이마다 호출하므로 메모리의 값만 확인합니다 (다른 프로세스의 취소 요청은
+        진행 상태를 저장할 때 task.cancel_requested에 반영됨).
+        """
+        if task.cancel_requested:
+            return "cancelled"
+        if task.deadline_at and datetime.now() >= task.deadline_at:
+            return "deadline"
+        return None
+    
+    def _mark_stopped(self, task: CrawlerTask, reason: str, count: int):
+        """취소되었거나 제한 시간이 지난 작업 마무리 (그때까지 수집한 리뷰는 결과로 남김)"""
+        label = "작업 취소" if reason == "cancelled" else "제한 시간 초과"
+        task.status = TaskStatusEnum.CANCELLED
+        task.collected_count = count
+        task.progress = 100
+        task.finished_at = datetime.now()
+        task.message = f"{label}: {count}개 리뷰 수집 후 중단" if count else f"{label}: 수집한 리뷰 없음"
     
     async def run_crawler(self, task_id: str):
         """크롤러 실행 (비동기)"""
-        task = self.tasks.get(task_id)
-        if not task:
+        # 저장소(SQLite) 접근은 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+        task = await asyncio.to_thread(self.store.get, task_id)
+        if not task or task.status in FINISHED_STATUSES:
+            # 캐시된 결과로 이미 완료된 작업
+            return
+        
+        if self.queue_mode:
+            # 작업자 프로세스가 대기열에서 가져가 실행 (진행 상태는 저장소로 공유)
+            task.message = "작업자 대기열에서 실행 순서를 기다리는 중"
+            await asyncio.to_thread(self.store.enqueue_job, task)
             return
         
         try:
-            task.status = TaskStatusEnum.PROCESSING
-            task.message = "크롤링 시작"
+            task.message = "대기열에서 실행 순서를 기다리는 중"
+            await asyncio.to_thread(self.store.save, task)
             
-            # 동기 크롤러를 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._run_sync_crawler, task)
+            # 스케줄러 대기열에 넣고 순서가 되면 별도 스레드에서 실행
+            await self.scheduler.submit(
+                task.task_id, task.max_reviews, lambda: self._run_sync_crawler(task)
+            )
             
         except Exception as e:
             task.status = TaskStatusEnum.FAILED
             task.error = str(e)
             task.message = f"크롤링 실패: {str(e)}"
+            await asyncio.to_thread(self._publish_status, task)
+    
+    def _publish_status(self, task: CrawlerTask):
+        """현재 작업 상태를 저장하고 구독자에게 전달"""
+        self.store.save(task)
+        if self.events.has_subscribers(task.task_id):
+            self.events.publish(task.task_id, "status", self.get_task_status(task.task_id))
+    
+    def _on_crawler_event(self, task: CrawlerTask, event: str, data: dict):
+        """크롤러 진행 이벤트로 작업 상태 갱신 (크롤러 스레드에서 호출됨)"""
+        if event == "phase":
+            if data["phase"] not in PHASE_PROGRESS:
+                return
+            task.progress, task.message = PHASE_PROGRESS[data["phase"]]
+        elif event == "page":
+            collected = data["total"]
+            task.collected_count = collected
+            # 진행률 계산 (20~90% 범위)
+            task.progress = min(20 + int((collected / task.max_reviews) * 70), 90)
+            task.message = f"리뷰 수집 중... ({collected}/{task.max_reviews}개)"
+            if data["reviews"]:
+                self.events.publish(task.task_id, "reviews", {
+                    "page": data["page"],
+                    "reviews": data["reviews"]
+                })
+            if data.get("network"):
+                self.events.publish(task.task_id, "network", {"page": data["page"], **data["network"]})
+        else:
+            return
+        self._publish_status(task)
+    
+    def _shard_count(self, task: CrawlerTask) -> int:
+        """작업에 쓸 샤드 수 (페이지 그룹 하나는 리뷰 약 200개이므로 그보다 많이 나누지 않음)
+        
+        첫 샤드 외의 샤드는 Chrome을 하나씩 더 띄우므로 스케줄러의 빈 슬롯을 예약한 만큼만 사용합니다
+        (MAX_CONCURRENT_BROWSERS와 여유 메모리 제한 유지, 작업이 끝나면 release()로 반납).
+        샤드 수집은 'dom' 엔진의 전체 수집에서만 쓰므로 그 밖에는 1입니다.
+        """
+        if self.engine != "dom" or self.tab_engines or task.incremental:
+            return 1
+        wanted = max(1, min(self.crawl_shards, -(-task.max_reviews // REVIEWS_PER_PAGE_GROUP)))
+        shards = 1 + self.scheduler.reserve(task.task_id, wanted - 1)
+        if shards < wanted:
+            print(f"   ⚠️  빈 브라우저 슬롯이 부족해 샤드 {wanted}개 중 {shards}개로 수집합니다")
+        return shards
+    
+    def _create_deduper(self, task: CrawlerTask) -> ReviewDeduper:
+        """작업의 중복 제거기 생성
+        
+        Bloom 필터를 쓰면 제품별 파일에 수집 기록을 남기고, 증분 수집에서는 그 파일로 이전 리뷰를 판별합니다.
+        Bloom 필터가 없으면 증분 수집 시 DB의 리뷰 키를 64비트 해시 집합으로 불러옵니다.
+        """
+        bloom = None
+        if self.bloom_dir:
+            bloom = BloomFilter.open(self.bloom_dir, task.product_key,
+                                     capacity=self.bloom_capacity, error_rate=self.bloom_error_rate)
+            if bloom.count and not self.store.product_review_count(task.product_key):
+                # 제품 기록이 만료되었으면 Bloom 필터도 새로 시작 (결과에 없는 리뷰를 건너뛰지 않도록)
+                bloom = BloomFilter.for_capacity(self.bloom_capacity, self.bloom_error_rate, path=bloom.path)
+        known = None
+        if task.incremental and bloom is None:
+            known = HashSet.from_keys(self.store.known_review_keys(task.product_key))
+        return ReviewDeduper(known=known, bloom=bloom, skip_known=task.incremental)
     
     def _run_sync_crawler(self, task: CrawlerTask):
-        """동기 크롤러 실행 (스레드에서 실행됨)"""
+        """동기 크롤러 실행 (스레드에서 실행됨)
+        
+        취소되거나 제한 시간이 지나면 크롤러가 페이지 사이에서 멈추고, 그때까지 수집한 리뷰로 작업을 끝낸 뒤
+        드라이버를 바로 반납합니다 (함수가 끝나면 스케줄러의 실행 슬롯도 다음 작업에 돌아감).
+        """
+        reason = self._stop_reason(task)
+        if reason:
+            # 대기 중에 취소되었거나 제한 시간이 지남 (브라우저를 실행하지 않음)
+            self._mark_stopped(task, reason, 0)
+            self._publish_status(task)
+            TASKS.inc(status=task.status.value)
+            return False
+        
+        driver = None
+        crawler = None
+        sink = None
+        failed = False
+        deadline_timer = None
+        started = time.perf_counter()
         try:
+            task.status = TaskStatusEnum.PROCESSING
+            task.message = "크롤링 시작"
+            self._publish_status(task)
+            
+            # 수집한 리뷰는 페이지마다 작업 저장소에 바로 기록 (메모리에 쌓지 않음)
+            sink = self.store.review_sink(task.task_id)
+            # 증분 수집이면 이 제품에서 이미 수집한 리뷰는 건너뛰고, 모두 아는 리뷰인 페이지에서 멈춤
+            dedup = self._create_deduper(task)
+            
             # 크롤러 인스턴스 생성
             crawler = NaverSmartStoreReviewCrawler(
                 product_url=task.product_url,
-                rating_filter=task.rating_filter
+                rating_filter=task.rating_filter,
+                extract_mode=self.extract_mode,
+                parse_executor=self.parse_executor,
+                engine="dom" if self.tab_engines else self.engine,
+                sink=sink,
+                keep_in_memory=False,
+                on_event=lambda event, data: self._on_crawler_event(task, event, data),
+                dedup=dedup,
+                shards=self._shard_count(task),
+                driver_factory=self.driver_pool.checkout,
+                release_driver=lambda d, failed: self.driver_pool.checkin(d, discard=failed),
+                network_policy=self.network_policy,
+                network_stats=self.network_stats,
+                rating_pushdown=self.rating_pushdown,
+                should_stop=lambda: self._stop_reason(task)
             )
+            with self._crawlers_lock:
+                self._crawlers[task.task_id] = crawler
+            if task.deadline_at:
+                # 제한 시간이 지나면 크롤러가 페이지 사이에서 멈추고, 그 뒤 cancel_grace_seconds 안에 끝나지 않으면 강제 종료
+                deadline_timer = self._schedule_abort(
+                    task.task_id, crawler, "deadline",
+                    (task.deadline_at - datetime.now()).total_seconds() + self.cancel_grace_seconds
+                )
             
-            # 크롤러 실행
-            task.message = "Chrome 드라이버 초기화 중..."
-            task.progress = 5
-            crawler.setup_driver()
-            
-            task.message = "제품 페이지 로딩 중..."
-            task.progress = 10
-            crawler.navigate_to_product()
-            
-            task.message = "리뷰 탭으로 이동 중..."
-            task.progress = 15
-            crawler.click_review_tab()
-            
-            # 리뷰 수집 (진행 상태 업데이트를 위한 커스텀 수집)
-            task.message = "리뷰 수집 중..."
-            task.progress = 20
-            
-            # 별도 스레드에서 진행률 업데이트
-            import threading
-            stop_progress = threading.Event()
+            # 크롤러 실행 (드라이버 풀에서 대여, 진행 상태는 크롤러 이벤트로 갱신)
+            self._on_crawler_event(task, "phase", {"phase": "driver"})
+            if self.tab_engines:
+                # 작업이 가장 적은 브라우저의 탭에서 실행하고 끝날 때까지 대기
+                tab_engine = min(self.tab_engines, key=lambda e: e.load)
+                tab_engine.submit(crawler, task.max_reviews).result()
+            else:
+                with span("driver_checkout"):
+                    driver = self.driver_pool.checkout()
+                crawler.setup_driver(driver=driver)
+                crawler.navigate_to_product()
+                crawler.click_review_tab()
+                crawler.collect_reviews(max_reviews=task.max_reviews)
             
-            def update_progress():
-                while not stop_progress.is_set():
-                    if hasattr(crawler, 'reviews') and crawler.reviews:
-                        collected = len(crawler.reviews)
-                        task.collected_count = collected
-                        # 진행률 계산 (20~90% 범위)
-                        progress = 20 + int((collected / task.max_reviews) * 70)
-                        task.progress = min(progress, 90)
-                        task.message = f"리뷰 수집 중... ({collected}/{task.max_reviews}개)"
-                    stop_progress.wait(1)  # 1초마다 업데이트
+            new_count = crawler.collected_count
+            if crawler.stop_reason:
+                # 중간에 멈춘 수집은 제품 데이터에 합치지 않음 (합치면 다음 증분 수집이 그 뒤의 리뷰를 건너뜀)
+                self._mark_stopped(task, crawler.stop_reason, new_count)
+                return False
             
-            progress_thread = threading.Thread(target=update_progress)
-            progress_thread.start()
+            # 수집한 리뷰를 제품 데이터에 합침 (다음 증분 수집의 기준)
+            with span("store"):
+                self.store.merge_into_product(task.task_id, task.product_key)
+                dedup.save()
+            task.collected_count = new_count
+            # 리뷰 목록 끝까지 수집한 경우만 결과 캐시가 전체 결과로 사용 (증분/중단/목표 개수 도달은 제외)
+            task.exhaustive = not task.incremental and crawler.collected_all(task.max_reviews)
+            if task.incremental:
+                # 결과는 새 리뷰 + 이전에 수집한 리뷰 (최근 수집분 먼저)
+                task.collected_count = self.store.load_product_reviews(
+                    task.task_id, task.product_key, task.rating_filter, task.max_reviews
+                )
             
-            try:
-                crawler.collect_reviews_by_pagination(max_reviews=task.max_reviews)
-            finally:
-                stop_progress.set()
-                progress_thread.join()
-            
-            # 결과 저장
-            task.progress = 95
-            task.message = "파일 저장 중..."
-            
-            if crawler.reviews:
-                task.collected_count = len(crawler.reviews)
-                task.reviews = crawler.reviews
-                
-                # 파일 저장
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                csv_filename = f"{self.output_dir}/reviews_{task.task_id}_{timestamp}.csv"
-                excel_filename = f"{self.output_dir}/reviews_{task.task_id}_{timestamp}.xlsx"
-                
-                crawler.save_to_csv(csv_filename)
-                crawler.save_to_excel(excel_filename)
-                
-                task.csv_file = csv_filename
-                task.excel_file = excel_filename
+            # 결과 저장 (CSV/Excel 등은 다운로드를 요청할 때 저장소에서 생성)
+            if task.collected_count:
+                task.finished_at = datetime.now()
                 task.status = TaskStatusEnum.COMPLETED
                 task.progress = 100
-                task.message = f"크롤링 완료! {task.collected_count}개 리뷰 수집"
+                if task.incremental:
+                    task.message = f"크롤링 완료! 새 리뷰 {new_count}개 (전체 {task.collected_count}개)"
+                else:
+                    task.message = f"크롤링 완료! {task.collected_count}개 리뷰 수집"
             else:
                 task.status = TaskStatusEnum.FAILED
                 task.message = "조건에 맞는 리뷰를 찾지 못했습니다"
             
-            crawler.close()
-            
         except Exception as e:
-            task.status = TaskStatusEnum.FAILED
-            task.error = str(e)
-            task.message = f"크롤링 실패: {str(e)}"
+            failed = True
+            if crawler and crawler.stop_reason:
+                # 강제 종료한 드라이버의 오류 (수집한 리뷰는 결과로 남김)
+                self._mark_stopped(task, crawler.stop_reason, crawler.collected_count)
+            else:
+                task.status = TaskStatusEnum.FAILED
+                task.error = str(e)
+                task.message = f"크롤링 실패: {str(e)}"
+        finally:
+            with self._crawlers_lock:
+                self._crawlers.pop(task.task_id, None)
+                timers = [deadline_timer, self._abort_timers.pop(task.task_id, None)]
+            for timer in timers:
+                if timer is not None:
+                    timer.cancel()
+            self.scheduler.release(task.task_id)
+            if crawler:
+                failed = failed or crawler.aborted
+                crawler.close()
+            if sink:
+                sink.close()
+            if driver is not None:
+                # 오류가 난 드라이버는 재사용하지 않음
+                self.driver_pool.checkin(driver, discard=failed)
+            self._publish_status(task)
+            elapsed = time.perf_counter() - started
+            TASKS.inc(status=task.status.value)
+            TASK_SECONDS.observe(elapsed)
+            if crawler and crawler.collected_count and elapsed > 0:
+                TASK_REVIEWS_PER_SECOND.observe(crawler.collected_count / elapsed)
+        
+        return task.status == TaskStatusEnum.COMPLETED
+    
+    def get_export(self, task_id: str, format: str) -> Optional[tuple]:
+        """완료된 작업의 결과 파일 (경로, MIME 타입) 반환
+        
+        처음 요청된 형식이면 저장소의 리뷰로 생성하고, 이후에는 만들어 둔 파일을 재사용합니다.
+        작업이 없거나 완료되지 않았으면 None (파일 생성은 블로킹이므로 스레드에서 호출)
+        """
+        task = self.store.get(task_id)
+        if not task or not self.has_results(task):
+            return None
+        extension, media_type, writer = EXPORT_FORMATS[format]
+        
+        with self._export_locks[hash(task_id) % len(self._export_locks)]:
+            path = task.exports.get(format)
+            if path and os.path.exists(path):
+                return path, media_type
+            
+            timestamp = (task.finished_at or datetime.now()).strftime("%Y%m%d_%H%M%S")
+            path = f"{self.output_dir}/reviews_{task_id}_{timestamp}.{extension}"
+            # 생성 도중 실패해도 잘린 파일이 캐시되지 않도록 임시 파일에 쓴 뒤 교체
+            # (다른 워커가 같은 형식을 동시에 만들 수 있으므로 임시 파일 이름에 PID 포함)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with span("export"):
+                    writer(self.store.iter_reviews(task_id), tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self.store.add_export(task, format, path)
+            return path, media_type
+    
+    def create_batch(self, items: List[dict], concurrency: Optional[int] = None) -> str:
+        """여러 제품의 크롤링 작업을 한 번에 생성하고 일괄 수집 ID 반환
+        
+        항목마다 create_task()로 작업을 만들므로 최근 수집 결과가 있는 제품은 바로 완료됩니다.
+        """
+        batch_id = str(uuid.uuid4())
+        task_ids = [
+            self.create_task(
+                product_url=item["product_url"],
+                rating_filter=item.get("rating_filter"),
+                max_reviews=item.get("max_reviews", 100),
+                use_cache=item.get("use_cache", True),
+                incremental=item.get("incremental", False),
+                deadline_seconds=item.get("deadline_seconds")
+            )
+            for item in items
+        ]
+        concurrency = max(1, min(concurrency or self.batch_concurrency, self.scheduler.max_concurrent))
+        self.store.add_batch(batch_id, task_ids, concurrency)
+        return batch_id
+    
+    async def run_batch(self, batch_id: str):
+        """일괄 수집의 작업을 최대 concurrency개씩 실행 (드라이버 풀과 스케줄러는 다른 작업과 공유)
+        
+        작업자 모드에서는 모든 작업을 바로 대기열에 넣으며, 동시 실행 수는 작업자 수로 정해집니다.
+        """
+        batch = await asyncio.to_thread(self.store.get_batch, batch_id)
+        if not batch:
+            return
+        semaphore = asyncio.Semaphore(batch["concurrency"])
+        
+        async def run(task_id: str):
+            async with semaphore:
+                await self.run_crawler(task_id)
+        
+        await asyncio.gather(*(run(task_id) for task_id in batch["task_ids"]))
+    
+    def get_batch_status(self, batch_id: str) -> Optional[dict]:
+        """일괄 수집 전체 진행 상태와 작업별 상태 (없으면 None)
+        
+        전체 상태는 모두 대기 중이면 pending, 모두 끝났으면 하나라도 완료된 경우 completed
+        (완료 없이 취소된 작업이 있으면 cancelled, 모두 실패하면 failed), 그 밖에는 processing입니다.
+        """
+        batch = self.store.get_batch(batch_id)
+        if not batch:
+            return None
+        items = [self.get_task_status(task_id) for task_id in batch["task_ids"]]
+        counts = {status.value: 0 for status in TaskStatusEnum}
+        for item in items:
+            counts[TaskStatusEnum(item["status"]).value] += 1
+        total = len(items)
+        finished = sum(counts[status.value] for status in FINISHED_STATUSES)
+        if finished == total:
+            if counts[TaskStatusEnum.COMPLETED.value]:
+                status = TaskStatusEnum.COMPLETED
+            elif counts[TaskStatusEnum.CANCELLED.value]:
+                status = TaskStatusEnum.CANCELLED
+            else:
+                status = TaskStatusEnum.FAILED
+        elif counts[TaskStatusEnum.PENDING.value] == total:
+            status = TaskStatusEnum.PENDING
+        else:
+            status = TaskStatusEnum.PROCESSING
+        
+        if status == TaskStatusEnum.COMPLETED:
+            message = f"일괄 수집 완료 (성공 {counts['completed']}개, 실패 {counts['failed']}개)"
+            if counts["cancelled"]:
+                message = f"{message[:-1]}, 취소 {counts['cancelled']}개)"
+        elif status == TaskStatusEnum.CANCELLED:
+            message = "완료된 제품 없이 일괄 수집이 취소되었습니다"
+        elif status == TaskStatusEnum.FAILED:
+            message = "모든 제품의 수집이 실패했습니다"
+        else:
+            message = f"일괄 수집 중... ({finished}/{total}개 제품 완료)"
+        
+        return {
+            "batch_id": batch_id,
+            "status": status,
+            "total": total,
+            "pending": counts[TaskStatusEnum.PENDING.value],
+            "processing": counts[TaskStatusEnum.PROCESSING.value],
+            "completed": counts[TaskStatusEnum.COMPLETED.value],
+            "failed": counts[TaskStatusEnum.FAILED.value],
+            "cancelled": counts[TaskStatusEnum.CANCELLED.value],
+            "progress": sum(100 if item["status"] in FINISHED_STATUSES else item["progress"] for item in items) // total,
+            "collected_count": sum(item["collected_count"] for item in items),
+            "concurrency": batch["concurrency"],
+            "created_at": batch["created_at"],
+            "message": message,
+            "download_url": f"/api/batch/{batch_id}/download" if status == TaskStatusEnum.COMPLETED else None,
+            "items": items,
+        }
+    
+    def _iter_batch_reviews(self, task_ids: List[str]):
+        """결과가 있는 작업(완료 또는 취소 전 수집분)의 리뷰를 작업 순서대로, 제품 URL을 붙여 반환"""
+        for task_id in task_ids:
+            task = self.store.get(task_id)
+            if not task or not self.has_results(task):
+                continue
+            for review in self.store.iter_reviews(task_id):
+                review["product_url"] = task.product_url
+                yield review
+    
+    def get_batch_export(self, batch_id: str, format: str) -> Optional[tuple]:
+        """일괄 수집 통합 결과 파일 (경로, MIME 타입) 반환
+        
+        모든 작업이 끝나고 하나 이상 완료된 경우에만 생성하며 (아니면 None), 완료된 제품의 리뷰를
+        제품 URL 열과 함께 한 파일에 기록합니다. 제품별 파일은 작업별 다운로드 주소를 사용합니다.
+        """
+        status = self.get_batch_status(batch_id)
+        if not status or status["status"] != TaskStatusEnum.COMPLETED:
+            return None
+        batch = self.store.get_batch(batch_id)
+        extension, media_type, writer = EXPORT_FORMATS[format]
+        
+        with self._export_locks[hash(batch_id) % len(self._export_locks)]:
+            path = batch["exports"].get(format)
+            if path and os.path.exists(path):
+                return path, media_type
+            
+            timestamp = batch["created_at"].strftime("%Y%m%d_%H%M%S")
+            path = f"{self.output_dir}/batch_{batch_id}_{timestamp}.{extension}"
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with span("export"):
+                    writer(self._iter_batch_reviews(batch["task_ids"]), tmp_path, columns=BATCH_COLUMNS)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self.store.add_batch_export(batch_id, format, path)
+            return path, media_type
     
     def get_task_status(self, task_id: str) -> dict:
         """작업 상태 반환"""
-        task = self.tasks.get(task_id)
+        task = self.store.get(task_id)
         if not task:
             return {
                 "task_id": task_id,
@@ -163,7 +684,7 @@ class CrawlerService:
                 "error": "Invalid task ID"
             }
         
-        return {
+        status = {
             "task_id": task.task_id,
             "status": task.status,
             "progress": task.progress,
@@ -171,8 +692,91 @@ class CrawlerService:
             "total_target": task.max_reviews,
             "message": task.message,
             "error": task.error,
-            "download_url": f"/api/download/{task_id}" if task.status == TaskStatusEnum.COMPLETED else None
+            "download_url": f"/api/download/{task_id}" if self.has_results(task) else None,
+            "from_cache": task.source_task_id is not None
         }
+        
+        if task.cancel_requested and task.status not in FINISHED_STATUSES:
+            status["message"] = "취소 요청됨: 현재 페이지까지 수집한 뒤 멈춥니다"
+        # 대기 중이면 대기열 순번과 예상 시작 시각 추가
+        elif task.status == TaskStatusEnum.PENDING and self.queue_mode:
+            position = self.store.job_position(task_id)
+            if position:
+                status["queue_position"] = position
+                status["message"] = f"작업자 대기열 {position}번째"
+                if not self.store.live_workers(self.worker_timeout):
+                    status["message"] += " (실행 중인 작업자 없음)"
+        elif task.status == TaskStatusEnum.PENDING:
+            queue_info = self.scheduler.get_queue_info(task_id)
+            if queue_info:
+                status["queue_position"] = queue_info["queue_position"]
+                status["estimated_start_time"] = datetime.fromtimestamp(queue_info["estimated_start_time"])
+                status["estimated_wait_seconds"] = queue_info["estimated_wait_seconds"]
+                status["message"] = f"대기열 {queue_info['queue_position']}번째 (약 {queue_info['estimated_wait_seconds']}초 후 시작 예정)"
+        
+        return status
+    
+    async def stream_events(self, task_id: str, include_reviews: bool = False,
+                            keepalive_seconds: float = 15.0, remote_poll_seconds: float = 1.0):
+        """작업 진행 이벤트를 SSE 메시지로 반환 (작업이 끝나면 종료)
+        
+        처음에 현재 상태를 보내고, 이후 크롤러 이벤트가 발생할 때마다 전송합니다.
+        include_reviews가 True면 새로 수집한 리뷰도 'reviews' 이벤트로 함께 보냅니다.
+        다른 워커가 실행 중인 작업은 이벤트를 받을 수 없으므로 저장소의 상태가 바뀔 때 전송합니다.
+        """
+        queue = self.events.subscribe(task_id)
+        try:
+            status = await asyncio.to_thread(self.get_task_status, task_id)
+            yield format_sse("status", status)
+            while status["status"] not in FINISHED_STATUSES:
+                local = self.store.is_active(task_id)
+                try:
+                    event, data = await asyncio.wait_for(
+                        queue.get(), keepalive_seconds if local else remote_poll_seconds
+                    )
+                except asyncio.TimeoutError:
+                    # 대기열 순번/예상 시작 시각 또는 다른 워커의 진행 상태가 바뀌었으면 전송
+                    latest = await asyncio.to_thread(self.get_task_status, task_id)
+                    if latest != status:
+                        status = latest
+                        yield format_sse("status", status)
+                    else:
+                        # 연결 유지용 주석
+                        yield ": keep-alive\n\n"
+                    continue
+                if event == "reviews" and not include_reviews:
+                    continue
+                if event == "status":
+                    status = data
+                yield format_sse(event, data)
+        finally:
+            self.events.unsubscribe(task_id, queue)
+    
+    def shutdown(self):
+        """스케줄러, 파서 프로세스, 드라이버 풀, 작업 저장소 정리"""
+        self.scheduler.shutdown()
+        if self.parse_executor:
+            self.parse_executor.shutdown(wait=False, cancel_futures=True)
+        self.driver_pool.close()
+        for tab_engine in self.tab_engines:
+            tab_engine.close()
+        self.store.close()
+    
+    def get_pool_stats(self) -> dict:
+        """드라이버 풀 통계 반환"""
+        return self.driver_pool.stats()
+    
+    def get_tab_stats(self) -> List[dict]:
+        """탭 엔진(브라우저별) 통계 반환"""
+        return [tab_engine.stats() for tab_engine in self.tab_engines]
+    
+    def get_scheduler_stats(self) -> dict:
+        """스케줄러 통계 반환"""
+        return self.scheduler.stats()
+    
+    def get_store_stats(self) -> dict:
+        """작업 저장소 통계 반환"""
+        return self.store.stats()
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,238 @@
+import os
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+# 상위 디렉토리의 크롤러 임포트
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from bs_crwal import create_chrome_driver
+
+
+class PooledDriver:
+    """풀에서 관리되는 드라이버와 사용 정보"""
+    def __init__(self, driver, launch_seconds: float):
+        self.driver = driver
+        self.launch_seconds = launch_seconds
+        self.uses = 0
+        self.created_at = time.time()
+
+
+class DriverPool:
+    """미리 실행해 둔 Chrome 드라이버를 작업 간에 재사용하는 풀
+
+    - checkout(): 유휴 드라이버를 꺼냄 (없으면 새로 실행)
+    - checkin(): 쿠키/스토리지를 초기화하고 풀에 반납
+    - max_uses 회 사용한 드라이버는 종료하고 새로 교체
+    - 실행 중인 드라이버(유휴 + 대여 중 + 실행 중)는 max_size개까지만 두고, 가득 차면 반납될 때까지 대기
+    """
+
+    def __init__(self, size: int = 1, max_uses: int = 20,
+                 factory: Optional[Callable] = None, max_size: Optional[int] = None,
+                 checkout_timeout: Optional[float] = None):
+        self.max_size = max(1, max_size or size)
+        self.size = min(size, self.max_size)
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+        self.factory = factory or create_chrome_driver
+        self._idle: List[PooledDriver] = []
+        self._in_use = {}
+        # 유휴/대여 목록 밖에 있는 드라이버 수 (새로 실행 중이거나 꺼내서 상태 확인 중)
+        self._pending = 0
+        self._lock = threading.Lock()
+        # 드라이버가 반납/폐기되어 자리가 나면 알림
+        self._available = threading.Condition(self._lock)
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.launches = 0
+        self.recycled = 0
+        self.discarded = 0
+        self.total_launch_seconds = 0.0
+        self.last_launch_seconds = 0.0
+        self.waits = 0
+
+    def _live(self) -> int:
+        """실행 중인 드라이버 수 (락 안에서 호출)"""
+        return len(self._idle) + len(self._in_use) + self._pending
+
+    def _launch(self) -> PooledDriver:
+        """새 드라이버 실행 (락 밖에서 호출, 호출 전에 _pending으로 자리를 잡아 두고 실패하면 반납)"""
+        start = time.perf_counter()
+        try:
+            driver = self.factory()
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+                self._available.notify()
+            raise
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.launches += 1
+            self.total_launch_seconds += elapsed
+            self.last_launch_seconds = elapsed
+        return PooledDriver(driver, elapsed)
+
+    def _release_slot(self):
+        """드라이버 하나가 종료되어 자리가 났음을 대기 중인 checkout()에 알림"""
+        with self._lock:
+            self._available.notify()
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """드라이버 세션이 살아있는지 확인"""
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _reset(self, pooled: PooledDriver):
+        """다음 작업을 위해 쿠키/스토리지/페이지 상태 초기화"""
+        driver = pooled.driver
+        try:
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+        except Exception:
+            pass
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def warm(self):
+        """풀 크기만큼 드라이버를 미리 실행"""
+        while True:
+            with self._lock:
+                if self._live() >= self.size:
+                    return
+                self._pending += 1
+            try:
+                pooled = self._launch()
+            except Exception as e:
+                print(f"⚠️  드라이버 풀 예열 실패: {e}")
+                return
+            with self._lock:
+                self._pending -= 1
+                self._idle.append(pooled)
+                self._available.notify()
+
+    def checkout(self):
+        """드라이버 대여
+
+        유휴 드라이버가 없으면 max_size까지는 새로 실행하고, 가득 차면 다른 작업이 반납할 때까지 기다립니다
+        (checkout_timeout초가 지나면 TimeoutError).
+        """
+        pooled = None
+        deadline = time.monotonic() + self.checkout_timeout if self.checkout_timeout else None
+        while True:
+            with self._lock:
+                if not self._idle:
+                    if self._live() >= self.max_size:
+                        self.waits += 1
+                        while not self._idle and self._live() >= self.max_size:
+                            remaining = deadline - time.monotonic() if deadline else None
+                            if remaining is not None and remaining <= 0:
+                                raise TimeoutError(
+                                    f"드라이버 풀이 가득 찼습니다 (최대 {self.max_size}개, {self.checkout_timeout:.0f}초 대기)"
+                                )
+                            self._available.wait(remaining)
+                        continue
+                    self.misses += 1
+                    self._pending += 1
+                    break
+                candidate = self._idle.pop()
+                self._pending += 1
+
+            if self._is_healthy(candidate):
+                pooled = candidate
+                with self._lock:
+                    self.hits += 1
+                break
+
+            # 죽은 드라이버는 버리고 다음 후보 확인 (자리가 났으므로 다음 반복에서 새로 실행 가능)
+            self._quit(candidate)
+            with self._lock:
+                self.discarded += 1
+                self._pending -= 1
+                self._available.notify()
+
+        if pooled is None:
+            pooled = self._launch()
+
+        pooled.uses += 1
+        with self._lock:
+            self._pending -= 1
+            self._in_use[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def checkin(self, driver, discard: bool = False):
+        """드라이버 반납
+
+        discard: True면 재사용하지 않고 종료 (오류가 난 드라이버 등)
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            return
+
+        if not discard and pooled.uses >= self.max_uses:
+            # 사용 횟수 초과 - 메모리 누수 방지를 위해 교체
+            with self._lock:
+                self.recycled += 1
+            self._quit(pooled)
+            self._release_slot()
+            # 교체분을 백그라운드에서 미리 실행
+            threading.Thread(target=self.warm, daemon=True).start()
+            return
+
+        if not discard:
+            try:
+                self._reset(pooled)
+            except Exception:
+                discard = True
+
+        with self._lock:
+            if discard:
+                self.discarded += 1
+            elif len(self._idle) < self.size:
+                self._idle.append(pooled)
+                self._available.notify()
+                return
+
+        self._quit(pooled)
+        self._release_slot()
+
+    def close(self):
+        """모든 드라이버 종료"""
+        with self._lock:
+            drivers = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+        for pooled in drivers:
+            self._quit(pooled)
+
+    def stats(self) -> dict:
+        """풀 상태 및 통계"""
+        with self._lock:
+            checkouts = self.hits + self.misses
+            return {
+                "size": self.size,
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "max_uses": self.max_uses,
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "hit_rate": round(self.hits / checkouts, 3) if checkouts else 0.0,
+                "launches": self.launches,
+                "recycled": self.recycled,
+                "discarded": self.discarded,
+                "avg_launch_seconds": round(self.total_launch_seconds / self.launches, 3) if self.launches else 0.0,
+                "last_launch_seconds": round(self.last_launch_seconds, 3),
+            }
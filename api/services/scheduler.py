@@ -0,0 +1,230 @@
+import asyncio
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# 상위 디렉토리의 크롤러 임포트
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from telemetry import QUEUE_WAIT_SECONDS
+
+
+def get_available_memory_mb() -> Optional[float]:
+    """사용 가능한 메모리(MB) 조회 (Linux /proc/meminfo 기준, 알 수 없으면 None)"""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class QueuedJob:
+    """대기열에 들어간 크롤링 작업"""
+    def __init__(self, task_id: str, max_reviews: int, fn: Callable, future: asyncio.Future):
+        self.task_id = task_id
+        self.max_reviews = max_reviews
+        self.fn = fn
+        self.future = future
+        self.enqueued_at = time.time()
+        self.started_at: Optional[float] = None
+
+
+class CrawlScheduler:
+    """동시 실행 브라우저 수를 제한하는 크롤링 스케줄러
+
+    - 최대 max_concurrent 개의 크롤링만 동시에 실행 (Chrome 프로세스 수 제한)
+    - 사용 가능한 메모리가 min_free_memory_mb 미만이면 새 작업 시작을 보류
+    - 대기열은 max_reviews 가 작은 작업부터 실행 (최단 작업 우선, 평균 대기 시간 감소)
+    - 실행 중인 작업이 Chrome을 더 띄우려면 (샤드 수집) reserve()로 빈 슬롯을 예약
+    """
+
+    def __init__(self, max_concurrent: int = 2, min_free_memory_mb: int = 400,
+                 memory_probe: Callable[[], Optional[float]] = get_available_memory_mb):
+        self.max_concurrent = max(1, max_concurrent)
+        self.min_free_memory_mb = min_free_memory_mb
+        self.memory_probe = memory_probe
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent, thread_name_prefix="crawler"
+        )
+        self._queue: List[tuple] = []
+        self._counter = itertools.count()
+        self._running: Dict[str, QueuedJob] = {}
+        # 실행 중인 작업이 추가로 예약한 브라우저 슬롯 (작업 ID → 슬롯 수)
+        self._reserved: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 소요 시간 추정 (리뷰 1개당 초, 작업당 고정 오버헤드)
+        self.seconds_per_review = 1.0
+        self.overhead_seconds = 15.0
+        self.completed = 0
+
+    def submit(self, task_id: str, max_reviews: int, fn: Callable) -> asyncio.Future:
+        """작업을 대기열에 추가하고 완료 시 결과가 설정되는 Future 반환"""
+        self._loop = asyncio.get_running_loop()
+        future = self._loop.create_future()
+        job = QueuedJob(task_id, max_reviews, fn, future)
+        with self._lock:
+            heapq.heappush(self._queue, (max_reviews, next(self._counter), job))
+        self._dispatch()
+        return future
+
+    def cancel(self, task_id: str) -> bool:
+        """대기 중인 작업을 대기열에서 빼고 Future를 False로 완료 (어느 스레드에서든 호출 가능, 대기 중이 아니면 False)
+
+        실행 중인 작업은 멈출 수 없으며, 작업 함수가 끝나는 즉시 슬롯이 다음 작업에 돌아갑니다.
+        """
+        with self._lock:
+            index = next((i for i, (_, _, job) in enumerate(self._queue) if job.task_id == task_id), None)
+            if index is None:
+                return False
+            _, _, job = self._queue.pop(index)
+            heapq.heapify(self._queue)
+        # Future는 이벤트 루프 스레드에서만 완료할 수 있음
+        job.future.get_loop().call_soon_threadsafe(self._resolve, job.future, False)
+        return True
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result):
+        if not future.done():
+            future.set_result(result)
+
+    def is_running(self, task_id: str) -> bool:
+        with self._lock:
+            return task_id in self._running
+
+    def reserve(self, task_id: str, count: int) -> int:
+        """작업이 추가로 띄울 브라우저 수만큼 빈 실행 슬롯 예약 (예약한 수 반환, 어느 스레드에서든 호출 가능)
+
+        비어 있는 슬롯까지만 예약하며, 여유 메모리가 min_free_memory_mb 미만이면 예약하지 않습니다.
+        예약한 슬롯은 새 작업 시작 판단에 포함되고 release()로 반납합니다.
+        대기열을 거치지 않고 실행 중인 작업 (작업자 프로세스)도 슬롯 하나를 쓰는 것으로 계산합니다.
+        """
+        if count <= 0:
+            return 0
+        with self._lock:
+            used = len(self._running) + sum(self._reserved.values())
+            if task_id not in self._running:
+                used += 1
+            granted = max(0, min(count, self.max_concurrent - used))
+            if granted:
+                available = self.memory_probe()
+                if available is not None and available < self.min_free_memory_mb:
+                    granted = 0
+            if granted:
+                self._reserved[task_id] = self._reserved.get(task_id, 0) + granted
+        return granted
+
+    def release(self, task_id: str):
+        """reserve()로 예약한 슬롯 반납 후 대기 중인 작업 시작"""
+        with self._lock:
+            released = self._reserved.pop(task_id, 0)
+        if released and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._dispatch)
+
+    def _can_admit(self) -> bool:
+        """새 브라우저를 시작할 수 있는지 확인 (락 안에서 호출)"""
+        if len(self._running) + sum(self._reserved.values()) >= self.max_concurrent:
+            return False
+        if not self._running:
+            # 실행 중인 작업이 없으면 메모리와 관계없이 시작 (교착 방지)
+            return True
+        available = self.memory_probe()
+        return available is None or available >= self.min_free_memory_mb
+
+    def _dispatch(self):
+        """실행 가능한 만큼 대기열에서 꺼내 시작 (이벤트 루프에서 호출)"""
+        to_start = []
+        with self._lock:
+            while self._queue and self._can_admit():
+                _, _, job = heapq.heappop(self._queue)
+                job.started_at = time.time()
+                self._running[job.task_id] = job
+                to_start.append(job)
+                QUEUE_WAIT_SECONDS.observe(job.started_at - job.enqueued_at)
+
+        for job in to_start:
+            exec_future = self._loop.run_in_executor(self._executor, job.fn)
+            exec_future.add_done_callback(lambda f, job=job: self._on_done(job, f))
+
+    def _on_done(self, job: QueuedJob, exec_future: asyncio.Future):
+        """작업 완료 처리 및 다음 작업 시작"""
+        duration = time.time() - job.started_at
+        # 실패한 작업(예외 또는 False 반환)은 소요 시간 추정에 반영하지 않음
+        succeeded = exec_future.exception() is None and exec_future.result() is not False
+        with self._lock:
+            self._running.pop(job.task_id, None)
+            self.completed += 1
+            if succeeded:
+                self._record_duration(job.max_reviews, duration)
+
+        if not job.future.done():
+            if exec_future.exception() is not None:
+                job.future.set_exception(exec_future.exception())
+            else:
+                job.future.set_result(exec_future.result())
+
+        self._dispatch()
+
+    def _record_duration(self, max_reviews: int, duration: float):
+        """완료된 작업으로 리뷰당 소요 시간 추정치 갱신 (지수 이동 평균)"""
+        per_review = max(duration - self.overhead_seconds, 0) / max(max_reviews, 1)
+        self.seconds_per_review = 0.7 * self.seconds_per_review + 0.3 * per_review
+
+    def _estimate_duration(self, max_reviews: int) -> float:
+        return self.overhead_seconds + max_reviews * self.seconds_per_review
+
+    def get_queue_info(self, task_id: str) -> Optional[dict]:
+        """대기 중인 작업의 대기열 순번과 예상 시작 시각 반환 (대기 중이 아니면 None)"""
+        now = time.time()
+        with self._lock:
+            ordered = [job for _, _, job in sorted(self._queue)]
+            position = next(
+                (i for i, job in enumerate(ordered) if job.task_id == task_id), None
+            )
+            if position is None:
+                return None
+
+            # 각 실행 슬롯이 비는 시각을 계산하고 앞선 작업을 순서대로 배정
+            # (샤드용으로 예약한 슬롯은 예약한 작업이 끝날 때 함께 빔)
+            slots = []
+            for job in self._running.values():
+                free_at = job.started_at + self._estimate_duration(job.max_reviews)
+                slots += [free_at] * (1 + self._reserved.get(job.task_id, 0))
+            slots += [now] * (self.max_concurrent - len(slots))
+            slots = [max(t, now) for t in slots]
+            heapq.heapify(slots)
+            for job in ordered[:position]:
+                free_at = heapq.heappop(slots)
+                heapq.heappush(slots, free_at + self._estimate_duration(job.max_reviews))
+            start_at = slots[0]
+
+        return {
+            "queue_position": position + 1,
+            "estimated_start_time": start_at,
+            "estimated_wait_seconds": int(start_at - now),
+        }
+
+    def stats(self) -> dict:
+        """스케줄러 상태"""
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "running": len(self._running),
+                "reserved": sum(self._reserved.values()),
+                "queued": len(self._queue),
+                "completed": self.completed,
+                "available_memory_mb": self.memory_probe(),
+                "min_free_memory_mb": self.min_free_memory_mb,
+                "seconds_per_review": round(self.seconds_per_review, 3),
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
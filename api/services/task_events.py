@@ -0,0 +1,67 @@
+import asyncio
+import json
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+
+class TaskEventBus:
+    """작업별 진행 이벤트를 구독자(SSE 연결)에게 전달하는 버스
+
+    publish()는 크롤러 스레드에서 호출되며, 각 구독자의 이벤트 루프로 안전하게 넘겨집니다.
+    느린 구독자의 큐가 가득 차면 그 구독자에 대한 이벤트만 버립니다.
+    """
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, task_id: str) -> asyncio.Queue:
+        """구독 시작 (이벤트 루프 안에서 호출)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(task_id, []).append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = [s for s in self._subscribers.get(task_id, []) if s[1] is not queue]
+            if subscribers:
+                self._subscribers[task_id] = subscribers
+            else:
+                self._subscribers.pop(task_id, None)
+
+    def has_subscribers(self, task_id: str) -> bool:
+        with self._lock:
+            return bool(self._subscribers.get(task_id))
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, item):
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            pass
+
+    def publish(self, task_id: str, event: str, data: dict):
+        """이벤트 발행 (어느 스레드에서든 호출 가능)"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(task_id, []))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, (event, data))
+            except RuntimeError:
+                # 이미 종료된 이벤트 루프
+                pass
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 메시지 형식으로 변환"""
+    payload = json.dumps(data, ensure_ascii=False, default=_json_default)
+    return f"event: {event}\ndata: {payload}\n\n"
@@ -0,0 +1,812 @@
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+# 상위 디렉토리의 크롤러 임포트
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from review_dedup import review_key
+from review_sink import REVIEW_COLUMNS, ReviewSink
+
+from models.schemas import TaskStatusEnum
+
+
+FINISHED_STATUSES = (TaskStatusEnum.COMPLETED, TaskStatusEnum.FAILED, TaskStatusEnum.CANCELLED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    product_url TEXT NOT NULL,
+    rating_filter TEXT,
+    max_reviews INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    collected_count INTEGER NOT NULL DEFAULT 0,
+    message TEXT,
+    error TEXT,
+    exports TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    finished_at REAL,
+    product_key TEXT,
+    source_task_id TEXT,
+    incremental INTEGER NOT NULL DEFAULT 0,
+    deadline_at REAL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    exhaustive INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    task_id TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    date TEXT,
+    rating TEXT,
+    reviewer TEXT,
+    content TEXT,
+    tags TEXT,
+    has_photo INTEGER,
+    PRIMARY KEY (task_id, number)
+) WITHOUT ROWID;
+
+-- 제품별로 지금까지 수집한 리뷰 (증분 수집의 기준, 최근 수집분이 앞에 오도록 crawled_at/position 기록)
+CREATE TABLE IF NOT EXISTS product_reviews (
+    product_key TEXT NOT NULL,
+    review_key TEXT NOT NULL,
+    crawled_at REAL NOT NULL,
+    position INTEGER NOT NULL,
+    date TEXT,
+    rating TEXT,
+    reviewer TEXT,
+    content TEXT,
+    tags TEXT,
+    has_photo INTEGER,
+    PRIMARY KEY (product_key, review_key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS products (
+    product_key TEXT PRIMARY KEY,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    last_crawled_at REAL NOT NULL
+);
+
+-- 일괄 수집 (작업 ID 목록과 통합 결과 파일)
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id TEXT PRIMARY KEY,
+    task_ids TEXT NOT NULL,
+    concurrency INTEGER NOT NULL,
+    exports TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batches_created_at ON batches (created_at);
+
+-- 작업자 프로세스가 가져가 실행할 작업 (CRAWL_QUEUE=1, status는 'queued' 또는 'running', 끝나면 삭제)
+CREATE TABLE IF NOT EXISTS jobs (
+    task_id TEXT PRIMARY KEY,
+    max_reviews INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (status, max_reviews, enqueued_at);
+
+-- 실행 중인 작업자 (주기적으로 heartbeat_at 갱신)
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    task_id TEXT,
+    started_at REAL NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+"""
+
+TASK_COLUMNS = [
+    "task_id", "product_url", "rating_filter", "max_reviews", "status", "progress",
+    "collected_count", "message", "error", "exports", "created_at", "updated_at", "finished_at",
+    "product_key", "source_task_id", "incremental", "deadline_at", "cancel_requested",
+    "exhaustive",
+]
+
+# 이전 버전 DB에 없는 열 (열 이름 → 타입)
+ADDED_TASK_COLUMNS = {
+    "product_key": "TEXT",
+    "source_task_id": "TEXT",
+    "incremental": "INTEGER NOT NULL DEFAULT 0",
+    "deadline_at": "REAL",
+    "cancel_requested": "INTEGER NOT NULL DEFAULT 0",
+    "exhaustive": "INTEGER NOT NULL DEFAULT 0",
+}
+
+PRODUCT_ID_RE = re.compile(r'/products/(\d+)')
+
+
+def product_key(url: str) -> str:
+    """같은 제품의 URL을 하나로 묶는 키 (상품 번호, 없으면 쿼리/프래그먼트를 뺀 URL)"""
+    match = PRODUCT_ID_RE.search(url)
+    if match:
+        return f"products/{match.group(1)}"
+    return url.split('#')[0].split('?')[0].rstrip('/').lower()
+
+
+def covers_rating_filter(cached: Optional[List[int]], requested: Optional[List[int]]) -> bool:
+    """cached 필터로 수집한 결과에 requested 필터의 리뷰가 모두 들어 있는지 (None은 모든 평점)"""
+    if cached is None:
+        return True
+    return requested is not None and set(requested) <= set(cached)
+
+
+class CrawlerTask:
+    """크롤링 작업 정보"""
+    def __init__(self, task_id: str, product_url: str, rating_filter: Optional[List[int]], max_reviews: int,
+                 incremental: bool = False, deadline_seconds: Optional[float] = None):
+        self.task_id = task_id
+        self.product_url = product_url
+        self.rating_filter = rating_filter
+        self.max_reviews = max_reviews
+        self.status = TaskStatusEnum.PENDING
+        self.progress = 0
+        self.collected_count = 0
+        self.message = "작업 대기 중"
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        # 다운로드 시 생성한 형식별 파일 (형식 → 경로)
+        self.exports: Dict[str, str] = {}
+        self.product_key = product_key(product_url)
+        # 캐시된 결과로 완료한 경우 원본 작업 ID
+        self.source_task_id: Optional[str] = None
+        # 증분 수집 (이전에 수집한 리뷰까지만 새로 수집하고 제품 데이터에 합침)
+        self.incremental = incremental
+        # 이 시각이 지나면 수집을 멈추고 그때까지 수집한 리뷰로 끝냄 (None이면 제한 없음)
+        self.deadline_at: Optional[datetime] = (
+            datetime.fromtimestamp(self.created_at.timestamp() + deadline_seconds) if deadline_seconds else None
+        )
+        # DELETE /api/tasks/{task_id}로 취소를 요청했는지 (실행 중이면 페이지 사이에서 멈춤)
+        self.cancel_requested = False
+        # 리뷰 목록의 마지막 페이지까지 수집해 필터에 맞는 리뷰를 모두 담았는지 (결과 캐시가 전체 결과로 사용)
+        self.exhaustive = False
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value else None
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value else None
+
+
+class TaskStore:
+    """SQLite(WAL) 기반 작업 저장소
+
+    - 작업 정보와 수집한 리뷰를 한 파일에 저장하므로 재시작 후에도 남고,
+      같은 파일을 쓰는 여러 uvicorn 워커가 작업 상태를 공유합니다.
+    - 메모리에는 최근 작업 hot_size개만 유지 (LRU), 실행 중인 작업은 항상 유지
+    - 끝난 지 ttl_seconds가 지난 작업은 리뷰와 결과 파일까지 삭제
+    - 제품별 수집 리뷰(증분 수집 기준)는 product_ttl_seconds 동안 수집이 없으면 삭제
+    - CRAWL_QUEUE=1이면 작업자 대기열(jobs)로 API 서버와 작업자 프로세스가 작업을 주고받음
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 24 * 3600, hot_size: int = 256,
+                 evict_interval: float = 300.0, product_ttl_seconds: float = 30 * 86400):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.product_ttl_seconds = product_ttl_seconds
+        self.hot_size = hot_size
+        self.evict_interval = evict_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hot: "OrderedDict[str, CrawlerTask]" = OrderedDict()
+        # 이 프로세스에서 실행 중인 작업 (다른 워커가 바꾸지 않으므로 메모리 값이 최신)
+        self._active: Dict[str, CrawlerTask] = {}
+        self._last_evicted = 0.0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+        for column, column_type in ADDED_TASK_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE tasks ADD COLUMN {column} {column_type}")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_product ON tasks (product_key, finished_at)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간에 공유하지 않음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    # 작업 정보
+
+    def _to_row(self, task: CrawlerTask) -> tuple:
+        return (
+            task.task_id,
+            task.product_url,
+            json.dumps(task.rating_filter) if task.rating_filter else None,
+            task.max_reviews,
+            task.status.value,
+            task.progress,
+            task.collected_count,
+            task.message,
+            task.error,
+            json.dumps(task.exports),
+            _timestamp(task.created_at),
+            time.time(),
+            _timestamp(task.finished_at),
+            task.product_key,
+            task.source_task_id,
+            1 if task.incremental else 0,
+            _timestamp(task.deadline_at),
+            1 if task.cancel_requested else 0,
+            1 if task.exhaustive else 0,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> CrawlerTask:
+        data = dict(zip(TASK_COLUMNS, row))
+        task = CrawlerTask(
+            data["task_id"],
+            data["product_url"],
+            json.loads(data["rating_filter"]) if data["rating_filter"] else None,
+            data["max_reviews"],
+            bool(data["incremental"]),
+        )
+        task.status = TaskStatusEnum(data["status"])
+        task.progress = data["progress"]
+        task.collected_count = data["collected_count"]
+        task.message = data["message"]
+        task.error = data["error"]
+        task.exports = json.loads(data["exports"] or "{}")
+        task.created_at = _datetime(data["created_at"])
+        task.finished_at = _datetime(data["finished_at"])
+        task.source_task_id = data["source_task_id"]
+        task.deadline_at = _datetime(data["deadline_at"])
+        task.cancel_requested = bool(data["cancel_requested"])
+        task.exhaustive = bool(data["exhaustive"])
+        return task
+
+    def _remember(self, task: CrawlerTask):
+        with self._lock:
+            self._hot[task.task_id] = task
+            self._hot.move_to_end(task.task_id)
+            while len(self._hot) > self.hot_size:
+                self._hot.popitem(last=False)
+
+    def add(self, task: CrawlerTask):
+        """새 작업 저장 (이 프로세스에서 실행할 작업으로 등록)"""
+        self.save(task)
+        with self._lock:
+            self._active[task.task_id] = task
+        self._remember(task)
+
+    def save(self, task: CrawlerTask):
+        """작업 상태 기록 (끝난 작업은 실행 목록에서 제외)
+
+        취소 요청은 다른 프로세스가 기록할 수 있으므로 실행 중인 작업을 저장해도 지우지 않고,
+        저장된 취소 요청을 task.cancel_requested에 반영합니다 (진행 상태를 저장할 때마다 별도 조회 없이 확인).
+        """
+        updates = ', '.join(f"{column} = excluded.{column}" for column in TASK_COLUMNS[1:]
+                            if column != "cancel_requested")
+        conn = self._conn()
+        with conn:
+            cancel_requested = conn.execute(
+                f"INSERT INTO tasks ({', '.join(TASK_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(TASK_COLUMNS))}) "
+                f"ON CONFLICT(task_id) DO UPDATE SET {updates}, "
+                f"cancel_requested = MAX(cancel_requested, excluded.cancel_requested) "
+                f"RETURNING cancel_requested",
+                self._to_row(task)
+            ).fetchone()[0]
+        if cancel_requested:
+            task.cancel_requested = True
+        if task.status in FINISHED_STATUSES:
+            with self._lock:
+                self._active.pop(task.task_id, None)
+
+    def get(self, task_id: str) -> Optional[CrawlerTask]:
+        """작업 조회 (실행 중이거나 끝난 작업은 메모리에서, 다른 워커의 진행 중 작업은 DB에서)"""
+        with self._lock:
+            task = self._active.get(task_id)
+            if task is None:
+                task = self._hot.get(task_id)
+                if task is not None and task.status not in FINISHED_STATUSES:
+                    task = None
+            if task is not None:
+                self.hits += 1
+                if task_id in self._hot:
+                    self._hot.move_to_end(task_id)
+                return task
+            self.misses += 1
+
+        task = self._read(task_id)
+        if task is not None:
+            self._remember(task)
+        return task
+
+    def _read(self, task_id: str) -> Optional[CrawlerTask]:
+        row = self._conn().execute(
+            f"SELECT {', '.join(TASK_COLUMNS)} FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        return self._from_row(row) if row else None
+
+    def add_export(self, task: CrawlerTask, format: str, path: str):
+        """생성한 결과 파일 기록 (다른 워커가 기록한 형식과 합쳐서 저장)"""
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT exports FROM tasks WHERE task_id = ?", (task.task_id,)).fetchone()
+            exports = json.loads(row[0] or "{}") if row else {}
+            exports[format] = path
+            conn.execute("UPDATE tasks SET exports = ? WHERE task_id = ?", (json.dumps(exports), task.task_id))
+        task.exports = exports
+
+    def is_active(self, task_id: str) -> bool:
+        """이 프로세스에서 실행 중인 작업인지"""
+        with self._lock:
+            return task_id in self._active
+
+    def request_cancel(self, task_id: str):
+        """작업 취소 요청 기록 (이 프로세스의 작업은 바로, 다른 프로세스의 작업은 다음 save()에서 반영)"""
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE tasks SET cancel_requested = 1, updated_at = ? WHERE task_id = ?", (time.time(), task_id)
+            )
+        with self._lock:
+            for tasks in (self._active, self._hot):
+                if task_id in tasks:
+                    tasks[task_id].cancel_requested = True
+
+    def is_cancel_requested(self, task_id: str) -> bool:
+        row = self._conn().execute("SELECT cancel_requested FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return bool(row and row[0])
+
+    # 리뷰
+
+    def add_reviews(self, task_id: str, reviews: List[dict]):
+        """한 페이지의 리뷰를 한 트랜잭션으로 기록"""
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO reviews (task_id, number, date, rating, reviewer, content, tags, has_photo) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (task_id, r.get("number"), r.get("date"), r.get("rating"), r.get("reviewer"),
+                     r.get("content"), r.get("tags"), 1 if r.get("has_photo") else 0)
+                    for r in reviews
+                ]
+            )
+
+    def iter_reviews(self, task_id: str, batch_size: int = 1000) -> Iterator[dict]:
+        """작업의 리뷰를 번호 순서대로 반환 (batch_size개씩 읽어 메모리 사용량 일정)"""
+        cursor = self._conn().execute(
+            f"SELECT {', '.join(REVIEW_COLUMNS)} FROM reviews WHERE task_id = ? ORDER BY number",
+            (task_id,)
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                review = dict(zip(REVIEW_COLUMNS, row))
+                review["has_photo"] = bool(review["has_photo"])
+                yield review
+
+    @staticmethod
+    def _rating_clause(rating_filter: Optional[List[int]]) -> tuple:
+        if not rating_filter:
+            return "", ()
+        placeholders = ', '.join('?' * len(rating_filter))
+        return f" AND CAST(rating AS INTEGER) IN ({placeholders})", tuple(rating_filter)
+
+    def find_cached_result(self, key: str, rating_filter: Optional[List[int]], max_reviews: int,
+                           max_age_seconds: float) -> Optional[str]:
+        """요청을 대신할 수 있는 최근 완료 작업 ID (없으면 None)
+
+        같은 제품을 max_age_seconds 안에 수집한 작업 중 평점 필터가 요청을 포함하고,
+        요청 필터로 걸렀을 때 max_reviews개 이상 남거나 해당 수집이 리뷰 목록의 마지막 페이지까지 모은 경우
+        (exhaustive로 기록된 작업) 사용합니다. 목표보다 적게 수집했더라도 중단/실패로 끝난 수집은 전체 결과로
+        보지 않습니다.
+        """
+        conn = self._conn()
+        candidates = conn.execute(
+            "SELECT task_id, rating_filter, exhaustive FROM tasks "
+            "WHERE product_key = ? AND status = ? AND finished_at >= ? "
+            "ORDER BY finished_at DESC LIMIT 20",
+            (key, TaskStatusEnum.COMPLETED.value, time.time() - max_age_seconds)
+        ).fetchall()
+        clause, params = self._rating_clause(rating_filter)
+        for task_id, cached_filter, exhaustive in candidates:
+            if not covers_rating_filter(json.loads(cached_filter) if cached_filter else None, rating_filter):
+                continue
+            if exhaustive:
+                return task_id
+            available = conn.execute(
+                f"SELECT COUNT(*) FROM reviews WHERE task_id = ?{clause}", (task_id, *params)
+            ).fetchone()[0]
+            if available >= max_reviews:
+                return task_id
+        return None
+
+    def copy_reviews(self, source_task_id: str, task_id: str,
+                     rating_filter: Optional[List[int]], limit: int) -> int:
+        """원본 작업의 리뷰를 평점 필터로 걸러 앞에서부터 limit개 복사 (번호는 1부터 다시 매김)"""
+        clause, params = self._rating_clause(rating_filter)
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO reviews (task_id, number, date, rating, reviewer, content, tags, has_photo) "
+                "SELECT ?, ROW_NUMBER() OVER (ORDER BY number), date, rating, reviewer, content, tags, has_photo "
+                f"FROM reviews WHERE task_id = ?{clause} ORDER BY number LIMIT ?",
+                (task_id, source_task_id, *params, limit)
+            )
+        return cursor.rowcount
+
+    # 제품별 수집 리뷰 (증분 수집)
+
+    def known_review_keys(self, key: str) -> Iterator[str]:
+        """제품에 대해 이미 수집한 리뷰 키 (문자열 집합을 만들지 않도록 하나씩 반환)"""
+        rows = self._conn().execute(
+            "SELECT review_key FROM product_reviews WHERE product_key = ?", (key,)
+        )
+        for row in rows:
+            yield row[0]
+
+    def product_review_count(self, key: str) -> int:
+        """제품에 대해 저장된 리뷰 수 (기록이 없거나 만료되었으면 0)"""
+        row = self._conn().execute(
+            "SELECT review_count FROM products WHERE product_key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def merge_into_product(self, task_id: str, key: str) -> int:
+        """작업에서 수집한 리뷰를 제품 데이터에 합치고 새로 추가된 개수 반환"""
+        reviews = list(self.iter_reviews(task_id))
+        crawled_at = time.time()
+        conn = self._conn()
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO product_reviews (product_key, review_key, crawled_at, position, "
+                "date, rating, reviewer, content, tags, has_photo) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (key, review_key(r), crawled_at, position, r["date"], r["rating"], r["reviewer"],
+                     r["content"], r["tags"], 1 if r["has_photo"] else 0)
+                    for position, r in enumerate(reviews)
+                ]
+            )
+            added = conn.total_changes - before
+            conn.execute(
+                "INSERT INTO products (product_key, review_count, last_crawled_at) "
+                "VALUES (?, (SELECT COUNT(*) FROM product_reviews WHERE product_key = ?), ?) "
+                "ON CONFLICT(product_key) DO UPDATE SET "
+                "review_count = excluded.review_count, last_crawled_at = excluded.last_crawled_at",
+                (key, key, crawled_at)
+            )
+        return added
+
+    def load_product_reviews(self, task_id: str, key: str,
+                             rating_filter: Optional[List[int]], limit: int) -> int:
+        """작업 결과를 제품 데이터(최근 수집분 먼저)로 교체하고 개수 반환"""
+        clause, params = self._rating_clause(rating_filter)
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM reviews WHERE task_id = ?", (task_id,))
+            cursor = conn.execute(
+                "INSERT INTO reviews (task_id, number, date, rating, reviewer, content, tags, has_photo) "
+                "SELECT ?, ROW_NUMBER() OVER (ORDER BY crawled_at DESC, position), "
+                "date, rating, reviewer, content, tags, has_photo "
+                f"FROM product_reviews WHERE product_key = ?{clause} "
+                "ORDER BY crawled_at DESC, position LIMIT ?",
+                (task_id, key, *params, limit)
+            )
+        return cursor.rowcount
+
+    # 일괄 수집
+
+    def add_batch(self, batch_id: str, task_ids: List[str], concurrency: int):
+        """일괄 수집 기록 (작업은 add()로 따로 저장)"""
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO batches (batch_id, task_ids, concurrency, created_at) VALUES (?, ?, ?, ?)",
+                (batch_id, json.dumps(task_ids), concurrency, time.time())
+            )
+
+    def get_batch(self, batch_id: str) -> Optional[dict]:
+        """일괄 수집 정보 (batch_id, task_ids, concurrency, exports, created_at), 없으면 None"""
+        row = self._conn().execute(
+            "SELECT task_ids, concurrency, exports, created_at FROM batches WHERE batch_id = ?", (batch_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "batch_id": batch_id,
+            "task_ids": json.loads(row[0]),
+            "concurrency": row[1],
+            "exports": json.loads(row[2] or "{}"),
+            "created_at": _datetime(row[3]),
+        }
+
+    def add_batch_export(self, batch_id: str, format: str, path: str):
+        """생성한 통합 결과 파일 기록"""
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT exports FROM batches WHERE batch_id = ?", (batch_id,)).fetchone()
+            exports = json.loads(row[0] or "{}") if row else {}
+            exports[format] = path
+            conn.execute("UPDATE batches SET exports = ? WHERE batch_id = ?", (json.dumps(exports), batch_id))
+
+    # 작업자 대기열
+
+    def enqueue_job(self, task: CrawlerTask):
+        """작업자 프로세스가 실행할 작업으로 대기열에 추가 (이 프로세스의 실행 목록에서는 제외)"""
+        self.save(task)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO jobs (task_id, max_reviews, status, enqueued_at) VALUES (?, ?, 'queued', ?)",
+                (task.task_id, task.max_reviews, time.time())
+            )
+        # 진행 상태는 작업자가 저장소에 기록하므로 이후 조회는 DB에서 읽음
+        with self._lock:
+            self._active.pop(task.task_id, None)
+            self._hot.pop(task.task_id, None)
+
+    def claim_job(self, worker_id: str) -> Optional[CrawlerTask]:
+        """대기 중인 작업 하나를 실행 중으로 표시하고 반환 (max_reviews가 작은 작업부터, 없으면 None)
+
+        가져간 작업은 이 프로세스에서 실행하는 작업으로 등록됩니다. 이미 끝난 작업이면 대기열에서 지우고 None.
+        """
+        conn = self._conn()
+        # 빈 대기열을 확인할 때는 쓰기 잠금을 잡지 않음
+        if conn.execute("SELECT 1 FROM jobs WHERE status = 'queued' LIMIT 1").fetchone() is None:
+            return None
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT task_id FROM jobs WHERE status = 'queued' ORDER BY max_reviews, enqueued_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker_id = ?, attempts = attempts + 1, heartbeat_at = ? "
+                "WHERE task_id = ?",
+                (worker_id, time.time(), row[0])
+            )
+        task = self._read(row[0])
+        if task is None or task.status in FINISHED_STATUSES:
+            self.finish_job(row[0])
+            return None
+        with self._lock:
+            self._active[task.task_id] = task
+        self._remember(task)
+        return task
+
+    def cancel_queued_job(self, task_id: str) -> bool:
+        """아직 작업자가 가져가지 않은 작업을 대기열에서 삭제 (삭제했으면 True)"""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE task_id = ? AND status = 'queued'", (task_id,))
+        return cursor.rowcount > 0
+
+    def finish_job(self, task_id: str):
+        """실행이 끝난 작업을 대기열에서 삭제 (작업 상태는 tasks에 남음)"""
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM jobs WHERE task_id = ?", (task_id,))
+
+    def job_status(self, task_id: str) -> Optional[str]:
+        """대기열의 작업 상태 ('queued', 'running', 대기열에 없으면 None)"""
+        row = self._conn().execute("SELECT status FROM jobs WHERE task_id = ?", (task_id,)).fetchone()
+        return row[0] if row else None
+
+    def job_position(self, task_id: str) -> Optional[int]:
+        """대기 중인 작업의 대기열 순번 (1부터, 대기 중이 아니면 None)"""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT max_reviews, enqueued_at FROM jobs WHERE task_id = ? AND status = 'queued'", (task_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = 'queued' "
+            "AND (max_reviews < ? OR (max_reviews = ? AND enqueued_at <= ?))",
+            (row[0], row[0], row[1])
+        ).fetchone()[0]
+
+    def heartbeat_worker(self, worker_id: str, task_id: Optional[str] = None):
+        """작업자가 살아 있음을 기록 (실행 중인 작업의 heartbeat도 함께 갱신)"""
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO workers (worker_id, task_id, started_at, heartbeat_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(worker_id) DO UPDATE SET task_id = excluded.task_id, heartbeat_at = excluded.heartbeat_at",
+                (worker_id, task_id, now, now)
+            )
+            conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE worker_id = ? AND status = 'running'", (now, worker_id)
+            )
+
+    def remove_worker(self, worker_id: str):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+
+    def live_workers(self, timeout: float) -> int:
+        """timeout초 안에 heartbeat를 보낸 작업자 수"""
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM workers WHERE heartbeat_at >= ?", (time.time() - timeout,)
+        ).fetchone()[0]
+
+    def requeue_stale_jobs(self, timeout: float, max_attempts: int = 2) -> tuple:
+        """timeout초 동안 heartbeat가 없는 실행 중 작업(작업자 종료/중단)을 다시 대기열에 넣음
+
+        수집하던 리뷰는 지우고 처음부터 다시 수집하며, max_attempts번 실행한 작업은 실패 처리합니다.
+        반환: (다시 넣은 작업 수, 실패 처리한 작업 수)
+        """
+        now = time.time()
+        cutoff = now - timeout
+        conn = self._conn()
+        if conn.execute(
+            "SELECT 1 FROM jobs WHERE status = 'running' AND heartbeat_at < ? LIMIT 1", (cutoff,)
+        ).fetchone() is None:
+            return 0, 0
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT task_id, attempts FROM jobs WHERE status = 'running' AND heartbeat_at < ?", (cutoff,)
+            ).fetchall()
+            retry = [task_id for task_id, attempts in rows if attempts < max_attempts]
+            give_up = [task_id for task_id, attempts in rows if attempts >= max_attempts]
+            conn.executemany(
+                "UPDATE jobs SET status = 'queued', worker_id = NULL, heartbeat_at = NULL WHERE task_id = ?",
+                [(task_id,) for task_id in retry]
+            )
+            conn.executemany("DELETE FROM reviews WHERE task_id = ?", [(task_id,) for task_id in retry])
+            conn.executemany(
+                "UPDATE tasks SET status = ?, progress = 0, collected_count = 0, updated_at = ?, "
+                "message = '작업자가 응답하지 않아 다시 대기열에 넣었습니다' WHERE task_id = ?",
+                [(TaskStatusEnum.PENDING.value, now, task_id) for task_id in retry]
+            )
+            conn.executemany("DELETE FROM jobs WHERE task_id = ?", [(task_id,) for task_id in give_up])
+            conn.executemany(
+                "UPDATE tasks SET status = ?, updated_at = ?, finished_at = ?, error = 'worker timeout', "
+                "message = '크롤링 실패: 작업자가 응답하지 않습니다' WHERE task_id = ?",
+                [(TaskStatusEnum.FAILED.value, now, now, task_id) for task_id in give_up]
+            )
+            conn.execute("DELETE FROM workers WHERE heartbeat_at < ?", (cutoff,))
+        return len(retry), len(give_up)
+
+    def review_sink(self, task_id: str) -> "TaskReviewSink":
+        return TaskReviewSink(self, task_id)
+
+    # 정리
+
+    def evict_expired(self, force: bool = False) -> int:
+        """TTL이 지난 작업과 리뷰, 결과 파일, 오래된 제품 데이터 삭제 (evict_interval마다 한 번만 실행)"""
+        now = time.time()
+        if not force and now - self._last_evicted < self.evict_interval:
+            return 0
+        self._last_evicted = now
+        cutoff = now - self.ttl_seconds
+
+        conn = self._conn()
+        # 끝난 작업은 종료 시각, 끝나지 않은 작업(종료된 워커가 남긴 작업)은 마지막 갱신 시각 기준
+        rows = conn.execute(
+            "SELECT task_id, exports FROM tasks WHERE COALESCE(finished_at, updated_at) < ?",
+            (cutoff,)
+        ).fetchall()
+        with self._lock:
+            expired = [(task_id, exports) for task_id, exports in rows if task_id not in self._active]
+        self._evict_products(now)
+        self._evict_batches(cutoff)
+        if not expired:
+            return 0
+
+        with conn:
+            conn.executemany("DELETE FROM reviews WHERE task_id = ?", [(task_id,) for task_id, _ in expired])
+            conn.executemany("DELETE FROM tasks WHERE task_id = ?", [(task_id,) for task_id, _ in expired])
+
+        for task_id, exports in expired:
+            with self._lock:
+                self._hot.pop(task_id, None)
+            for path in json.loads(exports or "{}").values():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        self.evicted += len(expired)
+        return len(expired)
+
+    def _evict_batches(self, cutoff: float):
+        """cutoff 이전에 만든 일괄 수집과 통합 결과 파일 삭제 (작업은 각자의 TTL로 삭제)"""
+        conn = self._conn()
+        rows = conn.execute("SELECT batch_id, exports FROM batches WHERE created_at < ?", (cutoff,)).fetchall()
+        if not rows:
+            return
+        with conn:
+            conn.executemany("DELETE FROM batches WHERE batch_id = ?", [(batch_id,) for batch_id, _ in rows])
+        for _, exports in rows:
+            for path in json.loads(exports or "{}").values():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _evict_products(self, now: float):
+        """product_ttl_seconds 동안 수집하지 않은 제품의 수집 리뷰 삭제"""
+        conn = self._conn()
+        cutoff = now - self.product_ttl_seconds
+        with conn:
+            conn.execute(
+                "DELETE FROM product_reviews WHERE product_key IN "
+                "(SELECT product_key FROM products WHERE last_crawled_at < ?)", (cutoff,)
+            )
+            conn.execute("DELETE FROM products WHERE last_crawled_at < ?", (cutoff,))
+
+    def stats(self) -> dict:
+        conn = self._conn()
+        with self._lock:
+            hot = len(self._hot)
+            active = len(self._active)
+        return {
+            "path": self.path,
+            "tasks": conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0],
+            "reviews": conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0],
+            "products": conn.execute("SELECT COUNT(*) FROM products").fetchone()[0],
+            "batches": conn.execute("SELECT COUNT(*) FROM batches").fetchone()[0],
+            "queued_jobs": conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0],
+            "running_jobs": conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'running'").fetchone()[0],
+            "workers": conn.execute("SELECT COUNT(*) FROM workers").fetchone()[0],
+            "hot": hot,
+            "hot_size": self.hot_size,
+            "active": active,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+        }
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class TaskReviewSink(ReviewSink):
+    """크롤러가 페이지마다 넘기는 리뷰를 작업 저장소에 기록하는 sink"""
+
+    def __init__(self, store: TaskStore, task_id: str):
+        self.store = store
+        self.task_id = task_id
+
+    def write_page(self, reviews):
+        if reviews:
+            self.store.add_reviews(self.task_id, reviews)
+
+    def iter_reviews(self):
+        return self.store.iter_reviews(self.task_id)
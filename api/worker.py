@@ -0,0 +1,176 @@
+"""크롤링 작업자 프로세스
+
+API 서버를 CRAWL_QUEUE=1로 실행하면 크롤링 요청을 작업 저장소(SQLite)의 대기열에 넣기만 하고,
+작업자 프로세스가 대기열에서 작업을 하나씩 가져가 NaverSmartStoreReviewCrawler로 실행합니다.
+진행 상태와 리뷰는 같은 저장소에 기록되므로 API 서버의 /api/status, SSE, 다운로드가 그대로 동작하고,
+Chrome이 멈추거나 메모리가 부족해도 API 서버 프로세스에는 영향이 없습니다.
+
+작업자는 heartbeat를 주기적으로 기록하며, WORKER_HEARTBEAT_TIMEOUT 동안 heartbeat가 없는 작업자의
+작업은 다른 작업자가 처음부터 다시 실행합니다 (WORKER_MAX_ATTEMPTS번 실행하면 실패 처리).
+
+실행 (API 서버와 같은 TASK_DB_PATH를 쓰도록 api 디렉토리에서):
+    CRAWL_QUEUE=1 uvicorn main:app --port 8000
+    python worker.py --processes 2
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from typing import Optional
+
+from services.scheduler import get_available_memory_mb
+
+
+class CrawlWorker:
+    """작업 저장소의 대기열에서 작업을 가져가 한 번에 하나씩 실행하는 작업자"""
+
+    def __init__(self, service, poll_interval: float = 1.0, heartbeat_interval: float = 10.0,
+                 heartbeat_timeout: float = 60.0, max_attempts: int = 2, min_free_memory_mb: int = 400):
+        self.service = service
+        self.store = service.store
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max_attempts
+        self.min_free_memory_mb = min_free_memory_mb
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        # heartbeat는 실행 중인 작업이 끝난 뒤에 멈춤 (stop() 뒤에도 작업이 끝날 때까지 다른 작업자가 가져가지 않도록)
+        self._heartbeat_stop = threading.Event()
+        self._current: Optional[str] = None
+        self._last_requeue = 0.0
+
+        # 통계
+        self.completed = 0
+        self.failed = 0
+
+    def stop(self):
+        """지금 실행 중인 작업을 끝낸 뒤 종료"""
+        self._stop.set()
+
+    def _heartbeat_loop(self):
+        """heartbeat 기록과 함께 실행 중인 작업의 취소 요청 확인
+
+        진행 상태를 저장할 때도 취소 요청이 반영되지만, 페이지 로딩이 멈춰 저장이 없을 때도
+        드라이버 강제 종료(CANCEL_GRACE_SECONDS)가 시작되도록 여기서 한 번 더 확인합니다.
+        """
+        while not self._heartbeat_stop.wait(self.heartbeat_interval):
+            try:
+                current = self._current
+                self.store.heartbeat_worker(self.worker_id, current)
+                if current and self.store.is_cancel_requested(current):
+                    self.service.stop_running(current, "cancelled")
+            except Exception as e:
+                print(f"⚠️  [{self.worker_id}] heartbeat 기록 실패: {e}")
+
+    def _requeue_stale(self):
+        """응답 없는 작업자의 작업을 다시 대기열에 넣음 (heartbeat 간격마다 한 번)"""
+        now = time.time()
+        if now - self._last_requeue < self.heartbeat_interval:
+            return
+        self._last_requeue = now
+        requeued, failed = self.store.requeue_stale_jobs(self.heartbeat_timeout, self.max_attempts)
+        if requeued or failed:
+            print(f"♻️  [{self.worker_id}] 응답 없는 작업 {requeued}개 재시도, {failed}개 실패 처리")
+
+    def run_once(self) -> bool:
+        """대기열에서 작업 하나를 실행 (실행한 작업이 없으면 False)"""
+        self._requeue_stale()
+        available = get_available_memory_mb()
+        if available is not None and available < self.min_free_memory_mb:
+            return False
+        task = self.store.claim_job(self.worker_id)
+        if task is None:
+            return False
+
+        self._current = task.task_id
+        self.store.heartbeat_worker(self.worker_id, task.task_id)
+        print(f"▶️  [{self.worker_id}] {task.task_id} 시작 ({task.product_url}, 최대 {task.max_reviews}개)")
+        try:
+            if self.service._run_sync_crawler(task):
+                self.completed += 1
+            else:
+                self.failed += 1
+        finally:
+            self.store.finish_job(task.task_id)
+            self._current = None
+            self.store.heartbeat_worker(self.worker_id, None)
+        print(f"⏹️  [{self.worker_id}] {task.task_id} {task.status.value} ({task.collected_count}개)")
+        return True
+
+    def run(self):
+        """stop()이 호출될 때까지 대기열의 작업을 실행"""
+        self.store.heartbeat_worker(self.worker_id, None)
+        heartbeat = threading.Thread(target=self._heartbeat_loop, name="worker-heartbeat", daemon=True)
+        heartbeat.start()
+        print(f"👷 작업자 {self.worker_id} 시작 (저장소: {self.store.path})")
+        if not self.service.tab_engines:
+            self.service.driver_pool.warm()
+        try:
+            while not self._stop.is_set():
+                if not self.run_once():
+                    self._stop.wait(self.poll_interval)
+        finally:
+            self._stop.set()
+            self._heartbeat_stop.set()
+            heartbeat.join()
+            self.store.remove_worker(self.worker_id)
+            self.service.shutdown()
+            print(f"👋 작업자 {self.worker_id} 종료 (완료 {self.completed}개, 실패 {self.failed}개)")
+
+
+def run_worker(poll_interval: float = 1.0):
+    """작업자 하나를 실행 (SIGTERM/SIGINT를 받으면 실행 중인 작업을 끝내고 종료)"""
+    from services.crawler_service import crawler_service
+
+    worker = CrawlWorker(
+        crawler_service,
+        poll_interval=poll_interval,
+        heartbeat_interval=float(os.getenv("WORKER_HEARTBEAT_INTERVAL", "10")),
+        heartbeat_timeout=crawler_service.worker_timeout,
+        max_attempts=int(os.getenv("WORKER_MAX_ATTEMPTS", "2")),
+        min_free_memory_mb=crawler_service.scheduler.min_free_memory_mb,
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: worker.stop())
+    worker.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 작업자 (CRAWL_QUEUE=1인 API 서버의 대기열 실행)")
+    parser.add_argument('--processes', type=int, default=int(os.getenv("WORKER_PROCESSES", "1")),
+                        help="실행할 작업자 프로세스 수 (각각 한 번에 작업 하나)")
+    parser.add_argument('--poll-interval', type=float, default=1.0, help="대기열이 비었을 때 확인 간격 (초)")
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        run_worker(args.poll_interval)
+        return 0
+
+    # 작업자마다 별도 프로세스 (SQLite 연결과 스레드를 물려받지 않도록 spawn)
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_worker, args=(args.poll_interval,), name=f"crawl-worker-{i + 1}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def forward(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                os.kill(process.pid, signum)
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    for process in processes:
+        process.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
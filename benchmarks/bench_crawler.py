@@ -0,0 +1,249 @@
+"""크롤러 전체 흐름 벤치마크 (네이버 접속 없음)
+
+fake_smartstore.py의 로컬 가짜 스마트스토어를 띄우고 NaverSmartStoreReviewCrawler로
+드라이버 실행 → 제품 페이지 → 리뷰 탭 → 페이지별 수집까지 그대로 실행합니다.
+  - pages/s, reviews/s: 크롤러가 기록한 페이지/리뷰 수 (telemetry 카운터) ÷ 전체 시간
+  - peak RSS: 이 프로세스와 하위 프로세스(chromedriver, Chrome) 메모리 합계의 최댓값
+  - 단계별 시간: crawler_phase_seconds 히스토그램의 실행 전후 차이
+
+--output으로 결과를 JSON으로 저장하고, 다음 실행에서 --baseline으로 넘기면
+처리량이 --max-regression 비율보다 떨어지거나 peak RSS가 그만큼 늘었을 때 종료 코드 1을 반환합니다.
+Chrome과 chromedriver가 설치되어 있어야 합니다.
+
+실행:
+    python benchmarks/bench_crawler.py --reviews 600 --latency-ms 150 --output bench.json
+    python benchmarks/bench_crawler.py --reviews 600 --latency-ms 150 --baseline bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bs_crwal import NaverSmartStoreReviewCrawler
+from fake_smartstore import FakeSmartStore
+from telemetry import PAGES, PHASE_SECONDS, REVIEWS
+
+
+# 기준 결과와 비교하는 지표 (이름, 클수록 좋은지)
+COMPARED_METRICS = (
+    ('pages_per_second', True),
+    ('reviews_per_second', True),
+    ('peak_rss_mb', False),
+)
+
+
+def _read_rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _children(root_pid):
+    """root_pid의 모든 하위 프로세스 (Linux /proc 기준)"""
+    parents = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat") as f:
+                # 두 번째 필드(프로세스 이름)에 공백이 있을 수 있으므로 마지막 ')' 뒤에서 자름
+                fields = f.read().rsplit(')', 1)[1].split()
+            parents.setdefault(int(fields[1]), []).append(int(name))
+        except (OSError, IndexError, ValueError):
+            continue
+    found, stack = [], [root_pid]
+    while stack:
+        for child in parents.get(stack.pop(), ()):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+class RssSampler:
+    """이 프로세스 + 하위 프로세스의 RSS 합계를 주기적으로 측정해 최댓값을 보관
+
+    /proc가 없으면 getrusage의 ru_maxrss(이 프로세스와 종료된 하위 프로세스 중 최대)로 대신합니다.
+    """
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._has_proc = os.path.exists(f"/proc/{os.getpid()}/status")
+
+    def sample(self):
+        pid = os.getpid()
+        total = _read_rss_kb(pid) + sum(_read_rss_kb(child) for child in _children(pid))
+        self.peak_kb = max(self.peak_kb, total)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        if self._has_proc:
+            self.sample()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+        else:
+            usage = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+            # Linux는 KB, macOS는 바이트 단위
+            self.peak_kb = usage // 1024 if sys.platform == 'darwin' else usage
+
+    @property
+    def peak_mb(self):
+        return self.peak_kb / 1024
+
+
+def _phase_totals():
+    return {key[0]: total for key, (total, _count) in PHASE_SECONDS.totals().items()}
+
+
+def run_once(store, args, product_id):
+    """제품 하나를 처음부터 끝까지 수집하고 측정값을 반환"""
+    phases_before = _phase_totals()
+    pages_before, reviews_before = PAGES.value(), REVIEWS.value()
+
+    crawler = NaverSmartStoreReviewCrawler(
+        store.product_url(product_id),
+        rating_filter=args.rating,
+        extract_mode=args.extract_mode,
+        shards=args.shards,
+        keep_in_memory=True,
+    )
+    log = io.StringIO()
+    start = time.perf_counter()
+    with RssSampler() as rss:
+        try:
+            with contextlib.redirect_stdout(sys.stdout if args.verbose else log):
+                crawler.setup_driver()
+                crawler.navigate_to_product()
+                crawler.click_review_tab()
+                crawler.collect_reviews(args.max_reviews or args.reviews)
+        finally:
+            crawler.close()
+    elapsed = time.perf_counter() - start
+
+    phases_after = _phase_totals()
+    pages = PAGES.value() - pages_before
+    reviews = REVIEWS.value() - reviews_before
+    return {
+        'product_id': product_id,
+        'seconds': elapsed,
+        'pages': pages,
+        'reviews': reviews,
+        'collected': crawler.collected_count,
+        'pages_per_second': pages / elapsed if elapsed else 0.0,
+        'reviews_per_second': reviews / elapsed if elapsed else 0.0,
+        'peak_rss_mb': rss.peak_mb,
+        'phases': {
+            phase: phases_after[phase] - phases_before.get(phase, 0.0)
+            for phase in sorted(phases_after)
+            if phases_after[phase] - phases_before.get(phase, 0.0) > 0
+        },
+    }
+
+
+def summarize(runs):
+    """여러 번 실행한 결과의 중앙값"""
+    summary = {
+        name: statistics.median(run[name] for run in runs)
+        for name in ('seconds', 'pages', 'reviews', 'pages_per_second', 'reviews_per_second', 'peak_rss_mb')
+    }
+    phases = sorted({phase for run in runs for phase in run['phases']})
+    summary['phases'] = {phase: statistics.median(run['phases'].get(phase, 0.0) for run in runs) for phase in phases}
+    return summary
+
+
+def compare(summary, baseline, max_regression):
+    """기준 결과보다 max_regression 비율 이상 나빠진 지표 목록"""
+    regressions = []
+    for name, higher_is_better in COMPARED_METRICS:
+        base = baseline.get(name)
+        if not base:
+            continue
+        change = (summary[name] - base) / base
+        if (higher_is_better and change < -max_regression) or (not higher_is_better and change > max_regression):
+            regressions.append((name, base, summary[name], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 전체 흐름 벤치마크 (로컬 가짜 스마트스토어)")
+    parser.add_argument('--reviews', type=int, default=600, help="제품당 리뷰 수")
+    parser.add_argument('--max-reviews', type=int, default=None, help="수집 목표 (기본: --reviews)")
+    parser.add_argument('--latency-ms', type=int, default=150, help="클릭 후 목록을 다시 그릴 때까지의 평균 지연")
+    parser.add_argument('--jitter-ms', type=int, default=50, help="지연의 최대 편차")
+    parser.add_argument('--rating', type=int, nargs='+', default=None, help="평점 필터 (예: --rating 1 2)")
+    parser.add_argument('--shards', type=int, default=1, help="페이지 그룹 병렬 수집 드라이버 수")
+    parser.add_argument('--extract-mode', choices=['script', 'html'], default='script')
+    parser.add_argument('--products', type=int, default=1, help="실행마다 차례로 수집할 제품 수")
+    parser.add_argument('--repeat', type=int, default=1, help="반복 횟수 (결과는 중앙값)")
+    parser.add_argument('--output', default=None, help="결과를 저장할 JSON 파일")
+    parser.add_argument('--baseline', default=None, help="비교할 기준 결과 JSON (--output으로 저장한 파일)")
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help="허용하는 최대 성능 저하 비율 (기본 0.2 = 20%%)")
+    parser.add_argument('--verbose', action='store_true', help="크롤러 진행 로그 출력")
+    args = parser.parse_args()
+
+    runs = []
+    with FakeSmartStore(args.reviews, args.latency_ms, args.jitter_ms) as store:
+        print(f"가짜 스마트스토어: {store.base_url} (리뷰 {args.reviews}개, 지연 {args.latency_ms}±{args.jitter_ms}ms)")
+        print(f"{'run':>4} {'product':>8} {'seconds':>9} {'pages':>6} {'reviews':>8} {'pages/s':>8} {'reviews/s':>10} {'peak MB':>8}")
+        for repeat in range(args.repeat):
+            for product_id in range(1, args.products + 1):
+                run = run_once(store, args, product_id)
+                runs.append(run)
+                print(f"{repeat + 1:>4} {product_id:>8} {run['seconds']:>9.2f} {run['pages']:>6} {run['reviews']:>8} "
+                      f"{run['pages_per_second']:>8.2f} {run['reviews_per_second']:>10.1f} {run['peak_rss_mb']:>8.0f}")
+
+    summary = summarize(runs)
+    print(f"\n단계별 시간 (중앙값, 초)")
+    for phase, seconds in sorted(summary['phases'].items(), key=lambda item: -item[1]):
+        print(f"  {phase:>14} {seconds:>9.2f}")
+    print(f"\n중앙값: {summary['pages_per_second']:.2f} pages/s, {summary['reviews_per_second']:.1f} reviews/s, "
+          f"peak RSS {summary['peak_rss_mb']:.0f}MB")
+
+    if args.output:
+        config = {key: value for key, value in vars(args).items() if key not in ('output', 'baseline', 'verbose')}
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'config': config, 'summary': summary, 'runs': runs}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['summary']
+        regressions = compare(summary, baseline, args.max_regression)
+        if regressions:
+            print(f"\n❌ 기준 대비 {args.max_regression:.0%} 넘게 나빠진 지표")
+            for name, base, value, change in regressions:
+                print(f"  {name:>18} {base:>9.2f} → {value:>9.2f} ({change:+.0%})")
+            return 1
+        print(f"\n✅ 기준 대비 성능 저하 없음 (허용 {args.max_regression:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""리뷰 중복 제거 벤치마크
+
+같은 리뷰 키로 세 가지 방식을 비교합니다.
+  - str set: 기존 방식 (리뷰 키 문자열 집합)
+  - HashSet: review_dedup.HashSet (64비트 해시 배열)
+  - Bloom: review_dedup.BloomFilter (키 수에 맞춘 크기, 오탐률은 없는 키로 측정)
+
+실행:
+    python benchmarks/bench_dedup.py --keys 10000 100000 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from review_dedup import BloomFilter, HashSet, key_hash
+
+
+def sample_keys(n, prefix=''):
+    for i in range(n):
+        yield f"{prefix}24.0{i % 9 + 1}.1{i % 10}_user{i % 97}***_배송이 빠르고 포장이 꼼꼼해요. 재구매 의사 있습니다 {i}"
+
+
+def bench_str_set(n):
+    start = time.perf_counter()
+    keys = set(sample_keys(n))
+    elapsed = time.perf_counter() - start
+    size = sys.getsizeof(keys) + sum(sys.getsizeof(k) for k in keys)
+    return elapsed, size, None
+
+
+def bench_hash_set(n):
+    start = time.perf_counter()
+    hashes = HashSet.from_keys(sample_keys(n))
+    elapsed = time.perf_counter() - start
+    return elapsed, hashes.memory_bytes, None
+
+
+def bench_bloom(n, error_rate):
+    bloom = BloomFilter.for_capacity(n, error_rate)
+    start = time.perf_counter()
+    for key in sample_keys(n):
+        bloom.add(key_hash(key))
+    elapsed = time.perf_counter() - start
+    probes = min(n, 100000)
+    false_positives = sum(key_hash(key) in bloom for key in sample_keys(probes, prefix='x'))
+    return elapsed, bloom.memory_bytes, false_positives / probes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리뷰 중복 제거 벤치마크")
+    parser.add_argument('--keys', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--error-rate', type=float, default=0.001, help="Bloom 필터 목표 오탐률")
+    args = parser.parse_args()
+
+    print(f"{'keys':>9} {'method':>9} {'seconds':>9} {'bytes/key':>10} {'fp rate':>9}")
+    for n in args.keys:
+        for name, run in (('str set', bench_str_set), ('HashSet', bench_hash_set),
+                          ('Bloom', lambda n: bench_bloom(n, args.error_rate))):
+            elapsed, size, fp_rate = run(n)
+            fp_text = f"{fp_rate:.4%}" if fp_rate is not None else '-'
+            print(f"{n:>9} {name:>9} {elapsed:>9.2f} {size / n:>10.1f} {fp_text:>9}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
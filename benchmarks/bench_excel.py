@@ -0,0 +1,115 @@
+"""Excel 저장 벤치마크
+
+같은 리뷰 데이터를 두 방식으로 저장해 시간과 최대 메모리를 비교합니다.
+(최대 메모리는 tracemalloc으로 한 번 더 저장해 측정하며, --no-memory로 생략할 수 있습니다.)
+  - legacy: 기존 방식 (DataFrame → pd.ExcelWriter, 저장 후 iter_rows로 셀마다 서식 객체 생성)
+  - streaming: review_sink.write_excel (쓰기 전용 모드, 열별 공유 서식)
+
+실행:
+    python benchmarks/bench_excel.py --rows 1000 10000 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+from review_sink import EXCEL_COLUMN_WIDTHS, EXCEL_HEADERS, write_excel
+
+
+def sample_reviews(n):
+    for i in range(n):
+        yield {
+            'content': f"배송이 빠르고 포장이 꼼꼼해요. 재구매 의사 있습니다. 한달사용 후기입니다 {i}",
+            'rating': str(i % 5 + 1),
+            'date': f"24.0{i % 9 + 1}.1{i % 10}",
+            'reviewer': f"user{i % 97}***",
+            'has_photo': i % 3 == 0,
+            'tags': '재구매, 한달사용' if i % 2 else '',
+            'number': i + 1,
+        }
+
+
+def legacy_excel(reviews, filename):
+    """기존 save_to_excel 구현"""
+    df = pd.DataFrame(list(reviews))
+    df = df.rename(columns={k: v for k, v in EXCEL_HEADERS.items() if k in df.columns})
+    df['사진리뷰'] = df['사진리뷰'].apply(lambda x: 'O' if x else 'X')
+
+    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='리뷰데이터')
+        worksheet = writer.sheets['리뷰데이터']
+
+        for key, width in EXCEL_COLUMN_WIDTHS.items():
+            col_idx = list(df.columns).index(EXCEL_HEADERS[key]) + 1
+            col_letter = worksheet.cell(row=1, column=col_idx).column_letter
+            worksheet.column_dimensions[col_letter].width = width
+
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF", size=11)
+        for cell in worksheet[1]:
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+
+        thin_border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+        for row in worksheet.iter_rows(min_row=2, max_row=len(df) + 1):
+            for cell in row:
+                cell.border = thin_border
+                cell.alignment = Alignment(vertical='top', wrap_text=True)
+                if cell.column_letter in ['A', 'C', 'G']:
+                    cell.alignment = Alignment(horizontal='center', vertical='center')
+
+
+def measure(fn, rows, directory, trace_memory=True):
+    filename = os.path.join(directory, f"{fn.__name__}_{rows}.xlsx")
+    start = time.perf_counter()
+    fn(sample_reviews(rows), filename)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(filename)
+
+    peak = None
+    if trace_memory:
+        # tracemalloc은 실행을 크게 느리게 하므로 시간 측정과 따로 실행
+        tracemalloc.start()
+        fn(sample_reviews(rows), filename)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak = peak / 1024 / 1024
+    os.remove(filename)
+    return elapsed, peak, size / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel 저장 벤치마크")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--skip-legacy-above', type=int, default=None,
+                        help="이 행 수보다 크면 legacy 측정 생략")
+    parser.add_argument('--no-memory', action='store_true', help="최대 메모리 측정 생략")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'method':>10} {'seconds':>9} {'peak MB':>9} {'file KB':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            methods = [('streaming', write_excel)]
+            if args.skip_legacy_above is None or rows <= args.skip_legacy_above:
+                methods.insert(0, ('legacy', legacy_excel))
+            for name, fn in methods:
+                elapsed, peak, size = measure(fn, rows, directory, not args.no_memory)
+                peak_text = f"{peak:.1f}" if peak is not None else '-'
+                print(f"{rows:>8} {name:>10} {elapsed:>9.2f} {peak_text:>9} {size:>9.0f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
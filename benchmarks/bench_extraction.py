@@ -0,0 +1,122 @@
+"""추출 규칙 마이크로벤치마크
+
+항목(리뷰 1개)당 파싱 비용을 측정합니다.
+  - legacy: 기존 방식 (매번 re.search/re.match, 중첩 if 줄 필터)
+  - rules: 컴파일된 추출 규칙 (정규식 한 번 컴파일, 단일 패스 줄 분류)
+  - offline_html: review_parser로 HTML 페이지 전체 파싱 (항목당 환산)
+
+실행:
+    python benchmarks/bench_extraction.py --items 2000
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extraction_rules import ExtractionRules, DEFAULT_RULES_PATH
+from review_parser import extract_items
+
+
+def sample_text(i):
+    return "\n".join([
+        f"user{i % 97}***",
+        f"24.0{i % 9 + 1}.1{i % 10}",
+        f"평점{i % 5 + 1}",
+        "옵션: 1개 / 대용량",
+        f"배송이 빠르고 포장이 꼼꼼해요. 재구매 의사 있습니다 {i}",
+        "한달사용 후기입니다. 가성비 좋아요",
+        "신고",
+    ])
+
+
+def sample_html(n):
+    items = []
+    for i in range(n):
+        items.append(
+            f"<li><div><strong>user{i % 97}***</strong><span>24.0{i % 9 + 1}.1{i % 10}</span></div>"
+            f"<div><span class='blind'>평점</span><em>{i % 5 + 1}</em></div>"
+            f"<div class='HakaEZ240l'>배송이 빠르고 포장이 꼼꼼해요. 재구매 의사 있습니다 {i}</div>"
+            f"<img src='p.png'><img src='r{i}.jpg'><button>신고</button></li>"
+        )
+    return (
+        "<div id='REVIEW'><div class='JHZoCyHfg7'><div class='HTT4L8U0CU'><ul>"
+        + "".join(items)
+        + "</ul></div></div></div>"
+    )
+
+
+def legacy_parse(full_text):
+    review = {}
+    rating_match = re.search(r'평점\s*(\d+)', full_text)
+    if rating_match:
+        review['rating'] = rating_match.group(1)
+    lines = full_text.split('\n')
+    content_lines = []
+    for line in lines:
+        line = line.strip()
+        if len(line) > 5:
+            if not re.match(r'^평점\d+$', line):
+                if not re.match(r'^\d{2}\.\d{2}\.\d{2}$', line):
+                    if '신고' not in line:
+                        if not re.match(r'^[a-z0-9*]+$', line):
+                            content_lines.append(line)
+    review['content'] = ' '.join(content_lines)
+    date_match = re.search(r'(\d{2}\.\d{2}\.\d{2})', full_text)
+    review['date'] = date_match.group(1) if date_match else ''
+    reviewer_match = re.search(r'([a-z0-9*]+)\s*\d{2}\.\d{2}\.\d{2}', full_text)
+    review['reviewer'] = reviewer_match.group(1) if reviewer_match else ''
+    tags = [k for k in ['유통기한', '포장', '편리', '배송', '한달사용', '재구매', '가성비'] if k in full_text]
+    review['tags'] = ', '.join(tags)
+    return review
+
+
+def rules_parse(rules, full_text):
+    review = {}
+    for field in rules.fields:
+        value = field.match(full_text)
+        if not value and field.fallback == 'line_filter':
+            value = rules.filter_lines(full_text)
+        review[field.name] = value
+    review['tags'] = rules.extract_tags(full_text)
+    return review
+
+
+def measure(label, fn, n, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<14} {best / n * 1e6:8.2f} µs/item   ({n} items, best of {repeat})")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추출 규칙 마이크로벤치마크")
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rules = ExtractionRules.load(DEFAULT_RULES_PATH)
+    texts = [sample_text(i) for i in range(args.items)]
+    html = sample_html(args.items)
+
+    # 두 방식의 결과가 같은지 먼저 확인
+    for text in texts[:50]:
+        legacy = legacy_parse(text)
+        compiled = rules_parse(rules, text)
+        assert legacy['content'] == compiled['content'], (legacy, compiled)
+
+    print("=" * 60)
+    legacy_time = measure("legacy", lambda: [legacy_parse(t) for t in texts], args.items, args.repeat)
+    rules_time = measure("rules", lambda: [rules_parse(rules, t) for t in texts], args.items, args.repeat)
+    measure("offline_html", lambda: extract_items(html, rules=rules), args.items, args.repeat)
+    print("-" * 60)
+    print(f"rules / legacy: {rules_time / legacy_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
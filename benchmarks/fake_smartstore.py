@@ -0,0 +1,248 @@
+"""로컬 가짜 스마트스토어 서버
+
+크롤러가 사용하는 리뷰 영역 구조를 그대로 재현한 제품 페이지를 제공합니다.
+  - 리뷰 탭 a[href='#REVIEW'], 목록 #REVIEW div.JHZoCyHfg7 div.HTT4L8U0CU ul > li
+  - 페이지 버튼: 그룹마다 '이전'(nth-child 1), 페이지 번호(2~11), '다음' 버튼 (a.JY2WGJ4hXh.I3i1NSoFdB)
+  - 정렬 버튼(랭킹순/최신순/평점 높은순/평점 낮은순)과 평점 필터('전체 평점' → 'N점')
+  - 클릭할 때마다 latency ± jitter 밀리초 뒤에 목록을 다시 그림 (리뷰 XHR 응답 지연 재현)
+
+리뷰는 제품 번호를 시드로 브라우저에서 생성하므로 같은 설정이면 항상 같은 목록입니다.
+
+실행 (브라우저로 확인용):
+    python benchmarks/fake_smartstore.py --port 8765 --reviews 500 --latency-ms 150
+    → http://127.0.0.1:8765/products/1
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+PRODUCT_PATH_RE = re.compile(r'^/products/(\d+)$')
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>가짜 스마트스토어 제품 {product_id}</title>
+<style>
+body {{ font-family: sans-serif; margin: 0; }}
+.hero {{ height: 1200px; background: #eee; }}
+.tabs a {{ display: inline-block; padding: 12px 24px; }}
+#REVIEW ul {{ list-style: none; padding: 0; }}
+#REVIEW li {{ border-bottom: 1px solid #ddd; padding: 12px; }}
+.HTT4L8U0CU > div > div > a {{ display: inline-block; padding: 4px 8px; cursor: pointer; }}
+.rating-options {{ display: none; }}
+.rating-options.open {{ display: block; }}
+</style>
+</head>
+<body>
+<div class="hero">제품 {product_id}</div>
+<div class="tabs"><a href="#DETAIL">상세정보</a><a href="#REVIEW">리뷰</a></div>
+<div id="REVIEW">
+  <div class="sort">
+    <a data-sort="ranking">랭킹순</a> <a data-sort="latest">최신순</a>
+    <a data-sort="rating_high">평점 높은순</a> <a data-sort="rating_low">평점 낮은순</a>
+  </div>
+  <div class="rating-filter">
+    <button type="button" class="rating-toggle">전체 평점</button>
+    <div class="rating-options"></div>
+  </div>
+  <div class="JHZoCyHfg7"><div class="HTT4L8U0CU"><ul></ul><div><div></div></div></div></div>
+</div>
+<script>
+var CONFIG = {config};
+var PAGE_SIZE = 20;
+
+function rand(i, salt) {{
+  var x = Math.sin(i * 12.9898 + CONFIG.seed * 78.233 + salt * 37.719) * 43758.5453;
+  return x - Math.floor(x);
+}}
+function pad(n) {{ return (n < 10 ? '0' : '') + n; }}
+
+var ALL = [];
+for (var i = 0; i < CONFIG.reviews; i++) {{
+  var r = rand(i, 1);
+  var rating = r < 0.55 ? 5 : r < 0.8 ? 4 : r < 0.9 ? 3 : r < 0.95 ? 2 : 1;
+  var day = Math.floor(rand(i, 2) * 700);
+  var date = new Date(2024, 0, 1 + day);
+  ALL.push({{
+    index: i,
+    rating: rating,
+    day: day,
+    date: pad(date.getFullYear() % 100) + '.' + pad(date.getMonth() + 1) + '.' + pad(date.getDate()),
+    reviewer: 'user' + (i % 97) + '***',
+    content: '리뷰 ' + CONFIG.seed + '-' + i + ' 배송이 빠르고 포장이 꼼꼼해요. 재구매 의사 있습니다',
+    photo: i % 4 === 0
+  }});
+}}
+
+var state = {{ shown: false, page: 1, sort: 'ranking', star: null }};
+var root = document.getElementById('REVIEW');
+var list = root.querySelector('ul');
+var pager = root.querySelector('.HTT4L8U0CU > div > div');
+
+function view() {{
+  var rows = state.star ? ALL.filter(function (r) {{ return r.rating === state.star; }}) : ALL.slice();
+  if (state.sort === 'latest') rows.sort(function (a, b) {{ return b.day - a.day || a.index - b.index; }});
+  if (state.sort === 'rating_high') rows.sort(function (a, b) {{ return b.rating - a.rating || a.index - b.index; }});
+  if (state.sort === 'rating_low') rows.sort(function (a, b) {{ return a.rating - b.rating || a.index - b.index; }});
+  return rows;
+}}
+
+function later(fn) {{
+  setTimeout(fn, Math.max(0, CONFIG.latency + (Math.random() * 2 - 1) * CONFIG.jitter));
+}}
+
+function button(text, onClick, className) {{
+  var a = document.createElement('a');
+  a.textContent = text;
+  if (className) a.className = className;
+  a.addEventListener('click', function (e) {{ e.preventDefault(); onClick(); }});
+  return a;
+}}
+
+function render() {{
+  var rows = view();
+  var totalPages = Math.max(1, Math.ceil(rows.length / PAGE_SIZE));
+  var start = (state.page - 1) * PAGE_SIZE;
+  var html = [];
+  rows.slice(start, start + PAGE_SIZE).forEach(function (r) {{
+    html.push('<li><div><img src="/photo/profile.png" width="1" height="1"><strong>' + r.reviewer + '</strong> <span>' + r.date + '</span></div>' +
+      '<div><span>평점</span><em>' + r.rating + '</em></div>' +
+      '<div class="HakaEZ240l">' + r.content + '</div>' +
+      (r.photo ? '<img src="/photo/' + r.index + '.jpg" width="1" height="1">' : '') +  // 프로필 사진 외 사진 = 사진 리뷰
+      '<button type="button">신고</button></li>');
+  }});
+  list.innerHTML = html.join('');
+
+  // 그룹마다 '이전'(1번째) + 페이지 번호(2~11번째) + '다음'
+  pager.innerHTML = '';
+  var group = Math.floor((state.page - 1) / 10);
+  pager.appendChild(button('이전', function () {{ if (group > 0) go(group * 10); }}));
+  for (var p = group * 10 + 1; p <= Math.min(group * 10 + 10, totalPages); p++) {{
+    (function (page) {{ pager.appendChild(button(String(page), function () {{ go(page); }})); }})(p);
+  }}
+  var next = button('다음', function () {{ go(group * 10 + 11); }}, 'JY2WGJ4hXh I3i1NSoFdB');
+  if (group * 10 + 10 >= totalPages) next.style.display = 'none';
+  pager.appendChild(next);
+}}
+
+function go(page) {{ later(function () {{ state.page = page; render(); }}); }}
+
+document.querySelector("a[href='#REVIEW']").addEventListener('click', function (e) {{
+  e.preventDefault();
+  later(function () {{ state.shown = true; render(); }});
+}});
+root.querySelectorAll('[data-sort]').forEach(function (a) {{
+  a.addEventListener('click', function () {{
+    later(function () {{ state.sort = a.getAttribute('data-sort'); state.page = 1; render(); }});
+  }});
+}});
+var options = root.querySelector('.rating-options');
+root.querySelector('.rating-toggle').addEventListener('click', function () {{ options.classList.toggle('open'); }});
+[5, 4, 3, 2, 1].forEach(function (n) {{
+  var count = ALL.filter(function (r) {{ return r.rating === n; }}).length;
+  var a = button(n + '점 (' + count + ')', function () {{
+    options.classList.remove('open');
+    later(function () {{ state.star = n; state.page = 1; render(); }});
+  }});
+  a.setAttribute('role', 'option');
+  options.appendChild(a);
+}});
+</script>
+</body>
+</html>
+"""
+
+
+class FakeSmartStoreHandler(BaseHTTPRequestHandler):
+    """제품 페이지만 제공 (그 밖의 경로는 404, 사진은 차단 정책 확인용으로 빈 응답)"""
+    config = {}
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        match = PRODUCT_PATH_RE.match(path)
+        if match:
+            product_id = int(match.group(1))
+            config = dict(self.config, seed=product_id)
+            body = PAGE_TEMPLATE.format(product_id=product_id, config=json.dumps(config)).encode('utf-8')
+            self._send(200, 'text/html; charset=utf-8', body)
+        elif path.startswith('/photo/'):
+            self._send(200, 'image/jpeg', b'')
+        else:
+            self._send(404, 'text/plain; charset=utf-8', b'not found')
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSmartStore:
+    """백그라운드 스레드에서 실행하는 가짜 스마트스토어 (with 문으로 시작/종료)
+
+    reviews: 제품당 리뷰 수
+    latency_ms / jitter_ms: 클릭 후 목록을 다시 그릴 때까지의 지연 (평균 ± 최대 편차)
+    """
+
+    def __init__(self, reviews=500, latency_ms=150, jitter_ms=50, host='127.0.0.1', port=0):
+        handler = type('Handler', (FakeSmartStoreHandler,), {
+            'config': {'reviews': reviews, 'latency': latency_ms, 'jitter': jitter_ms},
+        })
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def product_url(self, product_id=1):
+        return f"{self.base_url}/products/{product_id}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 스마트스토어 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--reviews', type=int, default=500, help="제품당 리뷰 수")
+    parser.add_argument('--latency-ms', type=int, default=150, help="목록을 다시 그릴 때까지의 평균 지연")
+    parser.add_argument('--jitter-ms', type=int, default=50, help="지연의 최대 편차")
+    args = parser.parse_args()
+
+    store = FakeSmartStore(args.reviews, args.latency_ms, args.jitter_ms, port=args.port)
+    print(f"가짜 스마트스토어: {store.product_url(1)} (Ctrl+C로 종료)")
+    try:
+        store.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,396 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
+# selenium, webdriver_manager, pandas는 처음 사용할 때 불러옴 (API 서버가 이 모듈을 불러오는 시간 단축)
+import asyncio
 import time
 from datetime import datetime
 import os
 import re
+import heapq
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+
+from adaptive_wait import default_waiter, FIRST_REVIEW_SIGNATURE_JS
+from review_parser import build_review, parse_review_html
+from extraction_rules import get_rules
+from review_sink import write_csv, write_excel
+from review_dedup import HashSet, ReviewDeduper
+from network_policy import NetworkMeter, NetworkPolicy, add_counters, empty_counters, format_counters
+from telemetry import DRIVER_LAUNCH_SECONDS, PAGE_SECONDS, PAGES, REVIEWS, timed
+
+
+# 리뷰 목록을 브라우저 안에서 한 번에 추출하는 스크립트
+# arguments[0]: 평점 필터 (null이면 평점 있는 모든 리뷰)
+# arguments[1]: 추출 규칙 (ExtractionRules.to_js())
+# 반환: [{rating, content, date, reviewer, img_count, raw_text}, ...] (목록이 없으면 null)
+EXTRACT_REVIEWS_JS = r"""
+var ratingFilter = arguments[0];
+var rules = arguments[1];
+var list = document.querySelector(rules.list);
+if (!list) { return null; }
+
+var lineExclude = rules.line_exclude ? new RegExp(rules.line_exclude) : null;
+var fields = rules.fields.map(function (f) {
+    return {
+        name: f.name, selectors: f.selectors, selectorMinLength: f.selector_min_length,
+        regex: f.regex ? new RegExp(f.regex) : null, fallback: f.fallback,
+        minLength: f.min_length, required: f.required, dflt: f['default']
+    };
+});
+
+function filterLines(fullText) {
+    var lines = fullText.split('\n');
+    var contentLines = [];
+    for (var j = 0; j < lines.length; j++) {
+        var line = lines[j].trim();
+        if (line.length >= rules.line_min_length && !(lineExclude && lineExclude.test(line))) {
+            contentLines.push(line);
+        }
+    }
+    return contentLines.join(' ');
+}
+
+function extractField(f, item, fullText) {
+    for (var i = 0; i < f.selectors.length; i++) {
+        var el = item.querySelector(f.selectors[i]);
+        if (el) {
+            var text = el.innerText.trim();
+            if (text.length >= f.selectorMinLength) { return text; }
+        }
+    }
+    if (f.regex) {
+        var m = fullText.match(f.regex);
+        if (m) { return m.length > 1 ? m[1] : m[0]; }
+    }
+    if (f.fallback === 'line_filter') { return filterLines(fullText); }
+    return '';
+}
+
+var results = [];
+var items = list.querySelectorAll(rules.item);
+for (var k = 0; k < items.length; k++) {
+    var item = items[k];
+    var fullText = (item.innerText || '').trim();
+    if (!fullText || fullText.length < rules.min_item_text_length) { continue; }
+
+    var result = {};
+    var ok = true;
+    for (var n = 0; n < fields.length; n++) {
+        var f = fields[n];
+        var value = extractField(f, item, fullText);
+        if (f.required && (!value || value.length < f.minLength)) { ok = false; break; }
+        if (f.name === 'rating' && ratingFilter && ratingFilter.indexOf(parseInt(value, 10)) === -1) {
+            ok = false; break;
+        }
+        result[f.name] = value || f.dflt;
+    }
+    if (!ok) { continue; }
+
+    result.img_count = item.getElementsByTagName('img').length;
+    result.raw_text = fullText;
+    results.push(result);
+}
+return results;
+"""
+
+REVIEW_HTML_JS = """
+var el = document.getElementById('REVIEW');
+return el ? el.outerHTML : null;
+"""
+
+# 리뷰 영역(arguments[0]) 안에서 텍스트가 arguments[1]인 정렬 버튼 클릭
+SORT_BUTTON_JS = """
+var root = document.querySelector(arguments[0]);
+if (!root) return false;
+var buttons = root.querySelectorAll('a, button');
+for (var i = 0; i < buttons.length; i++) {
+    if (buttons[i].textContent.trim() === arguments[1]) {
+        buttons[i].click();
+        return true;
+    }
+}
+return false;
+"""
+
+# 리뷰 영역(arguments[0])의 평점 필터에서 정규식 arguments[2]에 맞는 항목 클릭
+# 항목이 보이지 않으면 텍스트가 arguments[1] 중 하나인 필터 버튼을 눌러 목록을 연 뒤 다시 찾음
+RATING_FILTER_JS = """
+var root = document.querySelector(arguments[0]);
+if (!root) return false;
+var toggles = arguments[1];
+var option = new RegExp(arguments[2]);
+function findOption() {
+    var items = root.querySelectorAll('a, button, [role="option"], [role="menuitem"], [role="radio"]');
+    for (var i = 0; i < items.length; i++) {
+        if (items[i].offsetParent !== null && option.test(items[i].textContent.trim())) return items[i];
+    }
+    return null;
+}
+var item = findOption();
+if (!item) {
+    var buttons = root.querySelectorAll('a, button, [role="button"], [role="combobox"]');
+    for (var j = 0; j < buttons.length && !item; j++) {
+        if (toggles.indexOf(buttons[j].textContent.trim()) !== -1) {
+            buttons[j].click();
+            item = findOption();
+        }
+    }
+}
+if (!item) return false;
+item.click();
+return true;
+"""
+
+# arguments[0]의 선택자 중 보이는 페이지 버튼이 있으면 true,
+# 리뷰 항목(arguments[1] 선택자)은 있는데 버튼이 없으면 false (마지막 페이지), 리뷰 목록도 없으면 null (확인 불가)
+PAGE_BUTTON_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    if (el && el.offsetParent !== null) return true;
+}
+return document.querySelector(arguments[1]) ? false : null;
+"""
+
+# 사이트 평점 컨트롤로 처리하는 방식
+# - 'star': 평점 필터로 해당 평점의 리뷰만 표시 (평점 하나일 때)
+# - 'rating_low' / 'rating_high': 평점 낮은순/높은순 정렬 후 필터 범위를 벗어난 페이지에서 멈춤
+RATING_SORT_MODES = ('rating_low', 'rating_high')
+
+
+def build_chrome_options(network_log=False, background_tabs=False):
+    """크롤링용 Chrome 옵션을 생성합니다.
+    
+    network_log: True면 CDP 네트워크 이벤트를 성능 로그로 기록 (API 엔진에서 요청 캡처용)
+    background_tabs: True면 백그라운드 탭의 타이머/렌더링 제한을 끔 (탭 엔진에서 여러 탭을 동시에 진행)
+    """
+    from selenium import webdriver
+    
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    
+    # Memory Optimization for Render Free Tier
+    options.add_argument('--disable-software-rasterizer')
+    options.add_argument('--disable-notifications')
+    options.add_argument('--mute-audio')
+    options.add_argument('--disable-infobars')
+    options.add_argument('--disable-popup-blocking')
+    options.page_load_strategy = 'eager'  # Wait for DOMContentLoaded only, not full load
+    
+    if network_log:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    
+    if background_tabs:
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-renderer-backgrounding')
+        options.add_argument('--disable-backgrounding-occluded-windows')
+    
+    return options
+
+
+# chromedriver 경로 (한 번 찾으면 프로세스가 끝날 때까지 재사용)
+CHROMEDRIVER_PATH_FILE = os.getenv("CHROMEDRIVER_PATH_FILE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '.chromedriver-path')
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def _env_flag(name, default):
+    return os.getenv(name, default).strip().lower() not in ('0', 'false', 'no', 'off', '')
+
+
+def _download_chromedriver():
+    """Selenium Manager(실패하면 webdriver-manager)로 Chrome에 맞는 chromedriver를 받아 경로 반환 (네트워크 사용)"""
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.common.selenium_manager import SeleniumManager
+        return SeleniumManager().driver_location(webdriver.ChromeOptions())
+    except Exception as e1:
+        print(f"   ⚠️ Selenium Manager 실패 ({e1}), webdriver-manager 시도...")
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+
+def resolve_chromedriver_path(refresh=False):
+    """chromedriver 경로를 한 번만 찾아 캐시합니다 (찾지 못하면 None).
+    
+    순서:
+        1. CHROMEDRIVER_PATH 환경 변수
+        2. 경로 파일 CHROMEDRIVER_PATH_FILE (Docker 빌드에서 기록)
+        3. PATH의 chromedriver
+        4. CHROMEDRIVER_DOWNLOAD가 켜져 있으면 Selenium Manager/webdriver-manager로 받은 뒤 경로 파일에 기록
+    1~3은 네트워크를 쓰지 않습니다. refresh=True면 캐시와 경로 파일을 무시하고 다시 찾습니다.
+    """
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path and not refresh:
+            return _chromedriver_path
+        
+        path = os.getenv("CHROMEDRIVER_PATH")
+        if not path and not refresh:
+            try:
+                with open(CHROMEDRIVER_PATH_FILE, encoding='utf-8') as f:
+                    path = f.read().strip()
+            except OSError:
+                path = None
+            if path and not os.access(path, os.X_OK):
+                print(f"   ⚠️ 경로 파일의 chromedriver를 실행할 수 없습니다: {path}")
+                path = None
+        if not path:
+            path = shutil.which('chromedriver')
+        if not path and _env_flag("CHROMEDRIVER_DOWNLOAD", "1"):
+            print("   ⬇️ chromedriver 경로를 찾지 못해 내려받습니다 (한 번만)")
+            path = _download_chromedriver()
+            try:
+                with open(CHROMEDRIVER_PATH_FILE, 'w', encoding='utf-8') as f:
+                    f.write(path)
+            except OSError as e:
+                print(f"   ⚠️ chromedriver 경로 기록 실패: {e}")
+        
+        _chromedriver_path = path or None
+        return _chromedriver_path
+
+
+def create_chrome_driver(options=None):
+    """Chrome 드라이버를 실행하고 자동화 흔적을 제거합니다.
+    
+    chromedriver는 resolve_chromedriver_path()로 찾은 경로를 사용하므로 실행할 때마다 드라이버를 찾거나 받지 않습니다.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    
+    if options is None:
+        options = build_chrome_options()
+    
+    start = time.perf_counter()
+    path = resolve_chromedriver_path()
+    if not path:
+        raise RuntimeError(
+            "chromedriver를 찾을 수 없습니다. CHROMEDRIVER_PATH를 지정하거나 CHROMEDRIVER_DOWNLOAD=1로 실행하세요."
+        )
+    try:
+        driver = webdriver.Chrome(service=Service(path), options=options)
+    except Exception as e:
+        print(f"   ❌ 드라이버 초기화 실패: {e}")
+        raise
+    
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    DRIVER_LAUNCH_SECONDS.observe(time.perf_counter() - start)
+    return driver
+
+
+class PageWalk:
+    """순차 페이지 수집의 진행 상태와 종료 판단
+    
+    collect_reviews_by_pagination과 탭 엔진(tab_engine.crawl_steps)이 같은 규칙으로 수집하도록
+    페이지 기록, 다음 페이지 버튼 선택과 종료 조건을 한곳에서 처리합니다.
+    페이지 이동과 대기는 호출하는 쪽에서 처리하고 결과만 advance()로 알려줍니다.
+    """
+    
+    max_pages = 100
+    max_failures = 5        # 연속으로 새 리뷰가 없는 페이지 수
+    max_click_failures = 3  # 같은 페이지로 연속 이동하지 못한 횟수
+    
+    def __init__(self, crawler, max_reviews):
+        self.crawler = crawler
+        self.max_reviews = max_reviews
+        self.page = 1
+        self.failures = 0
+        self.click_failures = 0
+        self.start_time = time.time()
+    
+    def _elapsed(self):
+        return int(time.time() - self.start_time)
+    
+    def record(self, extracted, network=None):
+        """현재 페이지 추출 결과를 중복 제거 후 기록합니다 (다음 페이지로 계속하면 True)."""
+        crawler = self.crawler
+        page = self.page
+        page_reviews, past_range = crawler.split_rating_page(extracted)
+        
+        if page_reviews:
+            new_reviews, duplicate_count, known_count = crawler._accept_page(page_reviews, self.max_reviews)
+            crawler._emit_page(new_reviews, page, network)
+            crawler._print_page(page, len(new_reviews), duplicate_count, self.start_time)
+            if known_count and known_count == len(page_reviews):
+                print(f"\n✅ 이미 수집한 리뷰까지 도달. 새 리뷰 {crawler.collected_count}개 ({self._elapsed()}초)")
+                return False
+            self.failures = 0 if new_reviews else self.failures + 1
+        elif extracted:
+            # 평점순 정렬 중 필터 범위 앞쪽 페이지 (수집 실패가 아님)
+            self.failures = 0
+            crawler._emit_page([], page, network)
+            print(f"📄 페이지 {page}: 필터 범위 밖 | 누적: {crawler.collected_count}개")
+        else:
+            self.failures += 1
+            crawler._emit_page([], page, network)
+            print(f"📄 페이지 {page}: 0개 수집 | 누적: {crawler.collected_count}개")
+        
+        if self.failures >= self.max_failures:
+            print(f"\n⚠️  {self.max_failures}페이지 연속 수집 실패. 종료합니다.")
+            return False
+        if crawler.collected_count >= self.max_reviews:
+            print(f"\n✅ 목표 달성! {crawler.collected_count}개 수집 ({self._elapsed()}초)")
+            return False
+        if past_range:
+            print(f"\n✅ 평점 필터 범위를 모두 수집. {crawler.collected_count}개 ({self._elapsed()}초)")
+            crawler.reached_end = True
+            return False
+        return not crawler._should_stop() and page < self.max_pages
+    
+    @property
+    def next_page(self):
+        return self.page + 1
+    
+    def can_advance(self):
+        """다음 페이지가 남았고 중단 요청이 없는지 (현재 페이지를 기록하기 전에 미리 이동할 때 확인)"""
+        return self.page < self.max_pages and not self.crawler._stop_requested()
+    
+    def next_selectors(self):
+        """다음 페이지 버튼의 선택자 목록"""
+        return self.crawler.page_button_selectors(self.next_page)
+    
+    def advance(self):
+        """다음 페이지로 이동함"""
+        self.page += 1
+        self.click_failures = 0
+    
+    def navigation_failed(self, button_present):
+        """다음 페이지로 이동하지 못함 (같은 페이지로 다시 시도하면 True)
+        
+        button_present: crawler.page_button_present(next_page) 결과
+        버튼이 DOM에 없을 때만 목록 끝으로 판단합니다. 대기 타임아웃이나 클릭 오류는 빈 페이지와 따로 세며,
+        max_click_failures번 연속 실패하면 목록 끝을 확인하지 못한 채 종료합니다.
+        """
+        if button_present is False:
+            print(f"   ✓ 페이지 {self.next_page} 버튼이 없습니다. 마지막 페이지까지 수집했습니다.")
+            self.crawler.reached_end = True
+            return False
+        self.click_failures += 1
+        if self.click_failures >= self.max_click_failures:
+            print(f"\n⚠️  페이지 {self.next_page}로 {self.click_failures}번 연속 이동하지 못했습니다. 종료합니다.")
+            return False
+        print(f"   ⚠️  페이지 {self.next_page}로 이동하지 못했습니다. 다시 시도합니다.")
+        return True
+
 
 class NaverSmartStoreReviewCrawler:
-    def __init__(self, product_url, rating_filter=None):
+    def __init__(self, product_url, rating_filter=None, waiter=None,
+                 extract_mode='script', parse_executor=None, html_snapshot_dir=None,
+                 engine='dom', rules=None, sink=None, keep_in_memory=True, on_event=None,
+                 known_review_keys=None, dedup=None, shards=1, driver_factory=None,
+                 release_driver=None, network_policy=None, network_stats=False, rating_pushdown=True,
+                 should_stop=None):
         """
         product_url: 제품 URL
         rating_filter: 평점 필터 
@@ -19,14 +398,205 @@ class NaverSmartStoreReviewCrawler:
             - [5]: 5점만
             - [4, 5]: 4점과 5점만
             - [1, 2, 3]: 1~3점 (낮은 평점)
+        waiter: 페이지 전환 대기 엔진 (None이면 프로세스 공용 AdaptiveWaiter)
+        extract_mode: 리뷰 추출 방식
+            - 'script': 브라우저 안에서 한 번의 스크립트로 추출
+            - 'html': #REVIEW outerHTML을 캡처해 review_parser로 오프라인 파싱
+        parse_executor: 'html' 모드에서 파싱을 실행할 Executor (예: ProcessPoolExecutor)
+            - 페이지를 파싱하는 동안 다음 페이지로 이동해 파싱과 렌더링을 겹침
+        html_snapshot_dir: 지정하면 캡처한 페이지 HTML을 저장 (파서 테스트용 픽스처)
+        engine: 리뷰 수집 엔진
+            - 'dom': 페이지 버튼을 클릭하며 화면에서 추출
+            - 'api': 리뷰 API 요청을 한 번 캡처한 뒤 JSON을 직접 요청
+              (드라이버는 build_chrome_options(network_log=True)로 실행되어야 함)
+        rules: 추출 규칙 (None이면 extraction_rules.json, 파일 변경 시 자동 갱신)
+        sink: 페이지마다 새 리뷰를 기록할 ReviewSink (예: JsonlSink)
+        keep_in_memory: False면 self.reviews에 쌓지 않고 sink에만 기록 (sink는 iter_reviews 지원 필요)
+        on_event: 진행 이벤트 콜백 on_event(event, data)
+            - 'phase': {'phase': 'driver' | 'product' | 'review_tab' | 'collecting'}
+            - 'page': {'page', 'new_count', 'total', 'reviews'} (페이지 하나 처리 완료)
+        known_review_keys: 이미 수집한 리뷰 키(review_key) 이터러블, 지정하면 증분 수집
+            - 최신순으로 정렬한 뒤 아는 리뷰는 건너뛰고 새 리뷰만 수집
+            - 페이지의 리뷰가 모두 아는 리뷰면 페이지 이동을 멈춤
+            - 정렬 순서를 바꿀 수 없는 'api' 엔진 대신 페이지네이션 방식으로 수집
+        dedup: 중복 제거기 ReviewDeduper (None이면 known_review_keys로 생성)
+            - 제품별 Bloom 필터를 넘기면 파일에 남은 이전 수집 기록으로 증분 수집
+        shards: 2 이상이면 페이지 그룹(1~10, 11~20, ...)을 여러 드라이버가 나눠 병렬 수집 ('dom' 엔진)
+            - 첫 번째 샤드는 이 크롤러의 드라이버, 나머지는 driver_factory()로 받은 드라이버 사용
+            - 증분 수집은 최신순으로 차례대로 확인해야 하므로 샤딩하지 않음
+        driver_factory: 샤드용 드라이버 생성 함수 (None이면 새 Chrome 실행)
+        release_driver: 샤드 드라이버 반납 함수 release_driver(driver, failed) (None이면 종료)
+        network_policy: 차단할 요청 NetworkPolicy (None이면 이미지/폰트/동영상/광고/통계 차단)
+        network_stats: True면 페이지마다 요청 수/전송 바이트를 집계
+            (드라이버는 build_chrome_options(network_log=True)로 실행되어야 함)
+        rating_pushdown: True면 rating_filter를 리뷰 위젯의 평점 필터/평점순 정렬로 먼저 적용
+            - 평점 하나면 평점 필터, 아니면 필터 범위 쪽 끝부터 정렬하고 범위를 벗어난 페이지에서 멈춤
+            - 컨트롤을 찾지 못하면 지금처럼 모든 페이지를 읽고 평점으로 거름 (화면 밖 필터는 항상 유지)
+        should_stop: 페이지 사이마다 호출해 멈출 이유를 받는 함수 (예: 'cancelled', 'deadline', 멈추지 않으면 None)
+            - 페이지마다 호출되므로 메모리의 값만 확인해야 함 (request_stop()도 함께 사용 가능)
         """
         self.product_url = product_url
         self.rating_filter = rating_filter
         self.reviews = []
+        self.collected_count = 0
+        self.sink = sink
+        self.keep_in_memory = keep_in_memory or sink is None
         self.driver = None
+        self._owns_driver = True
+        self.waiter = waiter or default_waiter
+        self.extract_mode = extract_mode
+        self.parse_executor = parse_executor
+        self.html_snapshot_dir = html_snapshot_dir
+        self._snapshot_count = 0
+        self.engine = engine
+        self._rules = rules
+        self.on_event = on_event
+        if dedup is None:
+            known = HashSet.from_keys(known_review_keys) if known_review_keys is not None else None
+            dedup = ReviewDeduper(known=known)
+        self.dedup = dedup
+        self.shards = shards
+        self.driver_factory = driver_factory
+        self.release_driver = release_driver
+        self.network_policy = network_policy or NetworkPolicy()
+        self.network_stats = network_stats
+        self.network_meter = None
+        self.network_webview = None
+        self.page_network = None
+        self.network_totals = empty_counters()
+        self.rating_pushdown = rating_pushdown
+        # 적용한 평점 컨트롤 ('star', 'rating_low', 'rating_high', 적용하지 않았으면 None)
+        self.rating_mode = None
+        # 직전 페이지를 기록한 시각 (페이지별 처리 시간 측정, 수집 시작 시 초기화)
+        self._page_clock = None
+        # 수집을 멈춘 이유 (request_stop() 또는 should_stop()으로 설정, 예: 'cancelled', 'deadline')
+        self.stop_reason = None
+        self.should_stop = should_stop
+        # abort()로 드라이버를 강제 종료했는지 (드라이버를 재사용하면 안 됨)
+        self.aborted = False
+        # 리뷰 목록의 마지막 페이지(또는 평점 필터 범위 끝)까지 도달했는지 (collected_all() 참고)
+        self.reached_end = False
         
-    def setup_driver(self):
-        """Chrome 드라이버를 설정합니다."""
+    def request_stop(self, reason='cancelled'):
+        """수집 중단 요청 (다른 스레드에서 호출 가능)
+        
+        수집 루프는 페이지 사이마다 확인하고, 지금까지 수집한 리뷰를 남긴 채 정상적으로 끝납니다.
+        """
+        if self.stop_reason is None:
+            self.stop_reason = reason
+    
+    def abort(self):
+        """드라이버를 강제 종료해 멈춘 WebDriver 호출을 끊음 (다른 스레드에서 호출, 이후 드라이버는 재사용 불가)
+        
+        request_stop() 뒤에도 페이지 사이에 도달하지 못할 때 (페이지 로딩이 멈춘 경우 등) 사용합니다.
+        """
+        driver = self.driver
+        if driver is None:
+            return
+        self.aborted = True
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def _stop_requested(self):
+        """중단 요청이 있는지 (request_stop() 또는 should_stop() 확인, 로그 없음)"""
+        if self.stop_reason is None and self.should_stop is not None:
+            reason = self.should_stop()
+            if reason:
+                self.request_stop(reason)
+        return self.stop_reason is not None
+    
+    def _should_stop(self):
+        """중단 요청이 있으면 로그를 남기고 True (수집 루프의 페이지 사이에서 호출)"""
+        if not self._stop_requested():
+            return False
+        print(f"\n⏹️  수집 중단 ({self.stop_reason}). 지금까지 {self.collected_count}개 수집")
+        return True
+    
+    def collected_all(self, max_reviews):
+        """필터에 맞는 리뷰를 모두 수집했는지 (목록 끝까지 도달, 중단/증분 수집/목표 개수 도달이면 False)"""
+        return (self.reached_end and self.stop_reason is None and not self.dedup.tracks_known
+                and self.collected_count < max_reviews)
+    
+    def _notify(self, event, **data):
+        """진행 이벤트 전달 (콜백 오류는 수집을 멈추지 않음)"""
+        if event == 'phase' and data.get('phase') == 'collecting':
+            self._page_clock = time.perf_counter()
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(event, data)
+        except Exception as e:
+            print(f"   ⚠️  진행 이벤트 처리 실패: {e}")
+    
+    def _emit_page(self, reviews, page=None, network=None):
+        """한 페이지에서 새로 수집한 리뷰를 메모리/sink에 추가하고 진행 이벤트를 보냅니다.
+        
+        network: 그 페이지를 불러오며 발생한 요청 집계 (network_stats일 때)
+        """
+        if network:
+            add_counters(self.network_totals, network)
+            print(f"   🌐 {format_counters(network)}")
+        now = time.perf_counter()
+        if self._page_clock is not None:
+            PAGE_SECONDS.observe(now - self._page_clock)
+        self._page_clock = now
+        PAGES.inc()
+        REVIEWS.inc(len(reviews))
+        if reviews:
+            self.collected_count += len(reviews)
+            if self.keep_in_memory:
+                self.reviews.extend(reviews)
+            if self.sink:
+                self.sink.write_page(reviews)
+        self._notify('page', page=page, new_count=len(reviews),
+                     total=self.collected_count, reviews=reviews, network=network)
+    
+    def _accept_page(self, page_reviews, max_reviews):
+        """페이지 리뷰를 중복 제거하고 새 리뷰에 번호를 매깁니다.
+        
+        반환: (새 리뷰 목록, 중복 수, 이전 수집 리뷰 수)
+        """
+        new_reviews = []
+        duplicate_count = 0
+        known_count = 0
+        for review in page_reviews:
+            if self.collected_count + len(new_reviews) >= max_reviews:
+                break
+            status = self.dedup.check(review)
+            if status == ReviewDeduper.DUPLICATE:
+                duplicate_count += 1
+                continue
+            if status == ReviewDeduper.KNOWN:
+                known_count += 1
+                continue
+            review['number'] = self.collected_count + len(new_reviews) + 1
+            new_reviews.append(review)
+        return new_reviews, duplicate_count, known_count
+    
+    def _print_page(self, page, new_count, duplicate_count, start_time):
+        elapsed = int(time.time() - start_time)
+        duplicate_text = f" ({duplicate_count}개 중복)" if duplicate_count else ""
+        print(f"📄 페이지 {page}: {new_count}개 수집{duplicate_text} | 누적: {self.collected_count}개 | {elapsed}초")
+    
+    def iter_reviews(self):
+        """수집한 리뷰를 순서대로 반환합니다 (메모리 또는 sink 스트림에서)."""
+        if self.keep_in_memory:
+            return iter(self.reviews)
+        return self.sink.iter_reviews()
+    
+    @property
+    def rules(self):
+        """현재 추출 규칙"""
+        return self._rules or get_rules()
+    
+    @timed('setup_driver')
+    def setup_driver(self, driver=None):
+        """Chrome 드라이버를 설정합니다.
+        
+        driver: 이미 실행 중인 드라이버 (None이면 새 Chrome 실행)
+        """
         print("=" * 60)
         print("🚀 네이버 스마트스토어 리뷰 크롤러 (평점 필터링)")
         print("=" * 60)
@@ -37,58 +607,50 @@ class NaverSmartStoreReviewCrawler:
             print("⭐ 평점 필터: 평점 있는 모든 리뷰 수집")
         
         print("\n[1/5] Chrome 드라이버 초기화 중...")
+        self._notify('phase', phase='driver')
         
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless=new')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-images')
-        options.add_argument('--blink-settings=imagesEnabled=false')
-        
-        # Memory Optimization for Render Free Tier
-        options.add_argument('--disable-software-rasterizer')
-        options.add_argument('--disable-notifications')
-        options.add_argument('--mute-audio')
-        options.add_argument('--disable-infobars')
-        options.add_argument('--disable-popup-blocking')
-        options.page_load_strategy = 'eager'  # Wait for DOMContentLoaded only, not full load
-        
-        try:
-            # 방법 1: Selenium 4의 자동 드라이버 관리 사용
-            self.driver = webdriver.Chrome(options=options)
-        except Exception as e1:
-            print(f"   ⚠️ 자동 드라이버 실패, webdriver-manager 시도...")
-            try:
-                # 방법 2: webdriver-manager 사용
-                from webdriver_manager.chrome import ChromeDriverManager
-                from selenium.webdriver.chrome.service import Service
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=options)
-            except Exception as e2:
-                print(f"   ❌ 드라이버 초기화 실패: {e2}")
-                raise
+        if driver is not None:
+            # 외부(드라이버 풀)에서 받은 드라이버는 close()에서 종료하지 않음
+            self.driver = driver
+            self._owns_driver = False
+        else:
+            self.driver = create_chrome_driver(build_chrome_options(network_log=self.engine == 'api'))
+            self._owns_driver = True
         
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        self.network_policy.apply(self.driver)
+        if self.network_stats:
+            self.network_meter = NetworkMeter(self.driver)
+            self.network_meter.measure()
         
         print("✅ 드라이버 초기화 완료\n")
         
+    @timed('navigate')
     def navigate_to_product(self):
         """제품 페이지로 이동합니다."""
         print(f"[2/5] 제품 페이지 로딩 중...")
+        self._notify('phase', phase='product')
+        if self.engine == 'api':
+            # 이전 페이지에서 쌓인 네트워크 로그 비우기
+            try:
+                self.driver.get_log('performance')
+            except Exception:
+                pass
         self.driver.get(self.product_url)
-        time.sleep(2)
+        self.waiter.wait_for(
+            self.driver, 'page_load',
+            lambda d: d.execute_script("return document.readyState") != 'loading'
+        )
         print("✅ 페이지 로딩 완료\n")
         
+    @timed('review_tab')
     def click_review_tab(self):
         """리뷰 탭을 클릭합니다."""
         print("[3/5] 리뷰 탭으로 이동 중...")
+        self._notify('phase', phase='review_tab')
+        
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
         
         try:
             wait = WebDriverWait(self.driver, 10)
@@ -96,22 +658,39 @@ class NaverSmartStoreReviewCrawler:
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "a[href='#REVIEW']"))
             )
             self.driver.execute_script("arguments[0].click();", review_tab)
-            time.sleep(3)
+            self.waiter.wait_for_reviews(self.driver, step='review_tab')
             print("✅ 리뷰 탭 이동 완료\n")
         except Exception as e:
             print(f"⚠️  리뷰 탭 클릭 실패: {e}")
-            time.sleep(3)
+            self.waiter.wait_for_reviews(self.driver, step='review_tab')
     
     def get_first_review_signature(self):
         """첫 번째 리뷰의 시그니처를 반환합니다."""
         try:
-            review_list = self.driver.find_element(By.CSS_SELECTOR, "#REVIEW ul")
-            first_review = review_list.find_element(By.CSS_SELECTOR, "li:first-child")
-            signature = first_review.text[:100]
-            return signature
+            return self.driver.execute_script(FIRST_REVIEW_SIGNATURE_JS)
         except:
             return None
     
+    @timed('sort')
+    def sort_by_latest(self):
+        """리뷰 목록을 최신순으로 정렬합니다 (정렬 버튼을 찾지 못하면 False)."""
+        old_signature = self.get_first_review_signature()
+        try:
+            clicked = self.driver.execute_script(SORT_BUTTON_JS, self.rules.review_root,
+                                                 self.rules.sort_latest_text)
+        except Exception as e:
+            print(f"   ⚠️  최신순 정렬 실패: {e}")
+            return False
+        if not clicked:
+            print("   ⚠️  최신순 정렬 버튼을 찾을 수 없습니다")
+            return False
+        if old_signature:
+            # 이미 최신순이면 목록이 바뀌지 않으므로 결과와 관계없이 진행
+            self.waiter.wait_for_review_change(self.driver, old_signature)
+        else:
+            self.waiter.wait_for_reviews(self.driver)
+        return True
+    
     def is_rating_match(self, rating):
         """평점이 필터 조건에 맞는지 확인합니다."""
         if not rating:
@@ -127,189 +706,230 @@ class NaverSmartStoreReviewCrawler:
         except:
             return False
     
+    def click_rating_control(self, allow_sort=True):
+        """rating_filter를 리뷰 위젯의 평점 필터나 평점순 정렬로 적용 (목록이 바뀌기를 기다리지 않음)
+        
+        평점이 하나면 평점 필터를, 실패하거나 평점이 여러 개면 필터에 5점이 있을 때 평점 높은순,
+        1점이 있거나 둘 다 없을 때 평점 낮은순으로 정렬합니다 (allow_sort일 때만, 1점과 5점이 모두
+        있으면 정렬하지 않음). 적용한 방식을 반환합니다.
+        """
+        self.rating_mode = None
+        if not self.rating_pushdown or not self.rating_filter:
+            return None
+        ratings = set(self.rating_filter)
+        if ratings >= {1, 2, 3, 4, 5}:
+            return None
+        rules = self.rules
+        
+        pattern = rules.rating_option_pattern(next(iter(ratings))) if len(ratings) == 1 else None
+        if pattern:
+            try:
+                if self.driver.execute_script(RATING_FILTER_JS, rules.review_root,
+                                              rules.rating_toggle_texts, pattern):
+                    self.rating_mode = 'star'
+                    return self.rating_mode
+            except Exception as e:
+                print(f"   ⚠️  평점 필터 적용 실패: {e}")
+        
+        if not allow_sort or {1, 5} <= ratings:
+            return None
+        # 5점이 들어 있으면 높은순, 아니면 (리뷰가 적은) 낮은 평점부터 정렬
+        if 5 in ratings:
+            mode, text = 'rating_high', rules.sort_rating_high_text
+        else:
+            mode, text = 'rating_low', rules.sort_rating_low_text
+        if not text:
+            return None
+        try:
+            if self.driver.execute_script(SORT_BUTTON_JS, rules.review_root, text):
+                self.rating_mode = mode
+        except Exception as e:
+            print(f"   ⚠️  평점순 정렬 실패: {e}")
+        return self.rating_mode
+    
+    @timed('rating_filter')
+    def apply_rating_filter(self, allow_sort=True):
+        """평점 컨트롤을 적용하고 목록이 바뀔 때까지 대기 (적용하지 못하면 None, 화면 밖 필터로 수집)"""
+        if not self.rating_pushdown or not self.rating_filter:
+            return None
+        old_signature = self.get_first_review_signature()
+        mode = self.click_rating_control(allow_sort=allow_sort)
+        if mode is None:
+            print("   ⚠️  사이트 평점 필터를 찾지 못했습니다. 모든 페이지를 읽고 평점으로 거릅니다.")
+            return None
+        print(f"   ⭐ 사이트 평점 컨트롤 적용: {mode}")
+        if old_signature:
+            self.waiter.wait_for_review_change(self.driver, old_signature)
+        else:
+            self.waiter.wait_for_reviews(self.driver)
+        return mode
+    
+    @property
+    def extract_rating_filter(self):
+        """추출 시 적용할 평점 필터 (평점순 정렬 중에는 범위를 판단하도록 모든 평점 추출)"""
+        return None if self.rating_mode in RATING_SORT_MODES else self.rating_filter
+    
+    def split_rating_page(self, page_reviews):
+        """평점순 정렬 중인 페이지를 (필터에 맞는 리뷰, 필터 범위를 벗어났는지)로 나눔
+        
+        정렬하지 않았으면 (page_reviews, False)를 그대로 반환합니다.
+        """
+        if self.rating_mode not in RATING_SORT_MODES or not page_reviews:
+            return page_reviews, False
+        ratings = []
+        for review in page_reviews:
+            try:
+                ratings.append(int(review['rating']))
+            except (KeyError, TypeError, ValueError):
+                continue
+        matching = [review for review in page_reviews if self.is_rating_match(review.get('rating'))]
+        if not ratings:
+            return matching, False
+        if self.rating_mode == 'rating_low':
+            past_range = min(ratings) > max(self.rating_filter)
+        else:
+            past_range = max(ratings) < min(self.rating_filter)
+        return matching, past_range
+    
     def extract_reviews_from_current_page(self):
-        """현재 페이지에서 리뷰를 추출합니다."""
-        page_reviews = []
+        """현재 페이지에서 리뷰를 추출합니다.
         
+        리뷰 목록 탐색, 본문/평점/날짜/작성자 추출과 평점 필터링을 브라우저 안에서
+        한 번의 execute_script 호출로 처리합니다.
+        """
+        return self.finish_page_extraction(self.start_page_extraction())
+    
+    @timed('extract')
+    def start_page_extraction(self):
+        """현재 페이지 추출을 시작하고 결과 Future를 반환합니다 (finish_page_extraction으로 받음).
+        
+        'html' 모드에서 parse_executor가 있으면 HTML만 캡처하고 파싱은 Executor에 넘기므로
+        Future가 끝나기 전에 다음 페이지로 이동해 파싱과 다음 페이지 렌더링을 겹칠 수 있습니다.
+        그 밖에는 이미 완료된 Future를 반환합니다.
+        """
+        pending = Future()
         try:
             # 스크롤하여 리뷰 로딩
             self.driver.execute_script("window.scrollTo(0, 1500);")
-            time.sleep(3)
-            
-            # 리뷰 리스트 찾기
-            review_list = self.driver.find_element(By.CSS_SELECTOR, "#REVIEW div.JHZoCyHfg7 div.HTT4L8U0CU ul")
-            review_items = review_list.find_elements(By.CSS_SELECTOR, "li")
-            
-            for idx, item in enumerate(review_items):
-                try:
-                    review_data = {
-                        'content': '',
-                        'rating': '',
-                        'date': '',
-                        'reviewer': '',
-                        'has_photo': False,
-                        'tags': ''
-                    }
-                    
-                    full_text = item.text.strip()
-                    
-                    if not full_text or len(full_text) < 5:
-                        continue
-                    
-                    # 평점 추출
-                    rating_match = re.search(r'평점\s*(\d+)', full_text)
-                    if rating_match:
-                        review_data['rating'] = rating_match.group(1)
-                    
-                    # 평점 필터링 체크
-                    if not self.is_rating_match(review_data['rating']):
-                        continue
-                    
-                    # 리뷰 본문 추출
-                    content_found = False
-                    
-                    try:
-                        content_div = item.find_element(By.CSS_SELECTOR, "div.HakaEZ240l")
-                        content_text = content_div.text.strip()
-                        if content_text and len(content_text) > 3:
-                            review_data['content'] = content_text
-                            content_found = True
-                    except:
-                        pass
-                    
-                    if not content_found:
-                        try:
-                            content_div = item.find_element(By.CSS_SELECTOR, "div.O2M37e85_1 div.HakaEZ240l")
-                            content_text = content_div.text.strip()
-                            if content_text and len(content_text) > 3:
-                                review_data['content'] = content_text
-                                content_found = True
-                        except:
-                            pass
-                    
-                    if not content_found:
-                        try:
-                            content_div = item.find_element(By.CSS_SELECTOR, "div.IwcuBUIAKf div[class*='HakaEZ']")
-                            content_text = content_div.text.strip()
-                            if content_text and len(content_text) > 3:
-                                review_data['content'] = content_text
-                                content_found = True
-                        except:
-                            pass
-                    
-                    if not content_found:
-                        lines = full_text.split('\n')
-                        content_lines = []
-                        
-                        for line in lines:
-                            line = line.strip()
-                            if len(line) > 5:
-                                if not re.match(r'^평점\d+$', line):
-                                    if not re.match(r'^\d{2}\.\d{2}\.\d{2}$', line):
-                                        if '신고' not in line:
-                                            if not re.match(r'^[a-z0-9*]+$', line):
-                                                content_lines.append(line)
-                        
-                        if content_lines:
-                            review_data['content'] = ' '.join(content_lines)
-                            content_found = True
-                    
-                    if not content_found or len(review_data['content']) < 3:
-                        continue
-                    
-                    # 날짜 추출
-                    date_match = re.search(r'(\d{2}\.\d{2}\.\d{2})', full_text)
-                    if date_match:
-                        review_data['date'] = date_match.group(1)
-                    
-                    # 작성자 추출
-                    reviewer_match = re.search(r'([a-z0-9*]+)\s*\d{2}\.\d{2}\.\d{2}', full_text)
-                    if reviewer_match:
-                        review_data['reviewer'] = reviewer_match.group(1)
-                    
-                    # 태그 추출
-                    tags = []
-                    tag_keywords = ['유통기한', '포장', '편리', '배송', '한달사용', '재구매', '가성비']
-                    for keyword in tag_keywords:
-                        if keyword in full_text:
-                            tags.append(keyword)
-                    review_data['tags'] = ', '.join(tags) if tags else ''
-                    
-                    # 사진 리뷰 여부
-                    try:
-                        imgs = item.find_elements(By.TAG_NAME, "img")
-                        review_data['has_photo'] = len(imgs) > 1
-                    except:
-                        pass
-                    
-                    page_reviews.append(review_data)
-                    
-                except Exception as e:
-                    continue
+            self.waiter.wait_for_reviews(self.driver)
             
+            if self.extract_mode == 'html':
+                html = self._capture_review_html()
+                if self.parse_executor:
+                    pending = self.parse_executor.submit(parse_review_html, html, self.extract_rating_filter)
+                else:
+                    pending.set_result(parse_review_html(html, self.extract_rating_filter))
+            else:
+                # 리뷰 목록 전체를 한 번의 왕복으로 추출 (평점 필터도 브라우저에서 적용)
+                rules = self.rules
+                items = self.driver.execute_script(EXTRACT_REVIEWS_JS, self.extract_rating_filter, rules.to_js())
+                pending.set_result(None if items is None else [build_review(item, rules) for item in items])
+        except Exception as e:
+            pending.set_exception(e)
+        
+        self.page_network = self.measure_network()
+        return pending
+    
+    def finish_page_extraction(self, pending):
+        """start_page_extraction()의 리뷰 목록 (파싱 중이면 끝날 때까지 대기, 실패하면 빈 목록)"""
+        try:
+            page_reviews = pending.result()
+            if page_reviews is None:
+                raise Exception("리뷰 목록을 찾을 수 없습니다")
+            return page_reviews
         except Exception as e:
             print(f"   ⚠️  페이지 추출 오류: {e}")
+            return []
+    
+    def measure_network(self):
+        """지난 측정 이후 이 크롤러의 탭에서 발생한 요청 집계 (network_stats가 아니면 None)"""
+        if self.network_meter is None:
+            return None
+        return self.network_meter.measure(self.network_webview)
+    
+    def _capture_review_html(self):
+        """#REVIEW outerHTML 캡처 (html_snapshot_dir이면 파일로도 저장)"""
+        html = self.driver.execute_script(REVIEW_HTML_JS)
+        if not html:
+            raise Exception("리뷰 영역을 찾을 수 없습니다")
+        
+        if self.html_snapshot_dir:
+            os.makedirs(self.html_snapshot_dir, exist_ok=True)
+            self._snapshot_count += 1
+            path = os.path.join(self.html_snapshot_dir, f"page_{self._snapshot_count:03d}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(html)
+        return html
+    
+    def _wait_for_pagination(self, selector):
+        """페이지네이션 버튼이 나타날 때까지 대기합니다."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
         
-        return page_reviews
+        return self.waiter.wait_for(
+            self.driver, 'pagination',
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
     
+    @timed('paginate')
     def click_next_button(self):
         """'다음' 버튼을 클릭하여 다음 페이지 그룹으로 이동합니다."""
+        from selenium.webdriver.common.by import By
+        
         try:
+            old_signature = self.get_first_review_signature()
+            
             # 페이지네이션 영역으로 스크롤
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            rules = self.rules
+            self._wait_for_pagination(rules.any_page_button)
             
-            # '다음' 버튼 찾기 (nth-child로)
+            # '다음' 버튼 찾기 (보통 마지막에 위치, 규칙의 선택자를 순서대로 시도)
             next_button = None
             
-            try:
-                # '다음' 버튼은 보통 마지막에 위치
-                next_button = self.driver.find_element(By.CSS_SELECTOR, 
-                    "#REVIEW div.JHZoCyHfg7 div.HTT4L8U0CU > div > div > a.JY2WGJ4hXh.I3i1NSoFdB")
-            except:
-                pass
-            
-            if not next_button:
+            for selector in rules.next_buttons:
                 try:
-                    next_button = self.driver.find_element(By.CSS_SELECTOR, 
-                        "#REVIEW div.HTT4L8U0CU > div > div > a[class*='I3i1NSoFdB']")
+                    next_button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    break
                 except:
                     pass
             
             if not next_button or not next_button.is_displayed():
                 return False
             
-            # 버튼으로 스크롤
+            # 버튼으로 스크롤 후 클릭
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-            time.sleep(0.5)
-            
-            # 클릭
             self.driver.execute_script("arguments[0].click();", next_button)
-            time.sleep(4)
+            
+            # 리뷰 목록이 바뀔 때까지 대기 (바뀌지 않으면 실패)
+            if old_signature and not self.waiter.wait_for_review_change(self.driver, old_signature):
+                return False
             
             # 리뷰 영역으로 다시 스크롤
             self.driver.execute_script("window.scrollTo(0, 1500);")
-            time.sleep(3)
             
             return True
             
         except Exception as e:
             return False
     
+    @timed('paginate')
     def click_page_by_nth_child(self, nth_child):
         """nth-child 선택자로 페이지를 클릭합니다."""
+        from selenium.webdriver.common.by import By
+        
         try:
             old_signature = self.get_first_review_signature()
             
             # 페이지네이션 영역으로 스크롤
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.5)
+            selector = self.rules.page_button_selector(nth_child)
+            self._wait_for_pagination(selector)
             
             # nth-child CSS 선택자로 페이지 버튼 찾기
             page_button = None
             
             try:
-                selector = f"#REVIEW div.JHZoCyHfg7 div.HTT4L8U0CU > div > div > a:nth-child({nth_child})"
                 page_button = self.driver.find_element(By.CSS_SELECTOR, selector)
             except Exception as e:
                 return False
@@ -317,24 +937,19 @@ class NaverSmartStoreReviewCrawler:
             if not page_button or not page_button.is_displayed():
                 return False
             
-            # 버튼으로 스크롤
+            # 버튼으로 스크롤 후 클릭
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", page_button)
-            time.sleep(0.5)
-            
-            # 클릭
             self.driver.execute_script("arguments[0].click();", page_button)
-            time.sleep(4)
+            
+            # 리뷰 목록이 실제로 바뀔 때까지 대기 (바뀌지 않으면 실패)
+            if old_signature:
+                if not self.waiter.wait_for_review_change(self.driver, old_signature):
+                    return False
+            else:
+                self.waiter.wait_for_reviews(self.driver)
             
             # 리뷰 영역으로 스크롤
             self.driver.execute_script("window.scrollTo(0, 1500);")
-            time.sleep(3)
-            
-            # 페이지가 실제로 변경되었는지 확인
-            new_signature = self.get_first_review_signature()
-            
-            if old_signature and new_signature:
-                if old_signature == new_signature:
-                    return False
             
             return True
             
@@ -345,193 +960,369 @@ class NaverSmartStoreReviewCrawler:
         """페이지네이션을 통해 리뷰를 수집합니다."""
         print(f"[4/5] 페이지별 리뷰 수집 중... (목표: {max_reviews}개)")
         print("=" * 60)
+        self._notify('phase', phase='collecting')
+        
+        dedup = self.dedup
+        
+        # 평점 필터는 사이트 컨트롤로 먼저 적용 (증분 수집은 최신순이어야 하므로 평점순 정렬 제외)
+        self.apply_rating_filter(allow_sort=not dedup.tracks_known)
+        if dedup.tracks_known:
+            print(f"   🔁 증분 수집: 이미 수집한 리뷰 {dedup.known_size}개")
+            self.sort_by_latest()
+        
+        walk = PageWalk(self, max_reviews)
+        
+        def move():
+            if walk.next_page % 10 == 1:
+                print(f"\n   ⏭️  페이지 그룹 전환 중... (페이지 {walk.next_page}로)")
+            return self._move_to_page(walk.next_page, walk.navigation_failed)
+        
+        while True:
+            pending = self.start_page_extraction()
+            network = self.page_network
+            # 파싱하는 동안 다음 페이지로 이동 (이 페이지에서 멈추면 한 페이지를 더 연 것뿐)
+            moved = move() if not pending.done() and walk.can_advance() else None
+            if not walk.record(self.finish_page_extraction(pending), network):
+                break
+            if not (move() if moved is None else moved):
+                break
+            walk.advance()
+        
+        print(f"\n✅ 리뷰 수집 완료 (총 {self.collected_count}개)\n")
+        self.print_collect_stats()
+    
+    def _move_to_page(self, page, retry):
+        """page로 이동 (실패하면 retry(button_present)가 True인 동안 다시 시도, 이동했으면 True)
+        
+        retry는 page_button_present(page) 결과를 받아 다시 시도할지 정합니다 (예: PageWalk.navigation_failed).
+        """
+        old_signature = self.get_first_review_signature()
+        while not self.go_to_page(page):
+            # 대기 시간이 지난 뒤에 바뀐 목록이면 이동한 것 (다시 누르면 '다음' 그룹을 건너뜀)
+            signature = self.get_first_review_signature()
+            if old_signature and signature and signature != old_signature:
+                return True
+            if not retry(self.page_button_present(page)):
+                return False
+        return True
+    
+    def page_button_present(self, page):
+        """page로 이동하는 버튼이 보이는지 (True/False, 리뷰 목록이 없어 확인할 수 없으면 None)"""
+        try:
+            return self.driver.execute_script(PAGE_BUTTON_JS, self.page_button_selectors(page),
+                                              self.rules.review_item_selector)
+        except Exception:
+            return None
+    
+    def page_button_selectors(self, page):
+        """page로 이동하는 버튼의 선택자 목록 (go_to_page와 같은 nth-child 매핑)"""
+        rules = self.rules
+        if page > 1 and page % 10 == 1:
+            return rules.next_buttons
+        return [rules.page_button_selector((page - 1) % 10 + 2)]
+    
+    def go_to_page(self, page):
+        """현재 페이지 그룹 안의 page로 이동 (그룹 첫 페이지면 '다음' 버튼으로 다음 그룹으로 이동)"""
+        if page > 1 and page % 10 == 1:
+            return self.click_next_button()
+        # 페이지 1~10: nth-child(2)~(11), 이후 그룹의 2~10번째 페이지: nth-child(3)~(11)
+        return self.click_page_by_nth_child((page - 1) % 10 + 2)
+    
+    def _shard_crawler(self, driver, rating_mode=None):
+        """샤드용 크롤러 (같은 추출 설정, 리뷰 탭까지 이동하고 rating_mode 평점 필터를 적용한 상태로 반환)"""
+        shard = type(self)(
+            self.product_url, rating_filter=self.rating_filter, waiter=self.waiter,
+            extract_mode=self.extract_mode, parse_executor=self.parse_executor, rules=self._rules,
+            network_policy=self.network_policy, network_stats=self.network_stats,
+            rating_pushdown=self.rating_pushdown
+        )
+        shard.setup_driver(driver=driver)
+        shard.navigate_to_product()
+        shard.click_review_tab()
+        shard._match_rating_mode(rating_mode)
+        return shard
+    
+    def _match_rating_mode(self, mode):
+        """첫 번째 샤드와 같은 평점 필터 적용 (페이지 번호가 같은 목록을 가리키도록, 실패하면 예외)"""
+        if mode is not None and self.apply_rating_filter(allow_sort=False) != mode:
+            raise Exception("사이트 평점 필터를 적용하지 못했습니다")
+    
+    def collect_reviews_sharded(self, max_reviews=1000, shards=None):
+        """페이지 그룹을 여러 드라이버에 나눠 병렬로 수집합니다 (리뷰 탭이 열린 상태에서 호출).
+        
+        각 샤드는 아직 아무도 맡지 않은 가장 앞의 페이지 그룹을 가져가 '다음' 버튼으로 그 그룹까지 건너뛴 뒤
+        그룹 안의 페이지를 추출합니다. 추출한 페이지는 페이지 순서대로 중복 제거를 거쳐 기록하므로
+        번호와 결과 순서는 순차 수집과 같습니다. 샤드가 실패하면 처리하지 못한 그룹은 다른 샤드가 다시 맡습니다.
+        """
+        shards = shards or self.shards
+        print(f"[4/5] 페이지 그룹 병렬 수집 중... (샤드 {shards}개, 목표: {max_reviews}개)")
+        print("=" * 60)
+        self._notify('phase', phase='collecting')
+        # 평점 필터만 사이트 컨트롤로 적용 (평점순 정렬은 범위 끝을 페이지 순서대로 판단해야 하므로 제외)
+        rating_mode = self.apply_rating_filter(allow_sort=False)
         
-        current_page = 1
-        max_pages = 100
-        total_collected = 0
         start_time = time.time()
+        lock = threading.Lock()
+        stop = threading.Event()
+        state = {
+            'next_group': 0,
+            'last_page': 100,  # 순차 수집의 max_pages와 같음
+            'next_page': 1,    # 다음에 기록할 페이지
+            'empty_pages': 0,
+        }
+        retry_groups = []
+        pages = {}
+        errors = []
+        
+        def take_group():
+            with lock:
+                if self._stop_requested():
+                    stop.set()
+                if stop.is_set():
+                    return None
+                if retry_groups:
+                    group = heapq.heappop(retry_groups)
+                else:
+                    group = state['next_group']
+                    state['next_group'] += 1
+                if group * 10 + 1 > state['last_page']:
+                    return None
+                return group
+        
+        def end_at(page):
+            """page까지가 마지막 페이지 (이후 페이지는 없음)"""
+            with lock:
+                state['last_page'] = min(state['last_page'], page)
+                flush()
         
-        seen_reviews = set()
-        consecutive_failures = 0
+        def flush():
+            """페이지 순서대로 중복 제거 후 기록 (lock 안에서 호출)"""
+            while state['next_page'] in pages and not stop.is_set():
+                page = state['next_page']
+                page_reviews, network = pages.pop(page)
+                state['next_page'] += 1
+                new_reviews, duplicate_count, _ = self._accept_page(page_reviews, max_reviews)
+                self._emit_page(new_reviews, page, network)
+                self._print_page(page, len(new_reviews), duplicate_count, start_time)
+                
+                state['empty_pages'] = 0 if new_reviews else state['empty_pages'] + 1
+                if self.collected_count >= max_reviews:
+                    print(f"\n✅ 목표 달성! {self.collected_count}개 수집 ({int(time.time() - start_time)}초)")
+                    stop.set()
+                elif state['empty_pages'] >= 5:
+                    print(f"\n⚠️  5페이지 연속 수집 실패. 종료합니다.")
+                    stop.set()
+            if state['next_page'] > state['last_page']:
+                # 마지막 페이지까지 기록함 (last_page가 max_pages 그대로면 끝을 확인하지 못함)
+                self.reached_end = state['last_page'] < 100
+                stop.set()
         
-        # nth-child 매핑
-        # 페이지 1~10: nth-child(2)~(11)
-        # 페이지 11: '다음' 버튼 클릭
-        # 페이지 12~20: nth-child(3)~(11)
-        # 페이지 21: '다음' 버튼 클릭
-        # 페이지 22~30: nth-child(3)~(11)
+        def record(page, page_reviews, network):
+            with lock:
+                if page >= state['next_page']:
+                    pages[page] = (page_reviews, network)
+                flush()
         
-        while total_collected < max_reviews and current_page <= max_pages:
-            page_reviews = self.extract_reviews_from_current_page()
+        def move(crawler, page):
+            """page로 이동 (버튼이 없으면 False, 이동하지 못하면 예외로 맡은 그룹을 다른 샤드에 넘김)"""
+            failures = []
             
-            new_count = 0
-            duplicate_count = 0
+            def retry(button_present):
+                if button_present is False:
+                    return False
+                failures.append(page)
+                if len(failures) >= PageWalk.max_click_failures:
+                    raise Exception(f"페이지 {page}로 이동하지 못했습니다")
+                return True
             
-            if page_reviews:
-                for review in page_reviews:
-                    if total_collected >= max_reviews:
-                        break
-                    
-                    review_key = f"{review.get('date', '')}_{review.get('reviewer', '')}_{review['content'][:80]}"
+            return crawler._move_to_page(page, retry)
+        
+        def run_shard(index):
+            crawler = self if index == 0 else None
+            driver = None
+            failed = False
+            current_group = 0
+            group = None
+            try:
+                while True:
+                    group = take_group()
+                    if group is None:
+                        return
+                    if crawler is None:
+                        driver = (self.driver_factory or
+                                  (lambda: create_chrome_driver(build_chrome_options())))()
+                        crawler = self._shard_crawler(driver, rating_mode)
+                    elif group < current_group:
+                        # 다시 맡은 앞쪽 그룹은 처음부터 이동
+                        crawler.navigate_to_product()
+                        crawler.click_review_tab()
+                        crawler._match_rating_mode(rating_mode)
+                        current_group = 0
                     
-                    if review_key in seen_reviews:
-                        duplicate_count += 1
+                    # 맡은 그룹의 첫 페이지까지 '다음' 버튼으로 건너뜀
+                    while current_group < group:
+                        if not move(crawler, current_group * 10 + 11):
+                            end_at(current_group * 10 + 10)
+                            break
+                        current_group += 1
+                    if current_group < group:
                         continue
                     
-                    seen_reviews.add(review_key)
-                    review['number'] = total_collected + 1
-                    self.reviews.append(review)
-                    total_collected += 1
-                    new_count += 1
-                
-                elapsed = int(time.time() - start_time)
-                
-                if duplicate_count > 0:
-                    print(f"📄 페이지 {current_page}: {new_count}개 수집 ({duplicate_count}개 중복) | 누적: {total_collected}개 | {elapsed}초")
-                else:
-                    print(f"📄 페이지 {current_page}: {new_count}개 수집 | 누적: {total_collected}개 | {elapsed}초")
-                
-                if new_count == 0:
-                    consecutive_failures += 1
-                else:
-                    consecutive_failures = 0
-                
-                if consecutive_failures >= 5:
-                    print(f"\n⚠️  5페이지 연속 수집 실패. 종료합니다.")
-                    break
-            else:
-                consecutive_failures += 1
-                print(f"📄 페이지 {current_page}: 0개 수집 | 누적: {total_collected}개")
-                
-                if consecutive_failures >= 5:
-                    break
-            
-            if total_collected >= max_reviews:
-                print(f"\n✅ 목표 달성! {total_collected}개 수집 ({int(time.time() - start_time)}초)")
-                break
-            
-            # 다음 페이지로 이동
-            current_page += 1
-            
-            # nth-child 값 계산
-            if current_page <= 10:
-                # 페이지 1~10: nth-child(2)~(11)
-                nth_child = current_page + 1
-                
-                if not self.click_page_by_nth_child(nth_child):
-                    consecutive_failures += 1
-                    if consecutive_failures >= 3:
-                        break
-                        
-            elif current_page % 10 == 1:
-                # 페이지 11, 21, 31... : '다음' 버튼 클릭
-                print(f"\n   ⏭️  페이지 그룹 전환 중... (페이지 {current_page}로)")
-                
-                if self.click_next_button():
-                    print(f"   ✓ '다음' 버튼 클릭 완료\n")
-                else:
-                    print(f"   ⚠️  '다음' 버튼을 찾을 수 없습니다. 수집 종료.")
+                    first_page = group * 10 + 1
+                    parsing = None  # 다음 페이지로 이동하는 동안 파싱하는 페이지 (page, pending, network)
+                    for page in range(first_page, first_page + 10):
+                        if stop.is_set() or self._stop_requested():
+                            return
+                        moved = page == first_page or move(crawler, page)
+                        if parsing:
+                            record(parsing[0], crawler.finish_page_extraction(parsing[1]), parsing[2])
+                            parsing = None
+                        if not moved:
+                            end_at(page - 1)
+                            break
+                        parsing = (page, crawler.start_page_extraction(), crawler.page_network)
+                    if parsing:
+                        record(parsing[0], crawler.finish_page_extraction(parsing[1]), parsing[2])
+                    group = None
+            except Exception as e:
+                failed = True
+                print(f"   ⚠️  샤드 {index + 1} 실패: {e}")
+                with lock:
+                    errors.append(e)
+                    if group is not None:
+                        heapq.heappush(retry_groups, group)
+            finally:
+                if driver is not None:
+                    if self.release_driver:
+                        self.release_driver(driver, failed)
+                    else:
+                        try:
+                            driver.quit()
+                        except Exception:
+                            pass
+        
+        with ThreadPoolExecutor(max_workers=shards) as executor:
+            for i in range(shards):
+                executor.submit(run_shard, i)
+        self._should_stop()
+        if errors and not self.collected_count:
+            raise errors[0]
+        
+        print(f"\n✅ 리뷰 수집 완료 (총 {self.collected_count}개)\n")
+        self.print_collect_stats()
+    
+    def print_collect_stats(self):
+        """중복 제거 통계 (키당 메모리, Bloom 필터 오탐률)와 네트워크 집계"""
+        stats = self.dedup.stats()
+        line = f"   🧮 중복 제거: 키 {stats['seen']}개, 중복 {stats['duplicates']}개"
+        if stats['seen_bytes_per_key'] is not None:
+            line += f", 키당 {stats['seen_bytes_per_key']}바이트"
+        print(line)
+        if 'bloom_keys' in stats:
+            line = (f"   🧮 Bloom 필터: 키 {stats['bloom_keys']}개, {stats['bloom_bytes'] / 1024:.0f}KB, "
+                    f"예상 오탐률 {stats['bloom_expected_fp_rate']:.4%}")
+            if 'bloom_observed_fp_rate' in stats:
+                line += f", 측정 오탐률 {stats['bloom_observed_fp_rate']:.4%}"
+            print(line)
+        if self.network_stats:
+            print(f"   🌐 네트워크 합계: {format_counters(self.network_totals)}")
+    
+    @timed('collect')
+    def collect_reviews(self, max_reviews=1000):
+        """설정된 엔진으로 리뷰를 수집합니다 (request_stop()이 호출되면 페이지 사이에서 멈춤)."""
+        if self._should_stop():
+            return
+        if self.engine == 'api' and not self.dedup.tracks_known:
+            self.collect_reviews_via_api(max_reviews)
+        elif self.shards > 1 and not self.dedup.tracks_known:
+            self.collect_reviews_sharded(max_reviews)
+        else:
+            self.collect_reviews_by_pagination(max_reviews)
+    
+    def collect_reviews_via_api(self, max_reviews=1000, concurrency=4):
+        """리뷰 API를 직접 호출해 리뷰를 수집합니다.
+        
+        리뷰 탭 클릭 시 발생한 요청을 성능 로그에서 캡처하지 못하면 페이지네이션 방식으로 대체합니다.
+        """
+        from review_api import ReviewApiClient, capture_review_endpoint, review_from_api
+        
+        print(f"[4/5] 리뷰 API로 수집 중... (목표: {max_reviews}개)")
+        print("=" * 60)
+        self._notify('phase', phase='collecting')
+        
+        endpoint = None
+        try:
+            endpoint = capture_review_endpoint(self.driver)
+        except Exception as e:
+            print(f"   ⚠️  리뷰 API 캡처 실패: {e}")
+        
+        if endpoint is None:
+            print("   ⚠️  리뷰 API 요청을 찾지 못했습니다. 페이지네이션 방식으로 수집합니다.\n")
+            self.collect_reviews_by_pagination(max_reviews)
+            return
+        
+        print(f"   🔗 리뷰 API: {endpoint.method} {endpoint.url}")
+        start_time = time.time()
+        dedup = self.dedup
+        progress = {'page': 0, 'stopped': False}
+        
+        def on_page(items):
+            """받은 페이지를 바로 중복 제거 후 기록 (중단 요청 뒤에 받은 페이지는 버림)"""
+            progress['page'] += 1
+            if progress['stopped'] or self._should_stop():
+                progress['stopped'] = True
+                return
+            new_reviews = []
+            for item in items:
+                if self.collected_count + len(new_reviews) >= max_reviews:
                     break
-                    
-            else:
-                # 페이지 12~20, 22~30...: nth-child(3)~(11)
-                page_in_group = ((current_page - 1) % 10) + 1
-                nth_child = page_in_group + 1
-                
-                if not self.click_page_by_nth_child(nth_child):
-                    consecutive_failures += 1
-                    if consecutive_failures >= 3:
-                        break
+                review = review_from_api(item)
+                if not self.is_rating_match(review['rating']) or len(review['content']) < 3:
+                    continue
+                if dedup.check(review) != ReviewDeduper.NEW:
+                    continue
+                review['number'] = self.collected_count + len(new_reviews) + 1
+                new_reviews.append(review)
+            page_number = progress['page']
+            self._emit_page(new_reviews, page_number)
+            print(f"📄 페이지 {page_number}: {len(new_reviews)}개 수집 | 누적: {self.collected_count}개 | {int(time.time() - start_time)}초")
         
-        print(f"\n✅ 리뷰 수집 완료 (총 {len(self.reviews)}개)\n")
+        client = ReviewApiClient(endpoint, concurrency=concurrency)
+        asyncio.run(client.fetch_reviews(
+            max_reviews,
+            accept=lambda item: self.is_rating_match(review_from_api(item)['rating']),
+            should_stop=self._stop_requested,
+            on_page=on_page
+        ))
+        self.reached_end = client.reached_end
+        
+        print(f"\n✅ 리뷰 수집 완료 (총 {self.collected_count}개)\n")
+        self.print_collect_stats()
     
+    @timed('export')
     def save_to_csv(self, filename=None):
-        if not self.reviews:
+        if not self.collected_count:
             return None
         
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"denps_reviews_{timestamp}.csv"
         
-        df = pd.DataFrame(self.reviews)
-        column_order = ['number', 'date', 'rating', 'reviewer', 'content', 'tags', 'has_photo']
-        df = df[[col for col in column_order if col in df.columns]]
-        
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        write_csv(self.iter_reviews(), filename)
         print(f"💾 CSV 저장: {filename}")
         
         return filename
     
+    @timed('export')
     def save_to_excel(self, filename=None):
-        if not self.reviews:
+        if not self.collected_count:
             return None
         
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"denps_reviews_{timestamp}.xlsx"
         
-        df = pd.DataFrame(self.reviews)
-        
-        column_mapping = {
-            'number': '번호',
-            'date': '작성일',
-            'rating': '평점',
-            'reviewer': '작성자',
-            'content': '리뷰내용',
-            'tags': '태그',
-            'has_photo': '사진리뷰'
-        }
-        
-        df = df.rename(columns={k: v for k, v in column_mapping.items() if k in df.columns})
-        
-        if '사진리뷰' in df.columns:
-            df['사진리뷰'] = df['사진리뷰'].apply(lambda x: 'O' if x else 'X')
-        
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='리뷰데이터')
-            
-            worksheet = writer.sheets['리뷰데이터']
-            
-            column_widths = {
-                '번호': 8,
-                '작성일': 12,
-                '평점': 8,
-                '작성자': 15,
-                '리뷰내용': 80,
-                '태그': 30,
-                '사진리뷰': 10
-            }
-            
-            for col_name, width in column_widths.items():
-                if col_name in df.columns:
-                    col_idx = list(df.columns).index(col_name) + 1
-                    col_letter = worksheet.cell(row=1, column=col_idx).column_letter
-                    worksheet.column_dimensions[col_letter].width = width
-            
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            
-            for cell in worksheet[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            for row in worksheet.iter_rows(min_row=2, max_row=len(df)+1):
-                for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = Alignment(vertical='top', wrap_text=True)
-                    
-                    if cell.column_letter in ['A', 'C', 'G']:
-                        cell.alignment = Alignment(horizontal='center', vertical='center')
+        write_excel(self.iter_reviews(), filename)
         
         print(f"💾 Excel 저장: {filename}")
         print(f"   📂 위치: {os.path.abspath(filename)}")
@@ -539,16 +1330,18 @@ class NaverSmartStoreReviewCrawler:
         return filename
     
     def print_summary(self):
-        if not self.reviews:
+        if not self.collected_count:
             print("❌ 수집된 리뷰가 없습니다.")
             return
         
-        df = pd.DataFrame(self.reviews)
+        import pandas as pd
+        
+        df = pd.DataFrame(list(self.iter_reviews()))
         
         print("\n" + "=" * 60)
         print("📊 리뷰 수집 결과 요약")
         print("=" * 60)
-        print(f"\n✅ 총 수집: {len(self.reviews)}개")
+        print(f"\n✅ 총 수집: {len(df)}개")
         
         if self.rating_filter:
             print(f"⭐ 필터 적용: {self.rating_filter}점만 수집")
@@ -566,7 +1359,7 @@ class NaverSmartStoreReviewCrawler:
                     print(f"  {int(rating)}점: {count}개")
         
         photo_count = df['has_photo'].sum()
-        print(f"\n📷 사진 리뷰: {photo_count}개 ({photo_count/len(self.reviews)*100:.1f}%)")
+        print(f"\n📷 사진 리뷰: {photo_count}개 ({photo_count/len(df)*100:.1f}%)")
         
         df['content_length'] = df['content'].str.len()
         avg_length = df['content_length'].mean()
@@ -574,23 +1367,24 @@ class NaverSmartStoreReviewCrawler:
         
         print("\n📝 샘플 (상위 3개):")
         print("-" * 60)
-        for i, review in enumerate(self.reviews[:3], 1):
+        for i, review in enumerate(islice(self.iter_reviews(), 3), 1):
             print(f"\n[{i}] 평점: {review['rating']}점 | 날짜: {review.get('date', '')}")
             content = review['content'][:100] + "..." if len(review['content']) > 100 else review['content']
             print(f"    {content}")
     
     def close(self):
-        if self.driver:
+        if self.driver and self._owns_driver:
             self.driver.quit()
+        self.driver = None
     
     def run(self, max_reviews=1000):
         try:
             self.setup_driver()
             self.navigate_to_product()
             self.click_review_tab()
-            self.collect_reviews_by_pagination(max_reviews)
+            self.collect_reviews(max_reviews)
             
-            if self.reviews:
+            if self.collected_count:
                 self.print_summary()
                 csv_file = self.save_to_csv()
                 excel_file = self.save_to_excel()
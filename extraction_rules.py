@@ -0,0 +1,191 @@
+"""리뷰 추출 규칙 엔진
+
+선택자, 정규식, 대체 추출 방법을 extraction_rules.json 에 선언하고, 시작 시 한 번 컴파일해서
+브라우저 스크립트(EXTRACT_REVIEWS_JS)와 오프라인 파서(review_parser)가 함께 사용합니다.
+네이버가 클래스 이름을 바꾸면 규칙 파일만 수정하면 되고, 실행 중인 프로세스도 파일 변경을
+감지해 다시 불러옵니다.
+"""
+import json
+import os
+import re
+import threading
+import time
+
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_rules.json')
+
+
+class RulesError(ValueError):
+    """규칙 파일 형식 오류"""
+
+
+class FieldRule:
+    """필드 하나의 추출 규칙 (선택자 → 정규식 → 대체 추출 순서로 시도)"""
+    def __init__(self, name, spec):
+        self.name = name
+        self.selectors = list(spec.get('selectors', []))
+        self.selector_min_length = spec.get('selector_min_length', 1)
+        self.regex_source = spec.get('regex')
+        self.regex = re.compile(self.regex_source) if self.regex_source else None
+        self.fallback = spec.get('fallback')
+        self.min_length = spec.get('min_length', 1)
+        self.required = spec.get('required', False)
+        self.default = spec.get('default', '')
+
+    def match(self, text):
+        """전체 텍스트에 정규식 적용 (첫 번째 그룹, 없으면 전체 매치)"""
+        if not self.regex:
+            return ''
+        m = self.regex.search(text)
+        if not m:
+            return ''
+        return m.group(1) if m.groups() else m.group(0)
+
+    def to_js(self):
+        return {
+            'name': self.name,
+            'selectors': self.selectors,
+            'selector_min_length': self.selector_min_length,
+            'regex': self.regex_source,
+            'fallback': self.fallback,
+            'min_length': self.min_length,
+            'required': self.required,
+            'default': self.default,
+        }
+
+
+class ExtractionRules:
+    """컴파일된 추출 규칙"""
+
+    def __init__(self, spec, source=None):
+        try:
+            self.version = spec.get('version', 1)
+            self.review_root = spec['review_root']
+            self.review_list = spec['review_list']
+            self.review_item = spec.get('review_item', 'li')
+            self.min_item_text_length = spec.get('min_item_text_length', 5)
+            self.fields = [FieldRule(name, field) for name, field in spec['fields'].items()]
+
+            line_filter = spec.get('line_filter', {})
+            self.line_min_length = line_filter.get('min_length', 1)
+            # 제외 조건을 정규식 하나로 합쳐 줄마다 한 번만 검사
+            patterns = [f"(?:{p})" for p in line_filter.get('exclude_regex', [])]
+            patterns += [re.escape(token) for token in line_filter.get('exclude_contains', [])]
+            self.line_exclude_source = '|'.join(patterns)
+            self.line_exclude = re.compile(self.line_exclude_source) if patterns else None
+
+            self.tags = list(spec.get('tags', []))
+            sort = spec.get('sort', {})
+            self.sort_latest_text = sort.get('latest_text', '최신순')
+            self.sort_rating_high_text = sort.get('rating_high_text')
+            self.sort_rating_low_text = sort.get('rating_low_text')
+            # 리뷰 위젯의 평점 필터 (없으면 평점 정렬 또는 화면 밖 필터링으로 대체)
+            rating_filter = spec.get('rating_filter', {})
+            self.rating_toggle_texts = list(rating_filter.get('toggle_texts', []))
+            self.rating_option_regex = rating_filter.get('option_regex')
+            pagination = spec.get('pagination', {})
+            self.any_page_button = pagination['any_button']
+            self.page_button = pagination['page_button']
+            self.next_buttons = list(pagination['next_button'])
+        except (KeyError, TypeError, AttributeError, re.error) as e:
+            raise RulesError(f"잘못된 추출 규칙: {e}") from e
+
+        self.spec = spec
+        self.source = source
+        self._js_rules = None
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH):
+        with open(path, encoding='utf-8') as f:
+            try:
+                spec = json.load(f)
+            except ValueError as e:
+                raise RulesError(f"규칙 파일을 읽을 수 없습니다: {e}") from e
+        return cls(spec, source=path)
+
+    @property
+    def review_list_selector(self):
+        """문서 전체 기준 리뷰 목록 선택자"""
+        return f"{self.review_root} {self.review_list}"
+
+    @property
+    def review_item_selector(self):
+        """문서 전체 기준 리뷰 항목 선택자"""
+        return f"{self.review_list_selector} {self.review_item}"
+
+    def page_button_selector(self, nth_child):
+        return self.page_button.format(n=nth_child)
+
+    def rating_option_pattern(self, rating):
+        """평점 필터에서 rating점 항목을 찾는 정규식 (규칙이 없으면 None)"""
+        if not self.rating_option_regex:
+            return None
+        return self.rating_option_regex.replace('{n}', str(rating))
+
+    def filter_lines(self, text):
+        """메타 정보 줄(평점, 날짜, 작성자, 신고 등)을 제외한 본문 줄을 공백으로 연결"""
+        exclude = self.line_exclude
+        min_length = self.line_min_length
+        content_lines = []
+        for line in text.split('\n'):
+            line = line.strip()
+            if len(line) >= min_length and not (exclude and exclude.search(line)):
+                content_lines.append(line)
+        return ' '.join(content_lines)
+
+    def extract_tags(self, text):
+        return ', '.join(keyword for keyword in self.tags if keyword in text)
+
+    def to_js(self):
+        """브라우저 스크립트에 넘길 규칙 (JS 정규식과 호환되는 패턴만 사용)"""
+        if self._js_rules is None:
+            self._js_rules = {
+                'list': self.review_list_selector,
+                'item': self.review_item,
+                'min_item_text_length': self.min_item_text_length,
+                'fields': [field.to_js() for field in self.fields],
+                'line_min_length': self.line_min_length,
+                'line_exclude': self.line_exclude_source or None,
+            }
+        return self._js_rules
+
+
+class RulesStore:
+    """규칙 파일이 바뀌면 다시 불러오는 저장소 (잘못된 파일이면 이전 규칙 유지)"""
+
+    def __init__(self, path=DEFAULT_RULES_PATH, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._rules = ExtractionRules.load(path)
+        self._mtime = os.path.getmtime(path)
+        self._checked_at = time.time()
+        self.reloads = 0
+
+    def get(self):
+        now = time.time()
+        if now - self._checked_at < self.check_interval:
+            return self._rules
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                return self._rules
+            if mtime != self._mtime:
+                self._mtime = mtime
+                try:
+                    self._rules = ExtractionRules.load(self.path)
+                    self.reloads += 1
+                    print(f"🔄 추출 규칙을 다시 불러왔습니다: {self.path}")
+                except (OSError, RulesError) as e:
+                    print(f"⚠️  추출 규칙 다시 불러오기 실패 (이전 규칙 유지): {e}")
+        return self._rules
+
+
+rules_store = RulesStore(os.getenv('EXTRACTION_RULES', DEFAULT_RULES_PATH))
+
+
+def get_rules():
+    """현재 추출 규칙 (파일 변경 시 자동 갱신)"""
+    return rules_store.get()
@@ -14,7 +14,7 @@ export default function Home() {
     const [isLoading, setIsLoading] = useState(false);
     const toastShownRef = useRef(false);
 
-    // 작업 상태 폴링
+    // 작업 상태 구독 (SSE, 연결할 수 없으면 폴링으로 대체)
     useEffect(() => {
         if (!taskId) {
             toastShownRef.current = false;
@@ -22,38 +22,63 @@ export default function Home() {
         }
 
         let intervalId: NodeJS.Timeout | null = null;
+        let source: EventSource | null = null;
+
+        const stop = () => {
+            if (intervalId) clearInterval(intervalId);
+            intervalId = null;
+            source?.close();
+            source = null;
+        };
+
+        const handleStatus = (status: TaskStatus) => {
+            setTaskStatus(status);
+
+            // 완료, 실패 또는 취소 시 구독 종료 및 토스트 한 번만 표시
+            if (status.status === 'completed' && !toastShownRef.current) {
+                setIsLoading(false);
+                toastShownRef.current = true;
+                toast.success('크롤링이 완료되었습니다! 🎉');
+                stop();
+            } else if (status.status === 'failed' && !toastShownRef.current) {
+                setIsLoading(false);
+                toastShownRef.current = true;
+                toast.error('크롤링에 실패했습니다.');
+                stop();
+            } else if (status.status === 'cancelled' && !toastShownRef.current) {
+                setIsLoading(false);
+                toastShownRef.current = true;
+                toast(status.collected_count > 0
+                    ? `크롤링이 중단되었습니다 (${status.collected_count}개 수집)`
+                    : '크롤링이 취소되었습니다.');
+                stop();
+            }
+        };
 
         const pollStatus = async () => {
             try {
-                const status = await api.getStatus(taskId);
-                setTaskStatus(status);
-
-                // 완료 또는 실패 시 폴링 중지 및 토스트 한 번만 표시
-                if (status.status === 'completed' && !toastShownRef.current) {
-                    setIsLoading(false);
-                    toastShownRef.current = true;
-                    toast.success('크롤링이 완료되었습니다! 🎉');
-                    if (intervalId) clearInterval(intervalId);
-                } else if (status.status === 'failed' && !toastShownRef.current) {
-                    setIsLoading(false);
-                    toastShownRef.current = true;
-                    toast.error('크롤링에 실패했습니다.');
-                    if (intervalId) clearInterval(intervalId);
-                }
+                handleStatus(await api.getStatus(taskId));
             } catch (error) {
                 console.error('Status polling error:', error);
             }
         };
 
-        // 초기 조회
-        pollStatus();
+        const startPolling = () => {
+            source?.close();
+            source = null;
+            if (intervalId || toastShownRef.current) return;
+            pollStatus();
+            // 2초마다 상태 조회
+            intervalId = setInterval(pollStatus, 2000);
+        };
 
-        // 2초마다 상태 조회
-        intervalId = setInterval(pollStatus, 2000);
+        if (typeof EventSource !== 'undefined') {
+            source = api.subscribeStatus(taskId, handleStatus, startPolling);
+        } else {
+            startPolling();
+        }
 
-        return () => {
-            if (intervalId) clearInterval(intervalId);
-        };
+        return stop;
     }, [taskId]);
 
     const handleStartCrawl = async (data: {
@@ -80,6 +105,15 @@ export default function Home() {
         }
     };
 
+    const handleCancel = async () => {
+        if (!taskId) return;
+        try {
+            setTaskStatus(await api.cancelTask(taskId));
+        } catch (error: any) {
+            toast.error(error.response?.data?.detail || '작업을 취소하지 못했습니다');
+        }
+    };
+
     const handleReset = () => {
         setTaskId(null);
         setTaskStatus(null);
@@ -144,7 +178,16 @@ export default function Home() {
                             <ProgressTracker taskId={taskId} status={taskStatus} />
                         )}
 
-                        {taskStatus?.status === 'completed' && (
+                        {(taskStatus?.status === 'pending' || taskStatus?.status === 'processing') && (
+                            <button
+                                onClick={handleCancel}
+                                className="w-full py-3 px-6 bg-white text-gray-500 rounded-xl hover:bg-gray-50 hover:text-gray-700 transition-all duration-200 font-medium border border-gray-200"
+                            >
+                                수집 중단하기
+                            </button>
+                        )}
+
+                        {(taskStatus?.status === 'completed' || (taskStatus?.status === 'cancelled' && taskStatus.collected_count > 0)) && (
                             <div className="space-y-4">
                                 <ResultDownload
                                     taskId={taskId}
@@ -161,7 +204,7 @@ export default function Home() {
                             </div>
                         )}
 
-                        {taskStatus?.status === 'failed' && (
+                        {(taskStatus?.status === 'failed' || (taskStatus?.status === 'cancelled' && taskStatus.collected_count === 0)) && (
                             <button
                                 onClick={handleReset}
                                 className="w-full py-4 px-6 bg-red-50 text-red-600 rounded-xl hover:bg-red-100 transition-all duration-200 font-medium border border-red-100"
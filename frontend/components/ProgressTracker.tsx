@@ -1,7 +1,7 @@
 'use client';
 
 import React, { useEffect, useState } from 'react';
-import { Loader2, CheckCircle2, XCircle, TrendingUp } from 'lucide-react';
+import { Loader2, CheckCircle2, XCircle, TrendingUp, StopCircle } from 'lucide-react';
 import { TaskStatus } from '@/lib/api';
 
 interface ProgressTrackerProps {
@@ -31,6 +31,8 @@ export default function ProgressTracker({ taskId, status }: ProgressTrackerProps
                 return <CheckCircle2 className="w-8 h-8 text-green-500" />;
             case 'failed':
                 return <XCircle className="w-8 h-8 text-red-500" />;
+            case 'cancelled':
+                return <StopCircle className="w-8 h-8 text-gray-500" />;
         }
     };
 
@@ -44,6 +46,8 @@ export default function ProgressTracker({ taskId, status }: ProgressTrackerProps
                 return 'from-green-500 to-emerald-600';
             case 'failed':
                 return 'from-red-500 to-red-600';
+            case 'cancelled':
+                return 'from-gray-400 to-gray-500';
         }
     };
 
@@ -57,6 +61,8 @@ export default function ProgressTracker({ taskId, status }: ProgressTrackerProps
                 return '완료';
             case 'failed':
                 return '실패';
+            case 'cancelled':
+                return '중단됨';
         }
     };
 
@@ -100,6 +106,20 @@ export default function ProgressTracker({ taskId, status }: ProgressTrackerProps
                 </div>
             )}
 
+            {/* 대기열 정보 */}
+            {status.status === 'pending' && status.queue_position != null && (
+                <div className="flex items-center justify-between p-4 bg-blue-50 rounded-lg text-sm">
+                    <span className="text-gray-700">
+                        대기열 <span className="font-semibold text-blue-600">{status.queue_position}번째</span>
+                    </span>
+                    {status.estimated_wait_seconds != null && (
+                        <span className="text-gray-500">
+                            약 {Math.max(1, Math.ceil(status.estimated_wait_seconds / 60))}분 후 시작 예정
+                        </span>
+                    )}
+                </div>
+            )}
+
             {/* 상태 메시지 */}
             <div className="p-4 bg-gray-50 rounded-lg">
                 <p className="text-sm text-gray-700">{status.message}</p>
@@ -2,7 +2,7 @@
 
 import React from 'react';
 import { Download, FileSpreadsheet, FileText, Share2 } from 'lucide-react';
-import { api } from '@/lib/api';
+import { api, ExportFormat } from '@/lib/api';
 import toast from 'react-hot-toast';
 
 interface ResultDownloadProps {
@@ -11,10 +11,17 @@ interface ResultDownloadProps {
 }
 
 export default function ResultDownload({ taskId, collectedCount }: ResultDownloadProps) {
-    const handleDownload = (format: 'excel' | 'csv') => {
+    const formatNames: Record<ExportFormat, string> = {
+        excel: 'Excel',
+        csv: 'CSV',
+        jsonl: 'JSONL',
+        parquet: 'Parquet',
+    };
+
+    const handleDownload = (format: ExportFormat) => {
         const url = api.getDownloadUrl(taskId, format);
         window.open(url, '_blank');
-        toast.success(`${format === 'excel' ? 'Excel' : 'CSV'} 파일 다운로드 시작!`);
+        toast.success(`${formatNames[format]} 파일 다운로드 시작!`);
     };
 
     const handleShare = () => {
@@ -71,6 +78,17 @@ export default function ResultDownload({ taskId, collectedCount }: ResultDownloa
                 </button>
             </div>
 
+            {/* 데이터 분석용 형식 */}
+            <div className="flex items-center justify-center gap-4 text-sm text-gray-500">
+                <span>분석용 형식:</span>
+                <button onClick={() => handleDownload('jsonl')} className="underline hover:text-naver-green">
+                    JSONL
+                </button>
+                <button onClick={() => handleDownload('parquet')} className="underline hover:text-naver-green">
+                    Parquet
+                </button>
+            </div>
+
             {/* 공유 버튼 */}
             <button
                 onClick={handleShare}
@@ -9,6 +9,9 @@ export interface CrawlRequest {
     product_url: string;
     rating_filter: number[] | null;
     max_reviews: number;
+    use_cache?: boolean;
+    incremental?: boolean;
+    deadline_seconds?: number | null;
 }
 
 export interface CrawlResponse {
@@ -19,15 +22,21 @@ export interface CrawlResponse {
 
 export interface TaskStatus {
     task_id: string;
-    status: 'pending' | 'processing' | 'completed' | 'failed';
+    status: 'pending' | 'processing' | 'completed' | 'failed' | 'cancelled';
     progress: number;
     collected_count: number;
     total_target: number;
     message: string;
     error?: string;
     download_url?: string;
+    queue_position?: number | null;
+    estimated_start_time?: string | null;
+    estimated_wait_seconds?: number | null;
+    from_cache?: boolean;
 }
 
+export type ExportFormat = 'excel' | 'csv' | 'jsonl' | 'parquet';
+
 export const api = {
     // 크롤링 시작
     startCrawl: async (data: CrawlRequest): Promise<CrawlResponse> => {
@@ -41,8 +50,30 @@ export const api = {
         return response.data;
     },
 
+    // 작업 취소 (수집 중이면 현재 페이지까지 수집한 뒤 멈춤)
+    cancelTask: async (taskId: string): Promise<TaskStatus> => {
+        const response = await axios.delete(`${API_URL}/api/tasks/${taskId}`);
+        return response.data;
+    },
+
+    // 진행 이벤트 구독 (Server-Sent Events), 반환된 EventSource를 close()하면 구독 종료
+    subscribeStatus: (
+        taskId: string,
+        onStatus: (status: TaskStatus) => void,
+        onError?: () => void
+    ): EventSource => {
+        const source = new EventSource(`${API_URL}/api/tasks/${taskId}/events`);
+        source.addEventListener('status', (event) => {
+            onStatus(JSON.parse((event as MessageEvent).data));
+        });
+        if (onError) {
+            source.onerror = onError;
+        }
+        return source;
+    },
+
     // 파일 다운로드 URL
-    getDownloadUrl: (taskId: string, format: 'excel' | 'csv' = 'excel'): string => {
+    getDownloadUrl: (taskId: string, format: ExportFormat = 'excel'): string => {
         return `${API_URL}/api/download/${taskId}?format=${format}`;
     },
 
@@ -0,0 +1,154 @@
+"""네트워크 차단 정책과 페이지별 전송량 집계
+
+Chrome은 --disable-images 옵션을 무시하므로, 리뷰 수집에 필요 없는 요청(상품 이미지, 폰트, 동영상,
+광고/통계 스크립트)은 CDP Network.setBlockedURLs로 차단합니다. 리소스 종류는 URL 패턴(확장자)으로
+변환합니다 (요청 가로채기 이벤트는 Selenium의 execute_cdp_cmd로 받을 수 없음).
+
+전송량은 Chrome 성능 로그(goog:loggingPrefs {'performance': 'ALL'})의 Network 이벤트로 집계합니다.
+  - requests: 시작된 요청 수 (차단된 요청 포함)
+  - blocked: 정책으로 차단된 요청 수
+  - failed: 그 밖의 이유로 실패한 요청 수
+  - bytes: 실제로 전송된 바이트 수 (압축된 크기, 헤더 포함)
+"""
+import json
+import os
+import threading
+
+
+# 리소스 종류별 URL 패턴 (이미지 주소 뒤에 ?type=... 같은 쿼리가 붙으므로 끝에도 * 사용)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*', '*.bmp*', '*.avif*',
+              '*phinf.pstatic.net*'],
+    'font': ['*.woff*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*'],
+    'stylesheet': ['*.css*'],
+}
+
+DEFAULT_BLOCKED_TYPES = ['image', 'font', 'media']
+
+# 광고/통계 요청 (리뷰 위젯 렌더링과 무관)
+DEFAULT_BLOCKED_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*facebook.net*',
+    '*wcs.naver.net*',
+    '*lcs.naver.com*',
+    '*nlog.naver.com*',
+    '*tivan.naver.com*',
+    '*adcr.naver.com*',
+    '*veta.naver.com*',
+]
+
+
+def _split_env(name):
+    value = os.getenv(name)
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class NetworkPolicy:
+    """차단할 리소스 종류와 URL 패턴 (드라이버의 현재 탭에 적용)"""
+
+    def __init__(self, blocked_types=None, blocked_patterns=None, enabled=True):
+        self.blocked_types = list(DEFAULT_BLOCKED_TYPES if blocked_types is None else blocked_types)
+        self.blocked_patterns = list(DEFAULT_BLOCKED_PATTERNS if blocked_patterns is None else blocked_patterns)
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수로 정책 생성
+
+        NETWORK_BLOCKING=0: 차단 안 함
+        NETWORK_BLOCK_TYPES: 차단할 리소스 종류 (쉼표 구분, 기본 image,font,media)
+        NETWORK_BLOCK_PATTERNS: 기본 광고/통계 패턴에 더할 URL 패턴 (쉼표 구분)
+        """
+        extra = _split_env('NETWORK_BLOCK_PATTERNS') or []
+        return cls(
+            blocked_types=_split_env('NETWORK_BLOCK_TYPES'),
+            blocked_patterns=DEFAULT_BLOCKED_PATTERNS + extra,
+            enabled=os.getenv('NETWORK_BLOCKING', '1') != '0',
+        )
+
+    def url_patterns(self):
+        patterns = []
+        for resource_type in self.blocked_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        return patterns + self.blocked_patterns
+
+    def apply(self, driver):
+        """현재 탭에 차단 목록 적용 (CDP를 지원하지 않는 드라이버면 False)"""
+        if not self.enabled:
+            return False
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.url_patterns()})
+            return True
+        except Exception as e:
+            print(f"   ⚠️  네트워크 차단 정책 적용 실패: {e}")
+            return False
+
+
+def empty_counters():
+    return {'requests': 0, 'blocked': 0, 'failed': 0, 'bytes': 0}
+
+
+def add_counters(total, counters):
+    for key, value in counters.items():
+        total[key] = total.get(key, 0) + value
+    return total
+
+
+def format_counters(counters):
+    return (f"요청 {counters['requests']}개 (차단 {counters['blocked']}개), "
+            f"전송 {counters['bytes'] / 1024:.0f}KB")
+
+
+class NetworkMeter:
+    """성능 로그로 요청 수/전송 바이트 집계
+
+    로그는 드라이버 전체에서 하나이므로, 여러 탭이 같은 드라이버를 쓰면 탭(webview)별로 나눠 보관합니다.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def webview_id(window_handle):
+        """창 핸들을 성능 로그의 webview ID로 변환"""
+        return window_handle.replace('CDwindow-', '') if window_handle else None
+
+    def _drain(self):
+        for entry in self.driver.get_log('performance'):
+            try:
+                data = json.loads(entry['message'])
+                message = data['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            counters = self._pending.setdefault(data.get('webview'), empty_counters())
+            if method == 'Network.requestWillBeSent':
+                counters['requests'] += 1
+            elif method == 'Network.loadingFinished':
+                counters['bytes'] += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed':
+                counters['blocked' if params.get('blockedReason') else 'failed'] += 1
+
+    def measure(self, webview=None):
+        """지난 측정 이후의 집계 반환 (webview가 None이면 모든 탭 합계)"""
+        with self._lock:
+            try:
+                self._drain()
+            except Exception:
+                return empty_counters()
+            if webview is None:
+                result = empty_counters()
+                for counters in self._pending.values():
+                    add_counters(result, counters)
+                self._pending.clear()
+                return result
+            return self._pending.pop(webview, empty_counters())
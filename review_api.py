@@ -0,0 +1,229 @@
+"""리뷰 JSON API 수집 엔진
+
+리뷰 위젯은 XHR로 리뷰 JSON을 받아 렌더링합니다. 이 모듈은 Chrome 성능 로그(CDP Network
+이벤트)에서 그 요청(URL, 메서드, 헤더, 본문)을 한 번 캡처한 뒤, 이후 페이지는 브라우저 없이
+비동기 HTTP 클라이언트로 직접 요청합니다.
+
+ReviewEndpoint를 직접 만들면 로컬 테스트 서버에도 그대로 사용할 수 있습니다.
+"""
+import asyncio
+import json
+import time
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from review_parser import extract_tags
+
+
+# 리뷰 목록 XHR로 판단할 URL 조각
+REVIEW_URL_PATTERNS = ['/reviews/query-pages', '/contents/reviews']
+
+# 요청에 다시 실어 보낼 헤더 (쿠키는 드라이버에서 따로 가져옴)
+FORWARD_HEADERS = {'accept', 'content-type', 'referer', 'user-agent', 'x-client-version'}
+
+# 응답 JSON 필드 후보 (앞에서부터 먼저 찾은 값을 사용)
+ITEM_LIST_KEYS = ['contents', 'reviews', 'items']
+RATING_KEYS = ['reviewScore', 'score', 'rating']
+CONTENT_KEYS = ['reviewContent', 'content']
+DATE_KEYS = ['createDate', 'createdDate', 'regDate']
+REVIEWER_KEYS = ['writerMemberId', 'writerMemberMaskedId', 'writerNickname', 'writerId']
+ATTACH_KEYS = ['reviewAttaches', 'attaches', 'images', 'photos']
+
+
+class ReviewEndpoint:
+    """캡처한 리뷰 API 요청 정보"""
+    def __init__(self, url, method='GET', headers=None, body=None, cookies=None, page_key='page'):
+        self.url = url
+        self.method = method.upper()
+        self.headers = headers or {}
+        self.body = body
+        self.cookies = cookies or {}
+        self.page_key = page_key
+
+    def request_for_page(self, page, page_size=None):
+        """page번째 페이지 요청의 (url, body) 반환"""
+        if self.method == 'GET' or not isinstance(self.body, dict):
+            parts = urlsplit(self.url)
+            query = dict(parse_qsl(parts.query))
+            query[self.page_key] = str(page)
+            if page_size and 'pageSize' in query:
+                query['pageSize'] = str(page_size)
+            return urlunsplit(parts._replace(query=urlencode(query))), self.body
+
+        body = dict(self.body)
+        body[self.page_key] = page
+        if page_size and 'pageSize' in body:
+            body['pageSize'] = page_size
+        return self.url, body
+
+
+def _first(data, keys, default=None):
+    for key in keys:
+        if isinstance(data, dict) and data.get(key) not in (None, ''):
+            return data[key]
+    return default
+
+
+def _format_date(value):
+    """API 날짜(ISO 문자열 또는 epoch ms)를 화면 표기(YY.MM.DD)로 변환"""
+    if value in (None, ''):
+        return ''
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000).strftime('%y.%m.%d')
+    text = str(value)
+    try:
+        return datetime.strptime(text[:10], '%Y-%m-%d').strftime('%y.%m.%d')
+    except ValueError:
+        return text
+
+
+def review_from_api(item):
+    """API 리뷰 항목을 크롤러 리뷰 데이터 형식으로 변환"""
+    rating = _first(item, RATING_KEYS, '')
+    content = str(_first(item, CONTENT_KEYS, '')).strip()
+    attaches = _first(item, ATTACH_KEYS, []) or []
+    return {
+        'content': content,
+        'rating': str(rating) if rating != '' else '',
+        'date': _format_date(_first(item, DATE_KEYS)),
+        'reviewer': str(_first(item, REVIEWER_KEYS, '')),
+        'has_photo': len(attaches) > 0,
+        'tags': extract_tags(content),
+    }
+
+
+def extract_items(payload):
+    """응답 JSON에서 리뷰 항목 목록 추출"""
+    if isinstance(payload, list):
+        return payload
+    items = _first(payload, ITEM_LIST_KEYS)
+    if items is None and isinstance(payload.get('data'), dict):
+        items = _first(payload['data'], ITEM_LIST_KEYS)
+    return items or []
+
+
+def _total_pages(payload):
+    if not isinstance(payload, dict):
+        return None
+    source = payload.get('data') if isinstance(payload.get('data'), dict) else payload
+    total = source.get('totalPages')
+    return int(total) if total else None
+
+
+def capture_review_endpoint(driver, timeout=10, patterns=None):
+    """성능 로그에서 리뷰 API 요청을 찾아 ReviewEndpoint로 반환 (못 찾으면 None)
+
+    드라이버는 goog:loggingPrefs {'performance': 'ALL'} 옵션으로 실행되어야 합니다.
+    """
+    patterns = patterns or REVIEW_URL_PATTERNS
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        for entry in driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            if message.get('method') != 'Network.requestWillBeSent':
+                continue
+            request = message['params']['request']
+            if not any(pattern in request['url'] for pattern in patterns):
+                continue
+
+            headers = {
+                k: v for k, v in request.get('headers', {}).items()
+                if k.lower() in FORWARD_HEADERS
+            }
+            body = request.get('postData')
+            if body:
+                try:
+                    body = json.loads(body)
+                except ValueError:
+                    pass
+            cookies = {c['name']: c['value'] for c in driver.get_cookies()}
+            return ReviewEndpoint(request['url'], request['method'], headers, body, cookies)
+        time.sleep(0.2)
+    return None
+
+
+class ReviewApiClient:
+    """연결을 재사용하는 비동기 리뷰 API 클라이언트"""
+
+    def __init__(self, endpoint, concurrency=4, timeout=10.0, retries=2):
+        self.endpoint = endpoint
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        # 마지막 fetch_reviews가 리뷰 목록 끝까지 요청했는지
+        self.reached_end = False
+
+    async def _fetch_page(self, client, page, page_size=None):
+        url, body = self.endpoint.request_for_page(page, page_size)
+        for attempt in range(self.retries + 1):
+            try:
+                if self.endpoint.method == 'GET':
+                    response = await client.get(url)
+                elif isinstance(body, dict):
+                    response = await client.request(self.endpoint.method, url, json=body)
+                else:
+                    response = await client.request(self.endpoint.method, url, content=body)
+                response.raise_for_status()
+                return response.json()
+            except (httpx.HTTPError, ValueError):
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(0.5 * (attempt + 1))
+
+    async def fetch_reviews(self, max_reviews, start_page=1, page_size=None, accept=None, should_stop=None,
+                            on_page=None):
+        """start_page부터 max_reviews개를 채울 때까지 페이지별 리뷰 항목을 순서대로 반환
+
+        첫 페이지로 전체 페이지 수를 확인한 뒤 나머지는 concurrency개씩 동시에 요청합니다.
+        accept: 지정하면 이 조건을 만족하는 항목만 max_reviews 개수에 포함
+        should_stop: 지정하면 다음 페이지 묶음을 요청하기 전마다 호출해 참이면 그때까지 받은 페이지만 반환
+        on_page: 지정하면 앞 페이지까지 모두 받은 페이지를 바로 on_page(items)로 넘기고 목록에는 쌓지 않음 (빈 목록 반환)
+        """
+        pages = []
+
+        def emit(items):
+            if on_page is None:
+                pages.append(items)
+            else:
+                on_page(items)
+            return sum(1 for item in items if accept(item)) if accept else len(items)
+
+        limits = httpx.Limits(max_connections=self.concurrency,
+                              max_keepalive_connections=self.concurrency)
+        async with httpx.AsyncClient(headers=self.endpoint.headers, cookies=self.endpoint.cookies,
+                                     limits=limits, timeout=self.timeout) as client:
+            first = await self._fetch_page(client, start_page, page_size)
+            items = extract_items(first)
+            collected = emit(items)
+            total_pages = _total_pages(first)
+            page = start_page + 1
+
+            while collected < max_reviews and items:
+                if total_pages is not None and page > total_pages:
+                    break
+                if should_stop is not None and should_stop():
+                    break
+                batch = list(range(page, page + self.concurrency))
+                if total_pages is not None:
+                    batch = [p for p in batch if p <= total_pages]
+                # 묶음을 동시에 요청하고, 응답은 페이지 순서대로 받는 대로 넘김
+                tasks = [asyncio.ensure_future(self._fetch_page(client, p, page_size)) for p in batch]
+                try:
+                    for task in tasks:
+                        items = extract_items(await task)
+                        collected += emit(items)
+                        if not items:
+                            break
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                page += len(batch)
+
+            # 빈 페이지를 받았거나 전체 페이지를 모두 요청함 (max_reviews에 도달해 멈춘 것이 아님)
+            self.reached_end = not items or (total_pages is not None and page > total_pages)
+            return pages
@@ -0,0 +1,316 @@
+"""리뷰 중복 제거
+
+리뷰 키(작성일_작성자_본문 앞 80자) 문자열 대신 64비트 해시만 배열에 저장하는 집합과,
+제품별로 파일에 저장해 실행 간에 공유하는 Bloom 필터를 제공합니다.
+
+  - HashSet: array('Q') 기반 개방 주소법 집합 (키당 약 16~32바이트)
+  - BloomFilter: 제품별 비트 배열 파일 (키당 약 1.8바이트, 오탐률 0.1% 기준)
+  - ReviewDeduper: 한 번의 수집에서 리뷰를 새 리뷰/중복/이미 수집한 리뷰로 분류
+"""
+import hashlib
+import math
+import os
+import re
+import struct
+import tempfile
+import threading
+from array import array
+
+
+def review_key(review):
+    """중복 판별용 리뷰 키 (날짜 + 작성자 + 본문 앞 80자)"""
+    return f"{review.get('date', '')}_{review.get('reviewer', '')}_{review['content'][:80]}"
+
+
+def key_hash(key):
+    """리뷰 키 문자열의 64비트 해시"""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def review_hash(review):
+    """리뷰의 64비트 해시"""
+    return key_hash(review_key(review))
+
+
+class HashSet:
+    """64비트 해시 집합 (선형 탐사, 빈 칸은 0, 사용률 50%를 넘으면 두 배로 확장)"""
+
+    def __init__(self, capacity=64):
+        size = 16
+        while size < capacity * 2:
+            size *= 2
+        self._table = array('Q', bytes(8 * size))
+        self._mask = size - 1
+        self._count = 0
+
+    @classmethod
+    def from_keys(cls, keys):
+        """리뷰 키 문자열 이터러블로 생성"""
+        hashes = cls()
+        for key in keys:
+            hashes.add(key_hash(key))
+        return hashes
+
+    def _find(self, h):
+        table = self._table
+        mask = self._mask
+        i = h & mask
+        while True:
+            value = table[i]
+            if value == 0 or value == h:
+                return i, value
+            i = (i + 1) & mask
+
+    def add(self, h):
+        """해시 추가 (새로 추가했으면 True)"""
+        h = h or 1
+        i, value = self._find(h)
+        if value:
+            return False
+        self._table[i] = h
+        self._count += 1
+        if self._count * 2 > len(self._table):
+            self._grow()
+        return True
+
+    def _grow(self):
+        old = self._table
+        self._table = array('Q', bytes(8 * len(old) * 2))
+        self._mask = len(self._table) - 1
+        for h in old:
+            if h:
+                i, _ = self._find(h)
+                self._table[i] = h
+
+    def __contains__(self, h):
+        return self._find(h or 1)[1] != 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def memory_bytes(self):
+        return self._table.itemsize * len(self._table)
+
+
+# 같은 파일에 저장하는 BloomFilter 사이의 경로별 잠금 (파일의 비트를 읽어 합친 뒤 교체하는 동안 유지)
+_save_locks = {}
+_save_locks_guard = threading.Lock()
+
+
+def _save_lock(path):
+    with _save_locks_guard:
+        return _save_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+class BloomFilter:
+    """파일에 저장하는 Bloom 필터 (64비트 해시 하나로 이중 해싱해 k개 비트 위치 계산)"""
+
+    MAGIC = b'RVBF'
+    HEADER = struct.Struct('<4sQIQ')  # magic, 비트 수, 해시 수, 추가한 키 수
+
+    def __init__(self, num_bits, num_hashes, bits=None, count=0, path=None):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+        self.count = count
+        self.path = path
+
+    @classmethod
+    def for_capacity(cls, capacity, error_rate=0.001, path=None):
+        """capacity개를 넣었을 때 오탐률이 error_rate가 되도록 크기 결정"""
+        num_bits = max(64, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        return cls(num_bits, num_hashes, path=path)
+
+    @classmethod
+    def open(cls, directory, name, capacity=100000, error_rate=0.001):
+        """directory/name.bloom 파일을 불러오거나 새로 생성"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, re.sub(r'[^0-9A-Za-z._-]', '_', name) + '.bloom')
+        try:
+            return cls._read(path)
+        except FileNotFoundError:
+            return cls.for_capacity(capacity, error_rate, path=path)
+
+    @classmethod
+    def _read(cls, path):
+        with open(path, 'rb') as f:
+            magic, num_bits, num_hashes, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"Bloom 필터 파일이 아닙니다: {path}")
+            bits = bytearray(f.read())
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Bloom 필터 파일이 손상되었습니다: {path}")
+        return cls(num_bits, num_hashes, bits, count, path)
+
+    def save(self, path=None):
+        """파일에 저장된 비트와 합쳐 임시 파일에 쓴 뒤 교체 (저장 도중 종료되어도 이전 파일 유지)
+
+        같은 제품을 동시에 수집한 다른 필터가 먼저 저장한 키를 잃지 않도록, 경로별 잠금 안에서
+        파일의 비트를 OR로 합친 뒤 mkstemp로 만든 임시 파일로 교체합니다.
+        """
+        path = path or self.path
+        with _save_lock(path):
+            self._merge_file(path)
+            fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                            dir=os.path.dirname(path) or '.')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self.HEADER.pack(self.MAGIC, self.num_bits, self.num_hashes, self.count))
+                    f.write(self.bits)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    def _merge_file(self, path):
+        """path에 저장된 같은 크기의 필터 비트를 합침 (크기가 다르거나 읽을 수 없는 파일은 덮어씀)"""
+        try:
+            saved = self._read(path)
+        except (FileNotFoundError, ValueError, struct.error):
+            return
+        if (saved.num_bits, saved.num_hashes) != (self.num_bits, self.num_hashes):
+            return
+        merged = (int.from_bytes(self.bits, 'little') | int.from_bytes(saved.bits, 'little')).to_bytes(
+            len(self.bits), 'little')
+        if merged == self.bits:
+            return
+        self.bits = bytearray(merged)
+        # 합친 키 수는 설정된 비트 비율로 추정 (n = -m/k * ln(1 - X/m))
+        set_bits = sum(bin(byte).count('1') for byte in merged)
+        estimate = -self.num_bits / self.num_hashes * math.log(1 - min(set_bits, self.num_bits - 1) / self.num_bits)
+        self.count = max(self.count, saved.count, int(round(estimate)))
+
+    def _positions(self, h):
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, h):
+        """키 추가 (모든 비트가 이미 설정된 키는 count에 더하지 않음, 같은 키를 다시 넣어도 예상 오탐률 유지)"""
+        bits = self.bits
+        changed = False
+        for pos in self._positions(h):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                changed = True
+        if changed:
+            self.count += 1
+
+    def __contains__(self, h):
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(h))
+
+    @property
+    def memory_bytes(self):
+        return len(self.bits)
+
+    def false_positive_rate(self):
+        """현재 추가한 키 수 기준 예상 오탐률 (1 - e^(-kn/m))^k"""
+        if not self.count:
+            return 0.0
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class ReviewDeduper:
+    """한 번의 수집에서 리뷰를 분류하는 중복 제거기
+
+    - DUPLICATE: 이번 수집에서 이미 나온 리뷰
+    - KNOWN: 이전 수집에서 저장한 리뷰 (known 해시 집합 또는 Bloom 필터, skip_known일 때만)
+    - NEW: 새 리뷰 (이번 수집 집합과 Bloom 필터에 추가)
+
+    known과 bloom을 함께 주면 Bloom 필터가 '있음'이라고 했지만 known에 없는 경우를 세어
+    실제 오탐률을 측정합니다.
+    """
+    NEW = 'new'
+    DUPLICATE = 'duplicate'
+    KNOWN = 'known'
+
+    def __init__(self, known=None, bloom=None, skip_known=True):
+        self.seen = HashSet()
+        self.known = known
+        self.bloom = bloom
+        self.skip_known = skip_known
+        self.duplicates = 0
+        self.known_hits = 0
+        self.bloom_checks = 0
+        self.bloom_hits = 0
+        self.bloom_false_positives = 0
+
+    @property
+    def known_size(self):
+        """이전 수집 리뷰 수"""
+        if self.known is not None:
+            return len(self.known)
+        return self.bloom.count if self.bloom is not None else 0
+
+    @property
+    def tracks_known(self):
+        """이전 수집 리뷰를 건너뛰는지 (증분 수집)"""
+        return self.skip_known and (self.known is not None or self.bloom is not None)
+
+    def _is_known(self, h):
+        in_known = self.known is not None and h in self.known
+        if self.bloom is None:
+            return in_known
+        self.bloom_checks += 1
+        in_bloom = h in self.bloom
+        if in_bloom:
+            self.bloom_hits += 1
+            if self.known is not None and not in_known:
+                self.bloom_false_positives += 1
+        return in_known or (in_bloom if self.known is None else False)
+
+    def check(self, review):
+        """리뷰 분류 (NEW, DUPLICATE, KNOWN)"""
+        h = review_hash(review) or 1
+        if h in self.seen:
+            self.duplicates += 1
+            return self.DUPLICATE
+        if self.skip_known and self._is_known(h):
+            self.known_hits += 1
+            return self.KNOWN
+        self.seen.add(h)
+        if self.bloom is not None:
+            self.bloom.add(h)
+        return self.NEW
+
+    def save(self):
+        """Bloom 필터를 파일에 저장 (수집 결과를 저장한 뒤 호출)"""
+        if self.bloom is not None and self.bloom.path:
+            self.bloom.save()
+
+    def stats(self):
+        seen = len(self.seen)
+        stats = {
+            'seen': seen,
+            'duplicates': self.duplicates,
+            'known_hits': self.known_hits,
+            'seen_bytes_per_key': round(self.seen.memory_bytes / seen, 1) if seen else None,
+        }
+        if self.known is not None:
+            stats['known'] = len(self.known)
+            stats['known_bytes_per_key'] = (
+                round(self.known.memory_bytes / len(self.known), 1) if len(self.known) else None
+            )
+        if self.bloom is not None:
+            stats.update({
+                'bloom_keys': self.bloom.count,
+                'bloom_bytes': self.bloom.memory_bytes,
+                'bloom_bytes_per_key': round(self.bloom.memory_bytes / self.bloom.count, 2) if self.bloom.count else None,
+                'bloom_expected_fp_rate': self.bloom.false_positive_rate(),
+                'bloom_checks': self.bloom_checks,
+                'bloom_hits': self.bloom_hits,
+            })
+            if self.known is not None:
+                negatives = self.bloom_checks - (self.bloom_hits - self.bloom_false_positives)
+                stats['bloom_observed_fp_rate'] = (
+                    self.bloom_false_positives / negatives if negatives else 0.0
+                )
+        return stats
@@ -0,0 +1,154 @@
+"""리뷰 페이지 HTML 오프라인 파서
+
+크롤러가 캡처한 `#REVIEW` 영역의 outerHTML을 Selenium 없이 파싱합니다.
+브라우저 안에서 추출하는 EXTRACT_REVIEWS_JS와 같은 추출 규칙(extraction_rules.json)을
+사용하므로 저장해 둔 HTML로 결과를 재현할 수 있습니다.
+
+사용 예 (저장된 HTML 파일 파싱):
+    python review_parser.py page_001.html --rating 4 5
+"""
+import argparse
+import json
+import re
+import sys
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+from extraction_rules import get_rules
+
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# innerText에서 줄바꿈을 만드는 블록 요소
+BLOCK_TAGS = {
+    'div', 'p', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'section', 'article',
+    'header', 'footer', 'table', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+}
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+# 컴파일된 CSS 선택자 캐시 (규칙이 바뀌면 새 선택자만 추가로 컴파일)
+_selector_cache = {}
+
+
+def _css(selector):
+    compiled = _selector_cache.get(selector)
+    if compiled is None:
+        compiled = _selector_cache[selector] = CSSSelector(selector)
+    return compiled
+
+
+def _collect_text(node, parts):
+    tag = node.tag if isinstance(node.tag, str) else None
+    if tag is not None and tag not in SKIP_TAGS:
+        block = tag in BLOCK_TAGS
+        if block or tag == 'br':
+            parts.append('\n')
+        if node.text:
+            parts.append(WHITESPACE_RE.sub(' ', node.text))
+        for child in node:
+            _collect_text(child, parts)
+        if block:
+            parts.append('\n')
+    if node.tail:
+        parts.append(WHITESPACE_RE.sub(' ', node.tail))
+
+
+def inner_text(element):
+    """브라우저 innerText와 비슷하게 블록 요소 단위로 줄을 나눈 텍스트 반환"""
+    parts = []
+    if element.text:
+        parts.append(WHITESPACE_RE.sub(' ', element.text))
+    for child in element:
+        _collect_text(child, parts)
+    lines = (line.strip() for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def extract_tags(text, rules=None):
+    """리뷰 텍스트에 포함된 태그 키워드"""
+    return (rules or get_rules()).extract_tags(text)
+
+
+def build_review(item, rules=None):
+    """추출 결과({rating, content, date, reviewer, img_count, raw_text})를 리뷰 데이터로 변환"""
+    return {
+        'content': item.get('content') or '',
+        'rating': item.get('rating') or '',
+        'date': item.get('date') or '',
+        'reviewer': item.get('reviewer') or '',
+        'has_photo': (item.get('img_count') or 0) > 1,
+        'tags': extract_tags(item.get('raw_text') or '', rules),
+    }
+
+
+def _extract_field(field, rules, item, full_text):
+    """필드 규칙 적용: 선택자 → 정규식 → 대체 추출"""
+    for selector in field.selectors:
+        elements = _css(selector)(item)
+        if elements:
+            text = inner_text(elements[0]).strip()
+            if len(text) >= field.selector_min_length:
+                return text
+    value = field.match(full_text)
+    if not value and field.fallback == 'line_filter':
+        value = rules.filter_lines(full_text)
+    return value
+
+
+def extract_items(html, rating_filter=None, rules=None):
+    """리뷰 영역 HTML에서 항목별 원시 필드 추출
+
+    반환: [{rating, content, date, reviewer, img_count, raw_text}, ...]
+          (리뷰 목록이 없으면 None)
+    """
+    rules = rules or get_rules()
+    root = lxml.html.fromstring(html)
+    lists = _css(rules.review_list)(root)
+    if not lists:
+        return None
+
+    results = []
+    for item in _css(rules.review_item)(lists[0]):
+        full_text = inner_text(item).strip()
+        if not full_text or len(full_text) < rules.min_item_text_length:
+            continue
+
+        result = {}
+        for field in rules.fields:
+            value = _extract_field(field, rules, item, full_text)
+            if field.required and (not value or len(value) < field.min_length):
+                break
+            if field.name == 'rating' and rating_filter and int(value) not in rating_filter:
+                break
+            result[field.name] = value or field.default
+        else:
+            result['img_count'] = sum(1 for _ in item.iter('img'))
+            result['raw_text'] = full_text
+            results.append(result)
+    return results
+
+
+def parse_review_html(html, rating_filter=None):
+    """리뷰 영역 HTML을 리뷰 데이터 목록으로 변환 (프로세스 풀에서 실행 가능)"""
+    rules = get_rules()
+    items = extract_items(html, rating_filter, rules)
+    if items is None:
+        return None
+    return [build_review(item, rules) for item in items]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 리뷰 페이지 HTML 파싱")
+    parser.add_argument('files', nargs='+', help="#REVIEW outerHTML 파일")
+    parser.add_argument('--rating', type=int, nargs='*', help="평점 필터 (예: --rating 4 5)")
+    args = parser.parse_args()
+
+    for path in args.files:
+        with open(path, encoding='utf-8') as f:
+            reviews = parse_review_html(f.read(), args.rating or None)
+        print(json.dumps({'file': path, 'reviews': reviews}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""수집 결과 스트리밍 저장
+
+크롤러는 페이지마다 새로 수집한 리뷰를 sink.write_page()로 넘깁니다. 파일 sink는 받은 즉시
+디스크에 추가 기록하고 fsync는 몇 페이지(또는 몇 초)마다 묶어서 수행하므로, 중간에 프로세스가
+죽어도 마지막 동기화 시점까지의 리뷰는 남습니다. 최종 CSV/Excel은 이 스트림에서 만듭니다.
+
+Excel은 openpyxl 쓰기 전용 모드로 한 행씩 바로 기록하므로 리뷰 수와 관계없이 메모리 사용량이
+일정하고, 셀 서식은 열마다 한 번만 만들어 모든 행이 공유합니다.
+"""
+import csv
+import json
+import os
+import time
+
+
+REVIEW_COLUMNS = ['number', 'date', 'rating', 'reviewer', 'content', 'tags', 'has_photo']
+# 일괄 수집 통합 파일의 열 (리뷰마다 제품 URL 추가)
+BATCH_COLUMNS = ['product_url'] + REVIEW_COLUMNS
+
+# Excel 열 제목과 너비
+EXCEL_HEADERS = {
+    'product_url': '제품URL',
+    'number': '번호',
+    'date': '작성일',
+    'rating': '평점',
+    'reviewer': '작성자',
+    'content': '리뷰내용',
+    'tags': '태그',
+    'has_photo': '사진리뷰',
+}
+EXCEL_COLUMN_WIDTHS = {
+    'product_url': 45,
+    'number': 8,
+    'date': 12,
+    'rating': 8,
+    'reviewer': 15,
+    'content': 80,
+    'tags': 30,
+    'has_photo': 10,
+}
+# 가운데 정렬하는 열 (나머지는 위쪽 정렬 + 줄바꿈)
+EXCEL_CENTER_COLUMNS = {'number', 'rating', 'has_photo'}
+EXCEL_SHEET_NAME = '리뷰데이터'
+
+# Parquet 열 타입 (pyarrow 타입 이름)
+PARQUET_TYPES = {
+    'product_url': 'string',
+    'number': 'int64',
+    'date': 'string',
+    'rating': 'string',
+    'reviewer': 'string',
+    'content': 'string',
+    'tags': 'string',
+    'has_photo': 'bool_',
+}
+
+
+class ReviewSink:
+    """리뷰 저장소 인터페이스"""
+
+    def write_page(self, reviews):
+        """한 페이지에서 새로 수집한 리뷰 추가"""
+        raise NotImplementedError
+
+    def flush(self):
+        """버퍼에 남은 내용을 디스크에 동기화"""
+
+    def iter_reviews(self):
+        """기록한 리뷰를 순서대로 다시 읽기 (지원하지 않는 sink는 NotImplementedError)"""
+        raise NotImplementedError
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _FileSink(ReviewSink):
+    """파일에 추가 기록하고 fsync를 묶어서 수행하는 sink"""
+
+    def __init__(self, path, fsync_pages=5, fsync_seconds=2.0, newline=None, encoding='utf-8'):
+        self.path = path
+        self.fsync_pages = fsync_pages
+        self.fsync_seconds = fsync_seconds
+        self.count = 0
+        self._pages_since_sync = 0
+        self._last_sync = time.time()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding=encoding, newline=newline)
+
+    def _write_rows(self, reviews):
+        raise NotImplementedError
+
+    def write_page(self, reviews):
+        if not reviews:
+            return
+        self._write_rows(reviews)
+        self.count += len(reviews)
+        self._file.flush()
+        self._pages_since_sync += 1
+        if (self._pages_since_sync >= self.fsync_pages
+                or time.time() - self._last_sync >= self.fsync_seconds):
+            self.flush()
+
+    def flush(self):
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pages_since_sync = 0
+        self._last_sync = time.time()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class JsonlSink(_FileSink):
+    """리뷰를 한 줄에 하나씩 JSON으로 기록"""
+
+    def _write_rows(self, reviews):
+        self._file.write(''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in reviews))
+
+    def iter_reviews(self):
+        if not self._file.closed:
+            self._file.flush()
+        return iter_jsonl(self.path)
+
+
+class CsvSink(_FileSink):
+    """리뷰를 CSV 행으로 기록 (새 파일이면 헤더 포함, Excel 호환 UTF-8 BOM)"""
+
+    def __init__(self, path, fsync_pages=5, fsync_seconds=2.0):
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        super().__init__(path, fsync_pages, fsync_seconds, newline='',
+                         encoding='utf-8-sig' if is_new else 'utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=REVIEW_COLUMNS, extrasaction='ignore')
+        if is_new:
+            self._writer.writeheader()
+
+    def _write_rows(self, reviews):
+        self._writer.writerows(reviews)
+
+
+class MultiSink(ReviewSink):
+    """여러 sink에 같은 페이지를 기록"""
+
+    def __init__(self, *sinks):
+        self.sinks = list(sinks)
+
+    def write_page(self, reviews):
+        for sink in self.sinks:
+            sink.write_page(reviews)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def iter_reviews(self):
+        for sink in self.sinks:
+            try:
+                return sink.iter_reviews()
+            except NotImplementedError:
+                continue
+        raise NotImplementedError
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+def iter_jsonl(path):
+    """JSONL 파일의 리뷰를 순서대로 반환 (마지막 줄이 잘려 있으면 무시)"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # 기록 도중 종료되어 잘린 마지막 줄
+                continue
+
+
+def write_jsonl(reviews, filename, columns=None):
+    """리뷰 이터러블을 JSONL로 저장 (columns를 주면 해당 키만 그 순서로 기록)"""
+    count = 0
+    with open(filename, 'w', encoding='utf-8') as f:
+        for review in reviews:
+            if columns is not None:
+                review = {column: review.get(column) for column in columns}
+            f.write(json.dumps(review, ensure_ascii=False) + '\n')
+            count += 1
+    return count
+
+
+def write_parquet(reviews, filename, batch_size=5000, columns=REVIEW_COLUMNS):
+    """리뷰 이터러블을 Parquet으로 저장 (batch_size행씩 row group으로 기록, pyarrow 필요)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, getattr(pa, PARQUET_TYPES[column])()) for column in columns])
+
+    def to_batch(rows):
+        return pa.RecordBatch.from_pylist(
+            [{column: row.get(column) for column in columns} for row in rows],
+            schema=schema
+        )
+
+    count = 0
+    with pq.ParquetWriter(filename, schema) as writer:
+        rows = []
+        for review in reviews:
+            rows.append(review)
+            if len(rows) >= batch_size:
+                writer.write_batch(to_batch(rows))
+                count += len(rows)
+                rows = []
+        if rows or not count:
+            writer.write_batch(to_batch(rows))
+            count += len(rows)
+    return count
+
+
+def write_csv(reviews, filename, columns=REVIEW_COLUMNS):
+    """리뷰 이터러블을 CSV로 저장 (한 행씩 기록하므로 메모리 사용량 일정)"""
+    count = 0
+    with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for review in reviews:
+            writer.writerow(review)
+            count += 1
+    return count
+
+
+def _excel_value(column, review):
+    value = review.get(column)
+    if column == 'has_photo':
+        return 'O' if value else 'X'
+    return value
+
+
+def write_excel(reviews, filename, columns=REVIEW_COLUMNS):
+    """리뷰 이터러블을 Excel로 저장 (쓰기 전용 모드로 한 행씩 기록하므로 메모리 사용량 일정)
+
+    셀은 열마다 하나씩 만들어 두고 값만 바꿔 가며 기록하므로, 서식 객체는 행 수와 관계없이
+    열 개수만큼만 생성됩니다.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(EXCEL_SHEET_NAME)
+
+    for idx, column in enumerate(columns, 1):
+        worksheet.column_dimensions[get_column_letter(idx)].width = EXCEL_COLUMN_WIDTHS[column]
+
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    header_alignment = Alignment(horizontal="center", vertical="center")
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    text_alignment = Alignment(vertical='top', wrap_text=True)
+    center_alignment = Alignment(horizontal='center', vertical='center')
+
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, EXCEL_HEADERS[column])
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+        header.append(cell)
+    worksheet.append(header)
+
+    # 열별 서식을 미리 입힌 셀 (append 시점에 바로 기록되므로 행마다 재사용 가능)
+    row_cells = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet)
+        cell.border = thin_border
+        cell.alignment = center_alignment if column in EXCEL_CENTER_COLUMNS else text_alignment
+        row_cells.append(cell)
+
+    count = 0
+    for review in reviews:
+        for column, cell in zip(columns, row_cells):
+            cell.value = _excel_value(column, review)
+        worksheet.append(row_cells)
+        count += 1
+
+    workbook.save(filename)
+    return count
@@ -19,6 +19,13 @@ else
     exit 1
 fi
 
+# 작업자 모드(CRAWL_QUEUE=1)면 크롤링은 별도 작업자 프로세스에서 실행
+if [ "$CRAWL_QUEUE" = "1" ]; then
+    cd /app/api
+    python worker.py --processes "${WORKER_PROCESSES:-1}" &
+    echo "Crawl workers started (PID: $!, processes: ${WORKER_PROCESSES:-1})"
+fi
+
 # Frontend 시작 (포트 10000 - Render가 사용하는 포트)
 cd /app/frontend
 echo "Starting frontend on port 10000..."
@@ -0,0 +1,363 @@
+"""멀티 탭 수집 엔진
+
+크롤링 시간의 대부분은 페이지가 렌더링되기를 기다리는 시간입니다. 이 엔진은 Chrome 하나에서
+제품마다 탭을 열고, 한 탭이 대기 조건(Wait)을 기다리는 동안 다른 탭으로 전환해 진행합니다.
+
+  - 각 제품 수집은 crawl_steps() 제너레이터로, 기다릴 때마다 Wait를 yield하고 결과를 send로 받습니다.
+  - TabEngine은 전용 스레드에서 탭을 돌아가며 대기 조건을 확인하고, 충족된 탭만 다음 단계로 진행합니다.
+  - WebDriver 명령은 한 번에 하나씩만 실행되므로 병렬 실행이 아니라 대기 시간을 겹치는 방식입니다.
+
+드라이버는 build_chrome_options(background_tabs=True)로 실행해야 백그라운드 탭이 느려지지 않습니다.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from bs_crwal import PAGE_BUTTON_JS, SORT_BUTTON_JS, PageWalk, build_chrome_options, create_chrome_driver
+from network_policy import NetworkMeter
+
+
+# 제품 페이지 DOM 준비 (새 탭의 about:blank는 제외)
+DOCUMENT_READY_JS = "return location.href.indexOf('about:blank') !== 0 && document.readyState !== 'loading';"
+
+# arguments[0]의 선택자 중 처음 찾은 보이는 요소를 클릭 (없으면 false, 대기 조건으로 사용)
+CLICK_FIRST_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    if (el && el.offsetParent !== null) {
+        el.scrollIntoView({block: 'center'});
+        el.click();
+        return true;
+    }
+}
+return false;
+"""
+
+# 리뷰 항목(arguments[0] 선택자) 수
+REVIEW_COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# 첫 번째 리뷰 항목(arguments[0] 선택자)의 텍스트
+FIRST_REVIEW_SIGNATURE_JS = """
+var item = document.querySelector(arguments[0]);
+return item ? item.innerText.substring(0, 100) : null;
+"""
+
+# 첫 번째 리뷰 항목(arguments[0] 선택자)이 arguments[1]과 달라졌으면 새 시그니처, 아니면 false
+REVIEW_CHANGED_JS = """
+var item = document.querySelector(arguments[0]);
+var signature = item ? item.innerText.substring(0, 100) : null;
+return signature && signature !== arguments[1] ? signature : false;
+"""
+
+REVIEW_TAB_SELECTOR = "a[href='#REVIEW']"
+
+
+class Wait:
+    """탭이 기다리는 조건 (script 결과가 참이 되거나 waiter의 step 타임아웃까지)"""
+
+    def __init__(self, step, script, *args):
+        self.step = step
+        self.script = script
+        self.args = args
+
+
+def crawl_steps(crawler, max_reviews):
+    """한 제품의 수집 단계 (collect_reviews_by_pagination과 같은 PageWalk 규칙, 대기마다 Wait를 yield)
+
+    crawler.driver는 이 탭으로 전환된 상태에서만 사용됩니다.
+    """
+    driver = crawler.driver
+    rules = crawler.rules
+    item_selector = rules.review_item_selector
+
+    def page_change():
+        """현재 첫 번째 리뷰에서 바뀔 때까지 기다리는 Wait (리뷰가 없으면 None)"""
+        old_signature = driver.execute_script(FIRST_REVIEW_SIGNATURE_JS, item_selector)
+        return Wait('page_change', REVIEW_CHANGED_JS, item_selector, old_signature) if old_signature else None
+
+    def go_to_next_page(walk):
+        """walk의 다음 페이지로 이동 (실패하면 버튼이 남아 있는 동안 다시 시도, 이동했으면 True)"""
+        wait = page_change()
+        while True:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            moved = (yield Wait('pagination', CLICK_FIRST_JS, walk.next_selectors()))
+            if moved and wait:
+                moved = (yield wait)
+            # 대기 시간이 지난 뒤에 바뀐 목록이면 이동한 것 (다시 누르면 '다음' 그룹을 건너뜀)
+            if moved or (wait and driver.execute_script(wait.script, *wait.args)):
+                return True
+            present = driver.execute_script(PAGE_BUTTON_JS, walk.next_selectors(), item_selector)
+            if not walk.navigation_failed(present):
+                return False
+
+    print(f"[2/5] 제품 페이지 로딩 중... {crawler.product_url}")
+    crawler._notify('phase', phase='product')
+    driver.execute_script("window.location.href = arguments[0];", crawler.product_url)
+    yield Wait('page_load', DOCUMENT_READY_JS)
+
+    crawler._notify('phase', phase='review_tab')
+    if (yield Wait('review_tab', CLICK_FIRST_JS, [REVIEW_TAB_SELECTOR])):
+        yield Wait('review_tab', REVIEW_COUNT_JS, item_selector)
+    else:
+        print("⚠️  리뷰 탭 클릭 실패")
+
+    if crawler._should_stop():
+        return
+    print(f"[4/5] 탭에서 리뷰 수집 중... (목표: {max_reviews}개)")
+    crawler._notify('phase', phase='collecting')
+    dedup = crawler.dedup
+    # 평점 필터는 사이트 컨트롤로 먼저 적용 (증분 수집은 최신순이어야 하므로 평점순 정렬 제외)
+    if crawler.rating_pushdown and crawler.rating_filter:
+        wait = page_change()
+        if crawler.click_rating_control(allow_sort=not dedup.tracks_known) and wait:
+            yield wait
+    if dedup.tracks_known:
+        print(f"   🔁 증분 수집: 이미 수집한 리뷰 {dedup.known_size}개")
+        wait = page_change()
+        if driver.execute_script(SORT_BUTTON_JS, rules.review_root, rules.sort_latest_text) and wait:
+            yield wait
+
+    walk = PageWalk(crawler, max_reviews)
+    while True:
+        driver.execute_script("window.scrollTo(0, 1500);")
+        yield Wait('review_list', REVIEW_COUNT_JS, item_selector)
+        pending = crawler.start_page_extraction()
+        network = crawler.page_network
+        # 파싱하는 동안 다음 페이지로 이동 (이 페이지에서 멈추면 한 페이지를 더 연 것뿐)
+        moved = None
+        if not pending.done() and walk.can_advance():
+            moved = (yield from go_to_next_page(walk))
+        if not walk.record(crawler.finish_page_extraction(pending), network):
+            break
+        if moved is None:
+            moved = (yield from go_to_next_page(walk))
+        if not moved:
+            break
+        walk.advance()
+
+    print(f"\n✅ 리뷰 수집 완료 (총 {crawler.collected_count}개)\n")
+    crawler.print_collect_stats()
+
+
+class _Tab:
+    def __init__(self, crawler, max_reviews, future):
+        self.crawler = crawler
+        self.max_reviews = max_reviews
+        self.future = future
+        self.handle = None
+        self.steps = None
+        self.wait = None
+        self.deadline = 0.0
+        self.wait_started = 0.0
+
+
+class TabEngine:
+    """Chrome 하나에서 여러 제품을 탭으로 수집하는 엔진
+
+    submit()으로 넘긴 크롤러는 빈 탭이 생기면 시작하며, 반환된 Future는 수집이 끝나면 완료됩니다.
+    드라이버는 첫 작업에서 실행하고, 오류로 세션이 끊기면 진행 중인 탭을 모두 실패 처리한 뒤 다시 실행합니다.
+    """
+
+    def __init__(self, driver_factory=None, max_tabs=4, poll_interval=0.05):
+        self.driver_factory = driver_factory or (
+            lambda: create_chrome_driver(build_chrome_options(background_tabs=True))
+        )
+        self.max_tabs = max_tabs
+        self.poll_interval = poll_interval
+        self.driver = None
+        self.network_meter = None
+        self._base_handle = None
+        self._jobs = queue.Queue()
+        self._tabs = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+        # 통계
+        self.pending = 0
+        self.opened = 0
+        self.completed = 0
+        self.failed = 0
+        self.switches = 0
+        self.launches = 0
+
+    def submit(self, crawler, max_reviews):
+        """크롤러 수집 예약 (crawler.dedup/sink 설정은 그대로 사용)"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("탭 엔진이 종료되었습니다")
+            self.pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._jobs.put(_Tab(crawler, max_reviews, future))
+        return future
+
+    @property
+    def load(self):
+        """진행 중이거나 대기 중인 작업 수"""
+        with self._lock:
+            return self.pending
+
+    def _ensure_driver(self):
+        if self.driver is None:
+            self.driver = self.driver_factory()
+            self._base_handle = self.driver.current_window_handle
+            self.network_meter = None
+            self.launches += 1
+
+    def _open(self, tab):
+        """새 탭을 열고 첫 대기 조건까지 진행"""
+        self._ensure_driver()
+        self.driver.switch_to.new_window('tab')
+        tab.handle = self.driver.current_window_handle
+        crawler = tab.crawler
+        crawler.driver = self.driver
+        crawler._owns_driver = False
+        # 차단 목록은 탭마다 적용, 요청 집계는 드라이버 하나의 성능 로그를 탭별로 나눠 사용
+        crawler.network_policy.apply(self.driver)
+        if crawler.network_stats:
+            if self.network_meter is None:
+                self.network_meter = NetworkMeter(self.driver)
+            crawler.network_meter = self.network_meter
+            crawler.network_webview = NetworkMeter.webview_id(tab.handle)
+        tab.steps = crawl_steps(tab.crawler, tab.max_reviews)
+        self.opened += 1
+        self._advance(tab, None)
+
+    def _advance(self, tab, value):
+        tab.wait = tab.steps.send(value)
+        tab.wait_started = time.perf_counter()
+        tab.deadline = tab.wait_started + tab.crawler.waiter.timeout_for(tab.wait.step)
+
+    def _poll(self, tab):
+        """탭의 대기 조건 확인, 충족되거나 타임아웃이면 다음 단계로 진행 (진행했으면 True)"""
+        driver = self.driver
+        if driver.current_window_handle != tab.handle:
+            driver.switch_to.window(tab.handle)
+            self.switches += 1
+        wait = tab.wait
+        result = driver.execute_script(wait.script, *wait.args)
+        now = time.perf_counter()
+        if not result and now < tab.deadline:
+            return False
+        tab.crawler.waiter.record(wait.step, now - tab.wait_started, timed_out=not result)
+        self._advance(tab, result or False)
+        return True
+
+    def _finish(self, tab, error=None):
+        with self._lock:
+            self.pending -= 1
+            if error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+        if tab in self._tabs:
+            self._tabs.remove(tab)
+        if tab.handle and self.driver is not None:
+            try:
+                self.driver.switch_to.window(tab.handle)
+                self.driver.close()
+                self.driver.switch_to.window(self._base_handle)
+            except Exception:
+                pass
+        tab.crawler.driver = None
+        if error is None:
+            tab.future.set_result(tab.crawler.collected_count)
+        else:
+            tab.future.set_exception(error)
+
+    def _is_healthy(self):
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _reset_driver(self, error):
+        """세션이 끊긴 드라이버를 종료하고 진행 중인 탭을 모두 실패 처리"""
+        for tab in list(self._tabs):
+            tab.handle = None
+            self._finish(tab, error)
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
+    def _step(self, tab, action):
+        """탭에서 action 실행 (수집이 끝나거나 실패하면 탭을 닫음, 진행했으면 True)"""
+        try:
+            return action(tab) is not False
+        except StopIteration:
+            self._finish(tab)
+        except Exception as e:
+            print(f"   ⚠️  탭 수집 실패 ({tab.crawler.product_url}): {e}")
+            if self.driver is not None and not self._is_healthy():
+                self._reset_driver(e)
+            else:
+                self._finish(tab, e)
+        return True
+
+    def _shutdown(self):
+        error = RuntimeError("탭 엔진이 종료되었습니다")
+        for tab in list(self._tabs):
+            self._finish(tab, error)
+        while True:
+            try:
+                tab = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if tab is not None:
+                self._finish(tab, error)
+
+    def _run(self):
+        while True:
+            # 빈 탭이 있으면 새 작업 시작 (진행 중인 탭이 없으면 작업이 올 때까지 대기)
+            while len(self._tabs) < self.max_tabs:
+                try:
+                    tab = self._jobs.get(block=not self._tabs)
+                except queue.Empty:
+                    break
+                if tab is None:
+                    self._shutdown()
+                    return
+                self._tabs.append(tab)
+                self._step(tab, self._open)
+
+            progressed = False
+            for tab in list(self._tabs):
+                if tab in self._tabs and self._step(tab, self._poll):
+                    progressed = True
+            if not progressed:
+                time.sleep(self.poll_interval)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'max_tabs': self.max_tabs,
+                'open_tabs': len(self._tabs),
+                'pending': self.pending,
+                'opened': self.opened,
+                'completed': self.completed,
+                'failed': self.failed,
+                'switches': self.switches,
+                'launches': self.launches,
+            }
+
+    def close(self):
+        """대기 중인 작업까지 실패 처리하고 드라이버 종료"""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._jobs.put(None)
+            thread.join(timeout=10)
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
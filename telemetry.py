@@ -0,0 +1,258 @@
+"""단계별 소요 시간 측정과 Prometheus 지표
+
+크롤러 단계(드라이버 준비, 제품 페이지, 리뷰 탭, 대기, 추출, 내보내기)를 span()/timed()로 감싸면
+crawler_phase_seconds 히스토그램에 기록됩니다. 지표는 프로세스 안에만 보관하고, render()가
+Prometheus 텍스트 형식(0.0.4)으로 변환하므로 prometheus_client 패키지 없이 /metrics로 노출합니다.
+
+uvicorn 워커가 여러 개면 워커마다 따로 집계되므로, 워커별로 수집하거나 --workers 1로 실행하세요.
+"""
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+
+# 초 단위 기본 버킷 (페이지 대기 수십 ms ~ 긴 수집 수 분)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class _Metric:
+    """레이블별 값을 보관하는 지표 (스레드 안전)"""
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블은 {self.labelnames}이어야 합니다 (받은 값: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self):
+        raise NotImplementedError
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for suffix, label_values, extra, value in self._samples():
+            labels = _format_labels(self.labelnames, label_values, extra)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """증가만 하는 값 (예: 수집한 리뷰 수), 이름에는 _total이 붙음"""
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        if not name.endswith('_total'):
+            name += '_total'
+        super().__init__(name, documentation, labelnames)
+
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError("Counter는 줄일 수 없습니다")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [('', key, None, value) for key, value in items]
+
+
+class Gauge(_Metric):
+    """현재 값 (예: 실행 중인 브라우저 수), set_function으로 조회 시점에 계산할 수도 있음"""
+    type = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._functions = {}
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, fn, **labels):
+        """조회할 때마다 fn()으로 값 계산"""
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = fn
+
+    def _samples(self):
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, fn in functions.items():
+            try:
+                values[key] = fn()
+            except Exception:
+                continue
+        return [('', key, None, value) for key, value in sorted(values.items()) if value is not None]
+
+
+class Histogram(_Metric):
+    """관측값 분포 (버킷별 누적 개수, 합계, 개수)"""
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels):
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def totals(self):
+        """레이블 값별 (합계, 개수) (벤치마크에서 구간 전후 차이를 계산할 때 사용)"""
+        with self._lock:
+            return {key: (state[1], state[2]) for key, state in self._values.items()}
+
+    def _samples(self):
+        with self._lock:
+            items = sorted((key, ([*state[0]], state[1], state[2])) for key, state in self._values.items())
+        samples = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                samples.append(('_bucket', key, ('le', _format_value(float(bound))), cumulative))
+            samples.append(('_sum', key, None, total))
+            samples.append(('_count', key, None, count))
+        return samples
+
+
+class Registry:
+    """지표 모음 (이름이 같으면 이미 만든 지표를 반환)"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        if cls is Counter and not name.endswith('_total'):
+            name += '_total'
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name}은(는) 이미 {metric.type}(으)로 등록되어 있습니다")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self):
+        """Prometheus 텍스트 형식"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+# 프로세스 전체에서 공유하는 기본 지표 모음
+registry = Registry()
+
+PHASE_SECONDS = registry.histogram(
+    'crawler_phase_seconds', '크롤러 단계별 소요 시간 (초)', ['phase'])
+WAIT_SECONDS = registry.histogram(
+    'crawler_wait_seconds', '단계별 DOM 대기 시간 (초, 타임아웃 포함)', ['step'])
+WAIT_TIMEOUTS = registry.counter(
+    'crawler_wait_timeouts', '단계별 DOM 대기 타임아웃 횟수', ['step'])
+PAGE_SECONDS = registry.histogram(
+    'crawler_page_seconds', '리뷰 페이지 하나를 처리하는 데 걸린 시간 (초, 이동 + 대기 + 추출)',
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0))
+PAGES = registry.counter('crawler_pages', '처리한 리뷰 페이지 수')
+REVIEWS = registry.counter('crawler_reviews', '새로 수집한 리뷰 수')
+DRIVER_LAUNCH_SECONDS = registry.histogram(
+    'crawler_driver_launch_seconds', 'Chrome 드라이버 실행 시간 (초)',
+    buckets=(0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0, 60.0))
+QUEUE_WAIT_SECONDS = registry.histogram(
+    'crawler_queue_wait_seconds', '작업이 스케줄러 대기열에서 기다린 시간 (초)')
+TASKS = registry.counter('crawler_tasks', '끝난 작업 수 (상태별)', ['status'])
+TASK_SECONDS = registry.histogram('crawler_task_seconds', '작업 실행 시간 (초, 대기열 제외)')
+TASK_REVIEWS_PER_SECOND = registry.histogram(
+    'crawler_task_reviews_per_second', '작업별 수집 속도 (리뷰/초)',
+    buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0))
+BROWSERS = registry.gauge('crawler_browsers', '실행 중인 Chrome 수 (idle, in_use, tabs)', ['state'])
+SCHEDULED_TASKS = registry.gauge('crawler_scheduled_tasks', '스케줄러의 작업 수 (running, queued)', ['state'])
+
+
+@contextmanager
+def span(phase):
+    """with 블록의 소요 시간을 crawler_phase_seconds{phase=...}에 기록 (예외가 나도 기록)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASE_SECONDS.observe(time.perf_counter() - start, phase=phase)
+
+
+def timed(phase):
+    """함수 실행 시간을 span(phase)로 기록하는 데코레이터"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(phase):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
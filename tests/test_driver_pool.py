@@ -0,0 +1,96 @@
+"""DriverPool: 실행 중인 드라이버는 max_size개까지, 가득 차면 반납을 기다림"""
+import threading
+import time
+
+import pytest
+
+from services.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+
+    def execute_script(self, script):
+        return 1 if self.alive else None
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.alive = False
+
+
+def make_pool(**kwargs):
+    launched = []
+
+    def factory():
+        time.sleep(0.01)
+        driver = FakeDriver()
+        launched.append(driver)
+        return driver
+
+    return DriverPool(factory=factory, **kwargs), launched
+
+
+def test_concurrent_checkouts_never_exceed_max_size():
+    pool, launched = make_pool(size=1, max_size=2)
+    live = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def crawl():
+        driver = pool.checkout()
+        with lock:
+            live.append(driver)
+            peak[0] = max(peak[0], len(live))
+        time.sleep(0.05)
+        with lock:
+            live.remove(driver)
+        pool.checkin(driver)
+
+    threads = [threading.Thread(target=crawl) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert peak[0] == 2
+    # 유휴 자리(size)를 넘는 반납분은 종료되므로 남은 드라이버도 max_size 이하
+    assert sum(driver.alive for driver in launched) <= 2
+    stats = pool.stats()
+    assert stats['max_size'] == 2 and stats['waits'] > 0 and stats['in_use'] == 0
+
+
+def test_checkout_times_out_when_full():
+    pool, _ = make_pool(size=1, max_size=1, checkout_timeout=0.2)
+    driver = pool.checkout()
+    with pytest.raises(TimeoutError):
+        pool.checkout()
+    pool.checkin(driver)
+    assert pool.checkout() is driver
+
+
+def test_discarded_driver_frees_slot():
+    pool, launched = make_pool(size=1, max_size=1, checkout_timeout=2)
+    driver = pool.checkout()
+    threading.Timer(0.1, pool.checkin, args=(driver,), kwargs={'discard': True}).start()
+    replacement = pool.checkout()
+    assert replacement is not driver and len(launched) == 2
+
+
+def test_failed_launch_frees_slot():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError('chrome crashed')
+        return FakeDriver()
+
+    pool = DriverPool(factory=factory, size=1, max_size=1, checkout_timeout=1)
+    with pytest.raises(RuntimeError):
+        pool.checkout()
+    assert pool.checkout() is not None
@@ -0,0 +1,44 @@
+"""PageWalk: 목록 끝(reached_end)은 다음 페이지 버튼이 없을 때만 판단"""
+from bs_crwal import NaverSmartStoreReviewCrawler, PageWalk
+
+
+def review(i):
+    return {'rating': 5, 'content': f'리뷰 {i}', 'date': '24.03.15', 'reviewer': 'abcd****'}
+
+
+def make_walk():
+    crawler = NaverSmartStoreReviewCrawler('https://smartstore.naver.com/store/products/1')
+    return crawler, PageWalk(crawler, max_reviews=1000)
+
+
+def test_missing_button_reaches_end():
+    crawler, walk = make_walk()
+    assert walk.record([review(1)])
+    assert walk.navigation_failed(False) is False
+    assert crawler.reached_end
+    assert crawler.collected_all(1000)
+
+
+def test_click_timeouts_retry_then_stop_without_reaching_end():
+    crawler, walk = make_walk()
+    assert walk.record([review(1)])
+    # 버튼이 남아 있거나(True) 확인할 수 없으면(None) 같은 페이지로 다시 시도
+    assert walk.navigation_failed(True)
+    assert walk.navigation_failed(None)
+    assert walk.navigation_failed(True) is False
+    assert walk.page == 1
+    assert not crawler.reached_end
+    assert not crawler.collected_all(1000)
+
+
+def test_click_failures_are_counted_apart_from_empty_pages():
+    crawler, walk = make_walk()
+    for page in range(4):
+        assert walk.record([])
+        assert walk.navigation_failed(True)
+        walk.advance()
+    # 이동에 성공하면 클릭 실패 횟수는 초기화되고, 빈 페이지는 5번째에서 종료
+    assert walk.click_failures == 0
+    assert walk.failures == 4
+    assert walk.record([]) is False
+    assert not crawler.reached_end
@@ -0,0 +1,228 @@
+"""ReviewApiClient를 로컬 리뷰 API 대역 서버(ThreadingHTTPServer)로 검증
+
+대역 서버는 /reviews/query-pages에 page/pageSize(GET 쿼리 또는 POST JSON 본문)로 리뷰 JSON을 돌려주며,
+totalPages를 빼거나 지정한 요청을 실패시켜 페이지 끝/빈 응답/오류 처리를 확인합니다.
+"""
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import pytest
+
+from review_api import ReviewApiClient, ReviewEndpoint, review_from_api
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = 'ReviewApiStandIn'
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        self._respond(parts.path, dict(parse_qsl(parts.query)))
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self._respond(urlsplit(self.path).path, json.loads(self.rfile.read(length) or b'{}'))
+
+    def _respond(self, path, params):
+        api = self.server.api
+        page = int(params.get('page', 1))
+        page_size = int(params.get('pageSize', api.page_size))
+        with api.lock:
+            api.requests.append((self.command, page, page_size))
+            failures = api.failures.get(page, 0)
+            if failures:
+                api.failures[page] = failures - 1
+        if path != '/reviews/query-pages':
+            return self._send(404, {'error': 'not found'})
+        if failures:
+            return self._send(500, {'error': 'temporary failure'})
+
+        start = (page - 1) * page_size
+        contents = [
+            {
+                'id': i,
+                'reviewScore': 5 - i % 5,
+                'reviewContent': f'리뷰 {i} 배송이 빨라요',
+                'createDate': '2024-03-15T10:00:00',
+                'writerMemberMaskedId': f'user{i}***',
+                'reviewAttaches': [{'url': f'/photo/{i}.jpg'}] if i % 3 == 0 else [],
+            }
+            for i in range(start, min(start + page_size, api.reviews))
+        ]
+        payload = {'contents': contents, 'page': page}
+        if api.report_total:
+            payload['totalPages'] = -(-api.reviews // page_size)
+        self._send(200, payload)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInApi:
+    """리뷰 API 대역 서버 (with 문으로 시작/종료)
+
+    reviews: 전체 리뷰 수, page_size: 요청에 pageSize가 없을 때 페이지당 리뷰 수
+    report_total: False면 totalPages를 주지 않음 (빈 페이지가 나올 때까지 요청)
+    failures: {페이지: 실패 횟수} 그 페이지 요청을 지정한 횟수만큼 500으로 응답
+    """
+
+    def __init__(self, reviews=60, page_size=20, report_total=True, failures=None):
+        self.reviews = reviews
+        self.page_size = page_size
+        self.report_total = report_total
+        self.failures = dict(failures or {})
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        self.server.daemon_threads = True
+        self.server.api = self
+
+    def url(self, path='/reviews/query-pages', **query):
+        host, port = self.server.server_address[:2]
+        query_string = '&'.join(f'{key}={value}' for key, value in query.items())
+        return f"http://{host}:{port}{path}" + (f"?{query_string}" if query_string else '')
+
+    def pages_requested(self):
+        return sorted(page for _, page, _ in self.requests)
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def fetch(endpoint, max_reviews, **kwargs):
+    return fetch_with_client(endpoint, max_reviews, **kwargs)[0]
+
+
+def fetch_with_client(endpoint, max_reviews, **kwargs):
+    client_options = {key: kwargs.pop(key) for key in ('concurrency', 'retries') if key in kwargs}
+    client = ReviewApiClient(endpoint, **client_options)
+    return asyncio.run(client.fetch_reviews(max_reviews, **kwargs)), client
+
+
+def test_pages_to_last_page():
+    """totalPages까지만 요청하고 페이지 순서대로 반환"""
+    with StandInApi(reviews=60) as api:
+        pages, client = fetch_with_client(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=1000)
+    assert [len(items) for items in pages] == [20, 20, 20]
+    assert [item['id'] for items in pages for item in items] == list(range(60))
+    assert api.pages_requested() == [1, 2, 3]
+    assert client.reached_end
+
+
+def test_stops_at_max_reviews():
+    with StandInApi(reviews=200) as api:
+        pages, client = fetch_with_client(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=45, concurrency=2)
+    assert sum(len(items) for items in pages) >= 45
+    assert api.pages_requested() == [1, 2, 3]
+    assert not client.reached_end
+
+
+def test_page_size_is_forwarded():
+    """page_size를 지정하면 캡처한 요청의 pageSize를 바꿔 요청 (GET 쿼리, POST 본문 모두)"""
+    with StandInApi(reviews=95) as api:
+        pages = fetch(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=1000, page_size=50)
+        assert [len(items) for items in pages] == [50, 45]
+        assert {size for _, _, size in api.requests} == {50}
+
+    with StandInApi(reviews=95) as api:
+        endpoint = ReviewEndpoint(api.url(), method='POST', body={'page': 1, 'pageSize': 20, 'sort': 'REVIEW_RANKING'})
+        pages = fetch(endpoint, max_reviews=1000, page_size=30)
+        assert [len(items) for items in pages] == [30, 30, 30, 5]
+        assert {(method, size) for method, _, size in api.requests} == {('POST', 30)}
+
+
+def test_empty_page_ends_without_total():
+    """totalPages가 없으면 빈 페이지를 받을 때까지 요청하고 빈 페이지 뒤로는 반환하지 않음"""
+    with StandInApi(reviews=50, report_total=False) as api:
+        pages, client = fetch_with_client(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=1000, concurrency=4)
+    assert [len(items) for items in pages] == [20, 20, 10, 0]
+    assert client.reached_end
+
+
+def test_no_reviews():
+    with StandInApi(reviews=0, report_total=False) as api:
+        pages = fetch(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=100)
+    assert pages == [[]]
+    assert api.pages_requested() == [1]
+
+
+def test_retries_transient_errors():
+    with StandInApi(reviews=60, failures={2: 1}) as api:
+        pages = fetch(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=1000, retries=2)
+    assert [len(items) for items in pages] == [20, 20, 20]
+    assert api.pages_requested() == [1, 2, 2, 3]
+
+
+def test_raises_after_retries():
+    with StandInApi(reviews=60, failures={1: 5}) as api:
+        with pytest.raises(httpx.HTTPStatusError):
+            fetch(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=100, retries=1)
+    assert api.pages_requested() == [1, 1]
+
+    with StandInApi() as api:
+        with pytest.raises(httpx.HTTPStatusError):
+            fetch(ReviewEndpoint(api.url('/missing', page=1)), max_reviews=100, retries=0)
+
+
+def test_review_from_api():
+    with StandInApi(reviews=3) as api:
+        pages = fetch(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=100)
+    reviews = [review_from_api(item) for item in pages[0]]
+    assert reviews[0] == {
+        'content': '리뷰 0 배송이 빨라요',
+        'rating': '5',
+        'date': '24.03.15',
+        'reviewer': 'user0***',
+        'has_photo': True,
+        'tags': '배송',
+    }
+    assert [review['has_photo'] for review in reviews] == [True, False, False]
+
+
+def test_should_stop_ends_paging():
+    """should_stop이 참이 되면 다음 페이지 묶음을 요청하지 않음 (취소/제한 시간)"""
+    checks = []
+
+    def should_stop():
+        checks.append(True)
+        return len(checks) > 1
+
+    with StandInApi(reviews=200) as api:
+        pages, client = fetch_with_client(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=1000,
+                                          concurrency=2, should_stop=should_stop)
+    assert [len(items) for items in pages] == [20, 20, 20]
+    assert api.pages_requested() == [1, 2, 3]
+    assert not client.reached_end
+
+
+def test_on_page_streams_pages_in_order():
+    """on_page를 지정하면 앞 페이지까지 받은 페이지를 바로 넘기고 목록은 쌓지 않음"""
+    seen = []
+    with StandInApi(reviews=100) as api:
+        def on_page(items):
+            seen.append(([item['id'] for item in items], api.pages_requested()))
+
+        pages, client = fetch_with_client(ReviewEndpoint(api.url(page=1, pageSize=20)), max_reviews=1000,
+                                          concurrency=2, on_page=on_page)
+    assert pages == []
+    assert [ids for ids, _ in seen] == [list(range(start, start + 20)) for start in range(0, 100, 20)]
+    # 첫 페이지는 다음 묶음을 요청하기 전에, 두 번째 페이지는 그다음 묶음을 요청하기 전에 넘김
+    assert seen[0][1] == [1]
+    assert 4 not in seen[1][1]
+    assert client.reached_end
@@ -0,0 +1,52 @@
+"""BloomFilter: count는 비트를 새로 설정한 키만 세고 파일 저장 후에도 유지, 동시에 저장해도 키를 잃지 않음"""
+import os
+import threading
+
+from review_dedup import BloomFilter, review_hash
+
+REVIEW = {'date': '24.03.15', 'reviewer': 'abcd****', 'content': '배송이 빨라요'}
+
+
+def test_readding_key_does_not_increase_count():
+    bloom = BloomFilter.for_capacity(1000)
+    h = review_hash(REVIEW)
+    bloom.add(h)
+    bloom.add(h)
+    assert bloom.count == 1
+    assert h in bloom
+
+
+def test_count_matches_distinct_keys(tmp_path):
+    bloom = BloomFilter.open(str(tmp_path), 'products/1234', capacity=1000)
+    hashes = [review_hash({**REVIEW, 'content': f'리뷰 {i}'}) for i in range(200)]
+    for h in hashes + hashes[:50]:
+        bloom.add(h)
+    # 오탐으로 이미 설정된 비트만 가리키는 키는 세지 않으므로 구분되는 키 수 이하
+    assert 195 <= bloom.count <= 200
+    expected_rate = bloom.false_positive_rate()
+    bloom.save()
+
+    reopened = BloomFilter.open(str(tmp_path), 'products/1234')
+    assert reopened.count == bloom.count
+    assert reopened.false_positive_rate() == expected_rate
+    assert all(h in reopened for h in hashes)
+
+
+def test_concurrent_saves_keep_every_key(tmp_path):
+    """같은 제품의 필터를 여러 스레드가 저장해도 서로 추가한 키를 잃지 않음"""
+    blooms = [BloomFilter.open(str(tmp_path), 'products/1234', capacity=1000) for _ in range(4)]
+    hashes = [[review_hash({**REVIEW, 'content': f'리뷰 {n}-{i}'}) for i in range(50)] for n in range(4)]
+    for bloom, keys in zip(blooms, hashes):
+        for h in keys:
+            bloom.add(h)
+
+    threads = [threading.Thread(target=bloom.save) for bloom in blooms for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reopened = BloomFilter.open(str(tmp_path), 'products/1234')
+    assert all(h in reopened for keys in hashes for h in keys)
+    assert 190 <= reopened.count <= 210
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
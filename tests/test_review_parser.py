@@ -0,0 +1,119 @@
+"""review_parser를 저장해 둔 #REVIEW HTML로 검증
+
+fixtures/review_page.html은 리뷰 목록 구조(본문 선택자 3종, 대체 줄 필터, 사진 리뷰, 본문 없는 리뷰)를
+담은 #REVIEW 영역입니다. 기존 Selenium 경로(item.text + find_element)의 추출 규칙을 같은 HTML에
+그대로 적용한 결과와 필드별로 비교합니다.
+"""
+import os
+import re
+
+import lxml.html
+import pytest
+
+from review_parser import inner_text, parse_review_html
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'review_page.html')
+
+FIELDS = ('rating', 'date', 'reviewer', 'content', 'has_photo', 'tags')
+
+
+@pytest.fixture(scope='module')
+def html():
+    with open(FIXTURE, encoding='utf-8') as f:
+        return f.read()
+
+
+def legacy_extract(html, rating_filter=None):
+    """기존 Selenium 경로의 리뷰 추출 (element.text 대신 inner_text, find_element 대신 cssselect)"""
+    root = lxml.html.fromstring(html)
+    reviews = []
+    for item in root.cssselect("div.JHZoCyHfg7 div.HTT4L8U0CU ul")[0].cssselect("li"):
+        full_text = inner_text(item).strip()
+        if not full_text or len(full_text) < 5:
+            continue
+        review = {'content': '', 'rating': '', 'date': '', 'reviewer': '', 'has_photo': False, 'tags': ''}
+
+        match = re.search(r'평점\s*(\d+)', full_text)
+        if match:
+            review['rating'] = match.group(1)
+        if rating_filter and (not review['rating'] or int(review['rating']) not in rating_filter):
+            continue
+
+        for selector in ("div.HakaEZ240l", "div.O2M37e85_1 div.HakaEZ240l", "div.IwcuBUIAKf div[class*='HakaEZ']"):
+            elements = item.cssselect(selector)
+            text = inner_text(elements[0]).strip() if elements else ''
+            if len(text) > 3:
+                review['content'] = text
+                break
+        else:
+            lines = [
+                line.strip() for line in full_text.split('\n')
+                if len(line.strip()) > 5
+                and not re.match(r'^평점\d+$', line.strip())
+                and not re.match(r'^\d{2}\.\d{2}\.\d{2}$', line.strip())
+                and '신고' not in line
+                and not re.match(r'^[a-z0-9*]+$', line.strip())
+            ]
+            review['content'] = ' '.join(lines)
+        if len(review['content']) < 3:
+            continue
+
+        match = re.search(r'(\d{2}\.\d{2}\.\d{2})', full_text)
+        if match:
+            review['date'] = match.group(1)
+        match = re.search(r'([a-z0-9*]+)\s*\d{2}\.\d{2}\.\d{2}', full_text)
+        if match:
+            review['reviewer'] = match.group(1)
+        keywords = ['유통기한', '포장', '편리', '배송', '한달사용', '재구매', '가성비']
+        review['tags'] = ', '.join(keyword for keyword in keywords if keyword in full_text)
+        review['has_photo'] = len(list(item.iter('img'))) > 1
+        reviews.append(review)
+    return reviews
+
+
+@pytest.mark.parametrize('rating_filter', [None, [4, 5], [1, 2, 3]])
+def test_matches_legacy_extraction(html, rating_filter):
+    parsed = parse_review_html(html, rating_filter)
+    expected = legacy_extract(html, rating_filter)
+    assert [{field: review[field] for field in FIELDS} for review in parsed] == expected
+
+
+def test_fields(html):
+    reviews = parse_review_html(html)
+    assert [review['rating'] for review in reviews] == ['5', '4', '1', '2']
+    assert reviews[0] == {
+        'content': '배송이 빠르고 포장이 꼼꼼해요. 재구매 의사 있습니다',
+        'rating': '5',
+        'date': '24.03.15',
+        'reviewer': 'abcd****',
+        'has_photo': False,
+        'tags': '포장, 배송, 재구매',
+    }
+
+
+def test_photo_review(html):
+    """프로필 사진 외에 사진이 있으면 사진 리뷰, 본문의 줄바꿈(<br>)은 유지"""
+    photo = parse_review_html(html)[1]
+    assert photo['has_photo'] is True
+    assert photo['content'] == '사진처럼 색감이 예뻐요\n가성비 좋습니다'
+    assert [review['has_photo'] for review in parse_review_html(html)] == [False, True, False, False]
+
+
+def test_review_without_text_is_skipped(html):
+    """본문이 없는 리뷰(평점/작성자/날짜만)는 결과에 없음"""
+    reviews = parse_review_html(html)
+    assert 'zx12****' not in [review['reviewer'] for review in reviews]
+    assert not parse_review_html(html, [3])
+
+
+def test_content_selectors_and_fallback(html):
+    """본문은 선택자 순서대로 찾고, 모두 없으면 작성자/평점/날짜/신고 줄을 뺀 나머지 줄을 사용"""
+    by_rating = {review['rating']: review for review in parse_review_html(html)}
+    assert by_rating['1']['content'] == '유통기한이 너무 짧게 남은 제품이 왔어요'
+    assert by_rating['2']['content'] == 'kk77**** 24.02.11 한달사용 후기인데 효과는 잘 모르겠네요'
+    assert by_rating['2']['tags'] == '한달사용'
+
+
+def test_no_review_list():
+    assert parse_review_html('<div id="REVIEW"><p>리뷰가 없습니다</p></div>') is None
@@ -0,0 +1,84 @@
+"""CrawlScheduler.reserve: 샤드용 추가 브라우저 슬롯은 빈 슬롯과 여유 메모리만큼만 예약"""
+import asyncio
+import threading
+
+from services.scheduler import CrawlScheduler
+
+
+def test_reserve_caps_at_free_slots():
+    scheduler = CrawlScheduler(max_concurrent=3, memory_probe=lambda: None)
+    # 대기열을 거치지 않은 작업 (작업자 프로세스)은 자기 슬롯 하나를 쓰는 것으로 계산
+    assert scheduler.reserve('a', 4) == 2
+    assert scheduler.reserve('b', 1) == 0
+    assert scheduler.stats()['reserved'] == 2
+    scheduler.release('a')
+    assert scheduler.stats()['reserved'] == 0
+    scheduler.shutdown()
+
+
+def test_reserve_needs_free_memory():
+    scheduler = CrawlScheduler(max_concurrent=4, min_free_memory_mb=400, memory_probe=lambda: 100)
+    assert scheduler.reserve('a', 2) == 0
+    scheduler.shutdown()
+
+
+def test_reserved_slots_hold_back_queue():
+    """예약한 슬롯은 대기 중인 작업 시작에 포함되고, 반납하면 대기 작업이 시작됨"""
+    async def main():
+        scheduler = CrawlScheduler(max_concurrent=2, memory_probe=lambda: None)
+        reserved = threading.Event()
+        release = threading.Event()
+
+        def sharded():
+            if scheduler.reserve('sharded', 1):
+                reserved.set()
+            release.wait(5)
+            scheduler.release('sharded')
+            return True
+
+        first = scheduler.submit('sharded', 10, sharded)
+        await asyncio.to_thread(reserved.wait, 5)
+        assert reserved.is_set()
+        second = scheduler.submit('next', 10, lambda: True)
+        await asyncio.sleep(0.1)
+        assert scheduler.stats()['queued'] == 1
+        release.set()
+        assert await asyncio.wait_for(first, 5) is True
+        assert await asyncio.wait_for(second, 5) is True
+        scheduler.shutdown()
+
+    asyncio.run(main())
+
+
+def test_queue_info_counts_reserved_slots():
+    """샤드가 예약한 슬롯은 대기 작업의 예상 시작 시각에 포함"""
+    async def main():
+        scheduler = CrawlScheduler(max_concurrent=3, memory_probe=lambda: None)
+        scheduler.overhead_seconds = 0
+        scheduler.seconds_per_review = 1.0
+        release = threading.Event()
+        reserved = threading.Event()
+
+        def sharded():
+            if scheduler.reserve('sharded', 1) == 1:
+                reserved.set()
+            release.wait(5)
+            scheduler.release('sharded')
+            return True
+
+        first = scheduler.submit('sharded', 100, sharded)
+        await asyncio.to_thread(reserved.wait, 5)
+        second = scheduler.submit('second', 50, lambda: release.wait(5))
+        waiting = scheduler.submit('waiting', 10, lambda: True)
+        await asyncio.sleep(0.05)
+
+        info = scheduler.get_queue_info('waiting')
+        assert info['queue_position'] == 1
+        # 슬롯 3개가 모두 찼으므로 가장 먼저 끝나는 'second'(약 50초)를 기다림
+        assert 45 <= info['estimated_wait_seconds'] <= 50
+
+        release.set()
+        await asyncio.wait_for(asyncio.gather(first, second, waiting), 5)
+        scheduler.shutdown()
+
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""TaskStore.find_cached_result: 전체 결과(exhaustive)로 기록된 작업만 개수와 관계없이 캐시로 사용"""
+from datetime import datetime
+
+import pytest
+
+from models.schemas import TaskStatusEnum
+from services.task_store import CrawlerTask, TaskStore
+
+URL = 'https://brand.naver.com/store/products/1234'
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TaskStore(str(tmp_path / 'tasks.db'))
+    yield store
+    store.close()
+
+
+def finished_task(store, task_id, reviews, max_reviews=100, rating_filter=None,
+                  status=TaskStatusEnum.COMPLETED, exhaustive=False):
+    task = CrawlerTask(task_id, URL, rating_filter, max_reviews)
+    store.add(task)
+    sink = store.review_sink(task_id)
+    sink.write_page([
+        {'number': i + 1, 'date': '24.03.15', 'rating': str(rating), 'reviewer': f'user{i}',
+         'content': f'리뷰 {i}', 'tags': '', 'has_photo': False}
+        for i, rating in enumerate(reviews)
+    ])
+    sink.close()
+    task.status = status
+    task.collected_count = len(reviews)
+    task.finished_at = datetime.now()
+    task.exhaustive = exhaustive
+    store.save(task)
+    return task
+
+
+def test_exhaustive_result_serves_larger_request(store):
+    finished_task(store, 'full', [5, 4, 3] * 10, exhaustive=True)
+    assert store.find_cached_result('products/1234', None, 500, 3600) == 'full'
+    assert store.find_cached_result('products/1234', [4, 5], 500, 3600) == 'full'
+
+
+def test_short_result_without_flag_is_not_exhaustive(store):
+    """목표보다 적게 수집했더라도 끝까지 수집했다는 기록이 없으면 (중단, 연속 실패 등) 더 큰 요청에 쓰지 않음"""
+    finished_task(store, 'partial', [5, 4, 3] * 10)
+    assert store.find_cached_result('products/1234', None, 500, 3600) is None
+    # 요청한 개수만큼 남으면 사용
+    assert store.find_cached_result('products/1234', None, 30, 3600) == 'partial'
+    assert store.find_cached_result('products/1234', [5], 10, 3600) == 'partial'
+    assert store.find_cached_result('products/1234', [5], 11, 3600) is None
+
+
+def test_cancelled_result_is_never_cached(store):
+    finished_task(store, 'cancelled', [5] * 10, status=TaskStatusEnum.CANCELLED)
+    assert store.find_cached_result('products/1234', None, 5, 3600) is None
+
+
+def test_exhaustive_flag_survives_reload(store, tmp_path):
+    finished_task(store, 'full', [5, 4], exhaustive=True)
+    other = TaskStore(str(tmp_path / 'tasks.db'))
+    try:
+        assert other.get('full').exhaustive
+        assert other.find_cached_result('products/1234', None, 500, 3600) == 'full'
+    finally:
+        other.close()
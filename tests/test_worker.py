@@ -0,0 +1,65 @@
+"""CrawlWorker: stop() 뒤에도 실행 중인 작업이 끝날 때까지 heartbeat를 유지해 다른 작업자가 가져가지 않음"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from models.schemas import TaskStatusEnum
+from services.task_store import CrawlerTask, TaskStore
+from worker import CrawlWorker
+
+URL = 'https://brand.naver.com/store/products/1234'
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TaskStore(str(tmp_path / 'tasks.db'))
+    yield store
+    store.close()
+
+
+class FakeService:
+    """release가 설정될 때까지 크롤링하는 것처럼 막혀 있는 CrawlerService 대역"""
+
+    def __init__(self, store):
+        self.store = store
+        self.tab_engines = []
+        self.driver_pool = SimpleNamespace(warm=lambda: None)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def _run_sync_crawler(self, task):
+        self.started.set()
+        self.release.wait(10)
+        task.status = TaskStatusEnum.COMPLETED
+        self.store.save(task)
+        return True
+
+    def stop_running(self, task_id, reason):
+        pass
+
+    def shutdown(self):
+        pass
+
+
+def test_stop_mid_job_keeps_job_from_being_requeued(store):
+    store.enqueue_job(CrawlerTask('job', URL, None, 100))
+    service = FakeService(store)
+    worker = CrawlWorker(service, poll_interval=0.01, heartbeat_interval=0.05, heartbeat_timeout=0.3,
+                         min_free_memory_mb=0)
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+    try:
+        assert service.started.wait(5)
+        worker.stop()
+        # heartbeat_timeout보다 오래 실행되는 동안에도 heartbeat가 계속 기록됨
+        time.sleep(0.6)
+        assert store.requeue_stale_jobs(0.3) == (0, 0)
+        assert store.job_status('job') == 'running'
+    finally:
+        service.release.set()
+        thread.join(5)
+    assert not thread.is_alive()
+    assert store.job_status('job') is None
+    assert worker.completed == 1